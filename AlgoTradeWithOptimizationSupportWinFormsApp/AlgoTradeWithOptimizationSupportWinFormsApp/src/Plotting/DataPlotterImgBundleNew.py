@@ -4,10 +4,20 @@ Provides synchronized pan/zoom/crosshair across all panels.
 """
 
 from enum import Enum, auto
+from collections import deque
+import json
+import logging
+import sys
+import time
 from typing import Any, Dict, List, Tuple, Optional, Callable
 import numpy as np
-from imgui_bundle import imgui, implot, immapp, ImVec2
-from dataclasses import dataclass
+from imgui_bundle import imgui, implot, immapp, hello_imgui, ImVec2
+from dataclasses import dataclass, field
+
+# Diagnostics go through this logger; silent unless the host configures logging
+# (e.g. logging.getLogger("DataPlotterImgBundleNew").setLevel(logging.DEBUG) + a handler)
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 class DataType(Enum):
@@ -22,6 +32,29 @@ class DataType(Enum):
     Stairs = auto()         # Step/stairs line (trade signal states: -1, 0, 1)
     PnL = auto()            # Profit/Loss line
     Balance = auto()        # Balance line
+    EquityOverlay = auto()  # Many equity curves (runs x bars): percentile bands or density + top-K
+
+
+class LODMode(Enum):
+    """Downsampling scheme used for line-like series (Line, PnL, Balance, Bands)."""
+    MinMax = auto()         # Min and max per bucket (~2 buckets per pixel)
+    M4 = auto()             # First, min, max, last per pixel column (pixel-perfect)
+
+
+# Storage dtype per array role (DataPlotterImgBundleNew.setStorageDtypes):
+#   price  - OHLC arrays          series - panel value series (Line/Bands/Volume/...)
+#   signal - trade signal arrays  volume - shared volume / lot arrays
+# Only the small LOD outputs are converted to float64 for ImPlot, so a compact
+# storage mode halves memory without changing what is drawn.
+STORAGE_DTYPES_FLOAT64: Dict[str, Any] = {
+    "price": np.float64, "series": np.float64, "signal": np.float64, "volume": np.float64,
+}
+STORAGE_DTYPES_COMPACT: Dict[str, Any] = {
+    "price": np.float32, "series": np.float32, "signal": np.int8, "volume": np.int64,
+}
+STORAGE_MODES: Dict[str, Dict[str, Any]] = {"float64": STORAGE_DTYPES_FLOAT64, "compact": STORAGE_DTYPES_COMPACT}
+# Storage role of Panel.setData items (others use "series")
+_ITEM_STORAGE_ROLES: Dict[DataType, str] = {DataType.Volume: "volume", DataType.Stairs: "signal"}
 
 
 @dataclass
@@ -32,12 +65,23 @@ class DataItem:
     data: Any               # Actual data (format depends on data_type)
     label: str              # Label for legend
     color: Optional[Tuple[float, float, float, float]] = None  # RGBA color
+    lod_mode: Optional[LODMode] = None  # Per-item LOD mode (None = plotter default)
+    range_index: Any = field(default=None, repr=False, compare=False)  # _RangeMinMaxIndex for Y autoscale
+    buffers: Any = field(default=None, repr=False, compare=False)  # _GrowableArray per component (live append)
+    transitions: Any = field(default=None, repr=False, compare=False)  # _StepTransitions for Stairs LOD
+    value_range: Optional[Tuple[float, float]] = field(default=None, repr=False, compare=False)  # Global (min, max), NaNs ignored
 
 
 class _ArrayOHLCReader:
-    """Lightweight adapter exposing an .ohlc property for array sources."""
-    def __init__(self, ohlc_array: np.ndarray):
-        self._ohlc = np.array(ohlc_array, dtype=np.float64).reshape(-1, 4)
+    """Lightweight adapter exposing an .ohlc property for array sources (no copy if dtype matches)."""
+    def __init__(self, ohlc_array: np.ndarray, dtype: Any = None,
+                 pyramid: Optional["_OHLCPyramid"] = None, range_index: Optional["_RangeMinMaxIndex"] = None):
+        arr = np.asarray(ohlc_array, dtype=dtype)
+        # An (N,4) array is kept as the same object so owners can match it by identity
+        self._ohlc = arr if arr.ndim == 2 and arr.shape[1] == 4 else arr.reshape(-1, 4)
+        # Optional prebuilt LOD pyramid / Y-range index of this array, reused by Panel.setOHLCData
+        self.pyramid = pyramid
+        self.range_index = range_index
 
     @property
     def ohlc(self) -> np.ndarray:
@@ -49,6 +93,786 @@ class _ArrayOHLCReader:
         return []
 
 
+class _GrowableArray:
+    """
+    Append-only array backed by a preallocated buffer with amortised doubling.
+
+    view is the live prefix [0, n) of the buffer. Appends fill spare capacity and
+    reallocate (2x) only when it runs out, so appending k rows costs O(k) amortised.
+    Rows can be scalars (1-D) or fixed-size vectors such as OHLC (N, 4).
+    """
+
+    def __init__(self, initial: Any, dtype: Any = None, min_capacity: int = 1024):
+        initial = np.asarray(initial, dtype=dtype)
+        capacity = max(int(min_capacity), 2 * len(initial))
+        self._buf = np.empty((capacity,) + initial.shape[1:], dtype=initial.dtype)
+        self._buf[:len(initial)] = initial
+        self.n = len(initial)
+        self.view = self._buf[:self.n]
+
+    def __len__(self) -> int:
+        return self.n
+
+    def append(self, values: Any) -> np.ndarray:
+        """Append rows and return the new live view."""
+        values = np.asarray(values, dtype=self._buf.dtype).reshape((-1,) + self._buf.shape[1:])
+        need = self.n + len(values)
+        if need > len(self._buf):
+            buf = np.empty((max(need, 2 * len(self._buf)),) + self._buf.shape[1:], dtype=self._buf.dtype)
+            buf[:self.n] = self._buf[:self.n]
+            self._buf = buf
+        self._buf[self.n:need] = values
+        self.n = need
+        self.view = self._buf[:need]
+        return self.view
+
+    def truncate(self, n: int) -> np.ndarray:
+        """Drop rows past n (used to recompute a partial tail) and return the live view."""
+        self.n = max(0, min(int(n), self.n))
+        self.view = self._buf[:self.n]
+        return self.view
+
+
+class _GrowableColumns:
+    """
+    Append-only column store (k, N) with amortised doubling, viewed as (N, k) rows.
+
+    columns is the live (k, n) prefix of the buffer, so each column (e.g. Close,
+    High, Low of OHLC) is contiguous for reductions; view is its transpose, which
+    row-oriented code indexes like an (N, k) array without a copy.
+    """
+
+    def __init__(self, columns: Any, dtype: Any = None, min_capacity: int = 1024):
+        columns = np.asarray(columns, dtype=dtype)
+        n = columns.shape[1]
+        self._buf = np.empty((columns.shape[0], max(int(min_capacity), 2 * n)), dtype=columns.dtype)
+        self._buf[:, :n] = columns
+        self.n = n
+        self.columns = self._buf[:, :n]
+        self.view = self.columns.T
+
+    def __len__(self) -> int:
+        return self.n
+
+    def append(self, rows: Any) -> np.ndarray:
+        """Append rows (m, k) and return the new live (N, k) view."""
+        rows = np.asarray(rows, dtype=self._buf.dtype).reshape(-1, self._buf.shape[0])
+        need = self.n + len(rows)
+        if need > self._buf.shape[1]:
+            buf = np.empty((self._buf.shape[0], max(need, 2 * self._buf.shape[1])), dtype=self._buf.dtype)
+            buf[:, :self.n] = self._buf[:, :self.n]
+            self._buf = buf
+        self._buf[:, self.n:need] = rows.T
+        self.n = need
+        self.columns = self._buf[:, :need]
+        self.view = self.columns.T
+        return self.view
+
+
+def _readonly_view(arr: np.ndarray) -> np.ndarray:
+    """Non-writeable view of arr (no copy); the owner keeps write access through arr."""
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
+def _plottable(arr: Any) -> Any:
+    """arr, or a copy of it if read-only (ImPlot's array bindings reject non-writeable buffers)."""
+    if isinstance(arr, np.ndarray) and not arr.flags.writeable:
+        return arr.copy()
+    return arr
+
+
+class _MemoryCounter:
+    """
+    Counts the bytes held by arrays and helper objects for memory reports.
+
+    Views (slices, transposes, read-only views) resolve to the array owning the
+    memory, so a buffer shared by the plotter and several panels is counted once,
+    for the first owner reporting it. Helper objects (_GrowableArray, _OHLCPyramid,
+    _RangeMinMaxIndex, ...) are walked through their attributes; growable buffers
+    count their full capacity, memory-mapped arrays their mapped size.
+    """
+
+    def __init__(self):
+        self._seen: set = set()
+
+    def add(self, *objs: Any) -> int:
+        """Bytes of objs not counted before (0 for None, scalars and repeats)."""
+        return sum(self._add(obj) for obj in objs)
+
+    def _add(self, obj: Any) -> int:
+        if isinstance(obj, dict):
+            return sum(self._add(v) for v in obj.values())
+        if isinstance(obj, (list, tuple, deque)) and not (len(obj) > 0 and isinstance(obj[0], str)):
+            return sum(self._add(v) for v in obj)
+        is_array = isinstance(obj, np.ndarray)
+        if not (is_array or isinstance(obj, list) or
+                (type(obj).__module__ == __name__ and hasattr(obj, "__dict__"))):
+            return 0  # None, scalars, external objects
+        if is_array:
+            while isinstance(obj.base, np.ndarray):
+                obj = obj.base
+        # Only long-lived objects are registered (containers passed in may be temporaries)
+        if id(obj) in self._seen:
+            return 0
+        self._seen.add(id(obj))
+        if is_array:
+            return int(obj.nbytes)
+        if isinstance(obj, list):
+            return sys.getsizeof(obj) + sum(map(sys.getsizeof, obj))  # Label strings
+        return sum(self._add(v) for v in vars(obj).values())
+
+
+class _OHLCPyramid:
+    """
+    Multi-resolution OHLC aggregation built once per data set.
+
+    Level k holds buckets of 2**k consecutive bars aggregated as
+    first open / max high / min low / last close. Level 0 is the source
+    array itself (no copy). A trailing odd bucket is carried up unchanged,
+    so bucket j of level k always covers bars [j * 2**k, (j + 1) * 2**k).
+    """
+
+    def __init__(self, ohlc: np.ndarray):
+        self.levels: List[np.ndarray] = [ohlc]
+        self._level_buffers: Dict[int, _GrowableArray] = {}  # Created on first extend()
+        cur = ohlc
+        while len(cur) > 1:
+            cur = self._reduce_pairs(cur)
+            self.levels.append(cur)
+
+    def extend(self, ohlc: np.ndarray):
+        """
+        Update the pyramid after bars were appended (ohlc starts with the previous bars).
+
+        Only the buckets touched by the new bars (plus a previously partial tail
+        bucket) are recomputed on each level, so the cost is O(appended bars).
+        """
+        dirty = len(self.levels[0])  # First changed index on the previous level
+        self.levels[0] = ohlc
+        k = 1
+        while len(self.levels[k - 1]) > 1:
+            start = dirty // 2
+            tail = self._reduce_pairs(self.levels[k - 1][2 * start:])
+            if k < len(self.levels):
+                buf = self._level_buffers.get(k)
+                if buf is None:
+                    buf = _GrowableArray(self.levels[k])
+                    self._level_buffers[k] = buf
+                buf.truncate(start)
+                self.levels[k] = buf.append(tail)
+            else:
+                self.levels.append(tail)
+            dirty = start
+            k += 1
+
+    @staticmethod
+    def _reduce_pairs(src: np.ndarray) -> np.ndarray:
+        """Aggregate adjacent bucket pairs of one level into the next level."""
+        n = len(src)
+        m = n // 2
+        a = src[0:2 * m:2]
+        b = src[1:2 * m:2]
+        out = np.empty(((n + 1) // 2, 4), dtype=src.dtype)
+        out[:m, 0] = a[:, 0]
+        np.maximum(a[:, 1], b[:, 1], out=out[:m, 1])
+        np.minimum(a[:, 2], b[:, 2], out=out[:m, 2])
+        out[:m, 3] = b[:, 3]
+        if n % 2:
+            out[m] = src[n - 1]
+        return out
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def level_for_step(self, step: int) -> int:
+        """Return the level whose bucket size (2**level) is closest to step bars."""
+        if step <= 1:
+            return 0
+        return min(int(round(np.log2(step))), len(self.levels) - 1)
+
+    def window(self, level: int, start: int, end: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (bucket_start_indices, ohlc) of the level buckets covering bars [start, end).
+
+        Cost is proportional to the number of returned buckets, not to the bar count.
+        """
+        if end <= start:
+            return np.array([], dtype=np.int64), self.levels[0][0:0]
+        b0 = start >> level
+        b1 = ((end - 1) >> level) + 1
+        starts = np.arange(b0, b1, dtype=np.int64) << level
+        return starts, self.levels[level][b0:b1]
+
+
+def _candle_color_classes(bar_starts: np.ndarray, bullish: np.ndarray, signals: Any = None) -> np.ndarray:
+    """
+    Colour class per (LOD) candle: 0 = green, 1 = red, 2 = white.
+
+    Without signals the class follows bullish/bearish. With signals (1 = LONG,
+    -1 = SHORT, other = FLAT) each candle takes the signal of the last bar of its
+    bucket, i.e. the position held when the bucket closes. Buckets are contiguous:
+    a candle spans up to the next candle's first bar, the last one keeps the common width.
+    """
+    color_class = np.where(bullish, 0, 1).astype(np.int8)
+    if signals is None or len(bar_starts) == 0:
+        return color_class
+    signals = np.asarray(signals)
+    starts = np.asarray(bar_starts).astype(np.int64)
+    last = np.empty_like(starts)
+    last[:-1] = starts[1:] - 1
+    last[-1] = starts[-1] + (starts[-1] - starts[-2] - 1 if len(starts) > 1 else 0)
+    np.maximum(last, starts, out=last)
+    valid = (starts >= 0) & (starts < len(signals))
+    if np.any(valid):
+        sig = np.take(signals, np.minimum(last[valid], len(signals) - 1))
+        color_class[valid] = np.where(sig == 1, 0, np.where(sig == -1, 1, 2))
+    return color_class
+
+
+def _m4_indices(x: np.ndarray, y: np.ndarray, x_min: float, x_max: float, n_columns: int) -> np.ndarray:
+    """
+    Return the M4 sample indices of (x, y) for n_columns pixel columns over [x_min, x_max].
+
+    Every pixel column keeps its first, min, max and last sample (deduplicated, in
+    index order), which reproduces the rasterized line exactly with at most
+    4 * n_columns points. x must be monotonic and y free of NaNs.
+    """
+    n = len(y)
+    if n == 0:
+        return np.array([], dtype=np.int64)
+    n_columns = max(1, int(n_columns))
+    span = float(x_max) - float(x_min)
+    if span > 0:
+        cols = np.floor((x - x_min) * (n_columns / span)).astype(np.int64)
+        np.clip(cols, 0, n_columns - 1, out=cols)
+    else:
+        cols = np.zeros(n, dtype=np.int64)
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(cols)) + 1)).astype(np.int64)
+    sizes = np.diff(np.append(starts, n))
+    ends = starts + sizes - 1
+
+    # Per-column extremes, then the first position reaching each extreme
+    positions = np.arange(n, dtype=np.int64)
+    col_min = np.repeat(np.minimum.reduceat(y, starts), sizes)
+    col_max = np.repeat(np.maximum.reduceat(y, starts), sizes)
+    min_idx = np.minimum.reduceat(np.where(y == col_min, positions, n), starts)
+    max_idx = np.minimum.reduceat(np.where(y == col_max, positions, n), starts)
+
+    quads = np.stack((starts, min_idx, max_idx, ends), axis=1)
+    quads.sort(axis=1)
+    flat = quads.ravel()
+    keep = np.empty(len(flat), dtype=bool)
+    keep[0] = True
+    np.not_equal(flat[1:], flat[:-1], out=keep[1:])
+    return flat[keep]
+
+
+def _minmax_decimation_indices(y: np.ndarray, step: int) -> np.ndarray:
+    """
+    Return the indices of the min and max sample of every step-wide bucket of y.
+
+    Buckets are formed by reshaping y into rows of step samples (the shorter tail
+    bucket is handled separately); each bucket contributes its min and max index
+    in ascending order, so the result is sorted and preserves the line shape.
+    """
+    n = len(y)
+    step = max(1, int(step))
+    full = (n // step) * step
+    parts = []
+    if full > 0:
+        blocks = y[:full].reshape(-1, step)
+        base = np.arange(0, full, step, dtype=np.int64)
+        min_idx = base + np.argmin(blocks, axis=1)
+        max_idx = base + np.argmax(blocks, axis=1)
+        parts.append(np.stack((np.minimum(min_idx, max_idx), np.maximum(min_idx, max_idx)), axis=1).ravel())
+    if full < n:
+        tail = y[full:]
+        min_i = full + int(np.argmin(tail))
+        max_i = full + int(np.argmax(tail))
+        parts.append(np.array([min(min_i, max_i), max(min_i, max_i)], dtype=np.int64))
+    if not parts:
+        return np.array([], dtype=np.int64)
+    return np.concatenate(parts)
+
+
+def _to_datetime_source(labels: Any) -> Any:
+    """
+    Normalize an X-axis time source.
+
+    Numeric (epoch seconds) and datetime64 arrays become a compact datetime64[s]
+    array that is formatted lazily; anything else is kept as a list of
+    pre-formatted strings (legacy path). Returns None for None/empty input.
+    """
+    if labels is None:
+        return None
+    if not isinstance(labels, np.ndarray):
+        try:
+            from numpy_bridge import is_pointer_descriptor, as_numpy
+            if is_pointer_descriptor(labels):
+                labels = as_numpy(labels, dtype=None)
+        except ImportError:
+            pass
+    if isinstance(labels, np.ndarray):
+        if labels.dtype.kind == 'M':
+            return labels.astype('datetime64[s]', copy=False)
+        if labels.dtype.kind in 'iu':
+            return labels.astype(np.int64, copy=False).view('datetime64[s]')
+        if labels.dtype.kind == 'f':
+            return labels.astype(np.int64).view('datetime64[s]')
+        return [str(x) for x in labels.tolist()]
+    return [str(x) for x in list(labels)]
+
+
+def _format_datetime_label(labels: Any, idx: int) -> Optional[str]:
+    """Format one label as "YYYY.MM.DD HH:MM:SS" (UTC for epoch sources); None if out of range."""
+    if labels is None or not (0 <= idx < len(labels)):
+        return None
+    if isinstance(labels, np.ndarray) and labels.dtype.kind == 'M':
+        text = np.datetime_as_string(labels[idx], unit='s')  # YYYY-MM-DDTHH:MM:SS
+        return f"{text[:10].replace('-', '.')} {text[11:19]}"
+    return str(labels[idx])
+
+
+class _RangeMinMaxIndex:
+    """
+    Range min/max index for per-frame Y autoscale.
+
+    Values are grouped into fixed blocks; a sparse table over the block minima
+    and maxima answers any run of whole blocks in O(1), and the two partial
+    edge blocks are scanned directly (at most 2 * block_size samples). Memory is
+    O(N / block_size * log N). NaNs are ignored; a window without finite values
+    returns NaN.
+    """
+
+    def __init__(self, low: Any, high: Any = None, block_size: int = 64):
+        self.source = low  # Source object, used by owners to detect stale indexes
+        self.low = np.asarray(low).reshape(-1)
+        self.high = self.low if high is None else np.asarray(high).reshape(-1)
+        self.n = min(len(self.low), len(self.high))
+        self.block_size = int(block_size)
+        self._min_blocks = _GrowableArray(self._reduce_blocks(self.low[:self.n], np.fmin, 0), dtype=np.float64)
+        self._max_blocks = _GrowableArray(self._reduce_blocks(self.high[:self.n], np.fmax, 0), dtype=np.float64)
+        self._min_table = self._build_table(self._min_blocks.view, np.fmin)
+        self._max_table = self._build_table(self._max_blocks.view, np.fmax)
+
+    def extend(self, low: Any, high: Any = None):
+        """
+        Update the index after values were appended (low/high start with the previous values).
+
+        Block reductions are computed only from the last partial block onwards; the
+        sparse table is rebuilt from the block arrays, which is O(N / block_size * log N).
+        """
+        first_block = self.n // self.block_size
+        self.source = low
+        self.low = np.asarray(low).reshape(-1)
+        self.high = self.low if high is None else np.asarray(high).reshape(-1)
+        self.n = min(len(self.low), len(self.high))
+        for blocks, values, op in ((self._min_blocks, self.low, np.fmin), (self._max_blocks, self.high, np.fmax)):
+            blocks.truncate(first_block)
+            blocks.append(self._reduce_blocks(values[:self.n], op, first_block))
+        self._min_table = self._build_table(self._min_blocks.view, np.fmin)
+        self._max_table = self._build_table(self._max_blocks.view, np.fmax)
+
+    def _reduce_blocks(self, values: np.ndarray, op, first_block: int) -> np.ndarray:
+        """NaN-ignoring reduction of every block from first_block to the (partial) last block."""
+        bs = self.block_size
+        values = values[first_block * bs:]
+        full = (len(values) // bs) * bs
+        blocks = []
+        if full > 0:
+            blocks.append(op.reduce(values[:full].reshape(-1, bs), axis=1).astype(np.float64))
+        if full < len(values):
+            blocks.append(np.array([op.reduce(values[full:])], dtype=np.float64))
+        return np.concatenate(blocks) if blocks else np.array([], dtype=np.float64)
+
+    def _build_table(self, level: np.ndarray, op) -> List[np.ndarray]:
+        """Build the sparse table levels over the per-block reductions."""
+        table = [level]
+        width = 1
+        while 2 * width <= len(table[0]):
+            level = op(level[:-width], level[width:])
+            table.append(level)
+            width *= 2
+        return table
+
+    @staticmethod
+    def _reduce(values: np.ndarray, op) -> float:
+        return float(op.reduce(values)) if len(values) > 0 else float("nan")
+
+    def _query(self, values: np.ndarray, table: List[np.ndarray], op, start: int, end: int) -> float:
+        bs = self.block_size
+        b0 = -(-start // bs)  # First whole block
+        b1 = end // bs        # One past the last whole block
+        if b0 >= b1:
+            return self._reduce(values[start:end], op)
+        k = (b1 - b0).bit_length() - 1
+        level = table[k]
+        result = op(level[b0], level[b1 - (1 << k)])
+        result = op(result, self._reduce(values[start:b0 * bs], op))
+        result = op(result, self._reduce(values[b1 * bs:end], op))
+        return float(result)
+
+    def query(self, start: int, end: int) -> Tuple[float, float]:
+        """Return (min, max) over [start, end), NaN when the window has no finite values."""
+        start = max(0, int(start))
+        end = min(self.n, int(end))
+        if end <= start:
+            return float("nan"), float("nan")
+        return (self._query(self.low, self._min_table, np.fmin, start, end),
+                self._query(self.high, self._max_table, np.fmax, start, end))
+
+
+class _StepTransitions:
+    """
+    Positions where a step series changes value (i with y[i] != y[i - 1]).
+
+    Computed once per data set with a single vectorized pass (np.flatnonzero over
+    np.diff) and extended incrementally on appends, so the stairs LOD only has to
+    binary-search the visible window instead of rescanning the samples.
+    """
+
+    def __init__(self, values: Any):
+        self.source = values  # Source object, used by owners to detect stale indexes
+        y = np.asarray(values).reshape(-1)
+        self.n = len(y)
+        self._positions = _GrowableArray(np.flatnonzero(np.diff(y)) + 1, dtype=np.int64)
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self._positions.view
+
+    def extend(self, values: Any):
+        """Update after samples were appended (values starts with the previous samples)."""
+        y = np.asarray(values).reshape(-1)
+        if self.n > 0 and len(y) > self.n:
+            tail = y[self.n - 1:]
+            self._positions.append(np.flatnonzero(np.diff(tail)) + self.n)
+        elif len(y) != self.n:
+            self._positions = _GrowableArray(np.flatnonzero(np.diff(y)) + 1, dtype=np.int64)
+        self.n = len(y)
+        self.source = values
+
+
+class _SignalSegments:
+    """
+    Run-length encoding of a trade signal array (1 = LONG, -1 = SHORT, 0 = FLAT).
+
+    Runs are stored as [start, end) bar ranges with their value; they are built once
+    with a vectorized pass and extended from the last run on appends. visible()
+    returns the non-flat runs overlapping a bar window with two binary searches.
+    """
+
+    def __init__(self, signals: Any):
+        self.source = signals  # Source object, used by owners to detect stale segments
+        s = np.asarray(signals).reshape(-1)  # Any numeric dtype (e.g. int8 storage)
+        self.n = len(s)
+        starts, ends, values = self._runs(s, 0)
+        self._starts = _GrowableArray(starts, dtype=np.int64)
+        self._ends = _GrowableArray(ends, dtype=np.int64)
+        self._values = _GrowableArray(values, dtype=np.float64)
+
+    @staticmethod
+    def _runs(s: np.ndarray, offset: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if len(s) == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+        change = np.flatnonzero(s[1:] != s[:-1]) + 1
+        starts = np.concatenate(([0], change)).astype(np.int64)
+        ends = np.append(change, len(s)).astype(np.int64)
+        return starts + offset, ends + offset, s[starts]
+
+    def extend(self, signals: Any):
+        """Update after values were appended (signals starts with the previous values)."""
+        s = np.asarray(signals).reshape(-1)
+        runs = len(self._starts)
+        k = int(self._starts.view[-1]) if runs > 0 else 0
+        if len(s) < self.n:
+            k, runs = 0, 1  # Shrunk: rebuild
+        for buf in (self._starts, self._ends, self._values):
+            buf.truncate(max(0, runs - 1))
+        starts, ends, values = self._runs(s[k:], k)
+        self._starts.append(starts)
+        self._ends.append(ends)
+        self._values.append(values)
+        self.n = len(s)
+        self.source = signals
+
+    def visible(self, start: int, end: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(starts, ends, sides) of the LONG/SHORT runs overlapping bars [start, end)."""
+        lo = int(np.searchsorted(self._ends.view, start, side="right"))
+        hi = int(np.searchsorted(self._starts.view, end, side="left"))
+        starts = self._starts.view[lo:hi]
+        ends = self._ends.view[lo:hi]
+        values = self._values.view[lo:hi]
+        active = np.isfinite(values) & (values != 0)
+        # Any non-zero value other than 1 is drawn as SHORT (same as the per-bar colours)
+        return starts[active], ends[active], np.where(values[active] == 1, 1, -1)
+
+
+class _RangeSliderOverview:
+    """
+    High/low envelope of the whole OHLC series for the range slider.
+
+    Read from the coarsest-but-sufficient level of an OHLC LOD pyramid (at most
+    max_points buckets), so spikes survive: each bucket keeps its max High and
+    min Low plus its last Close. The pyramid is a panel's (viewing the same OHLC)
+    when there is one, otherwise an own one that appendBars extends in place.
+    update() reads the level only when its key (data version, bar count)
+    changes, at O(max_points) cost.
+    """
+
+    def __init__(self, max_points: int = 512):
+        self.max_points = int(max_points)
+        self.key: Optional[Tuple] = None
+        self.pyramid: Optional[_OHLCPyramid] = None  # Own pyramid (no panel pyramid for this OHLC)
+        self.x = np.array([], dtype=np.float64)
+        self.low = np.array([], dtype=np.float64)
+        self.high = np.array([], dtype=np.float64)
+        self.close = np.array([], dtype=np.float64)
+
+    def update(self, ohlc: np.ndarray, key: Tuple, pyramid: Optional[_OHLCPyramid] = None):
+        """Refresh the envelope for ohlc unless key is unchanged (pyramid: a panel's pyramid over ohlc)."""
+        if key == self.key:
+            return
+        if pyramid is None:
+            if self.pyramid is None or self.pyramid.levels[0] is not ohlc:
+                self.pyramid = _OHLCPyramid(ohlc)
+            pyramid = self.pyramid
+        else:
+            self.pyramid = None
+        level = 0
+        while len(pyramid.levels[level]) > self.max_points and level + 1 < len(pyramid.levels):
+            level += 1
+        buckets = pyramid.levels[level]
+        n = len(pyramid)
+        starts = np.arange(len(buckets), dtype=np.float64) * (1 << level)
+        ends = np.minimum(starts + (1 << level), n)
+        self.x = (starts + ends) * 0.5 if level > 0 else starts
+        # Contiguous float64 copies (ImPlot rejects strided column views)
+        self.high = np.ascontiguousarray(buckets[:, 1], dtype=np.float64)
+        self.low = np.ascontiguousarray(buckets[:, 2], dtype=np.float64)
+        self.close = np.ascontiguousarray(buckets[:, 3], dtype=np.float64)
+        self.key = key
+
+
+class _EquityOverlay:
+    """
+    Distribution summary of many equity curves (runs x bars) for DataType.EquityOverlay.
+
+    Built in one pass over the matrix in bar blocks, so a memory-mapped matrix is
+    read block by block and never copied whole. At the end of every base bucket
+    (base_step bars) it stores a quantile sketch of the runs' values (QUANTILES
+    cut points) and the min/max of all runs over the bucket. A coarser level is an
+    exact sub-sample of the base buckets (a bucket ends where its last child ends),
+    so bands and the density heatmap of any view read at most a few sketch columns
+    per pixel. Views finer than base_step bars show the base sketch; the top-K
+    curves are copied and drawn at full resolution.
+    """
+
+    QUANTILES = np.linspace(0.0, 1.0, 41)  # 2.5% steps, includes p5/p50/p95
+    MODES = ("bands", "heatmap")
+    TOP_COLORS = (
+        (1.0, 0.85, 0.0, 1.0),  # Yellow
+        (1.0, 0.45, 0.1, 1.0),  # Orange
+        (1.0, 0.2, 0.8, 1.0),   # Pink
+        (0.5, 1.0, 0.5, 1.0),   # Light green
+        (0.2, 0.9, 1.0, 1.0),   # Cyan
+    )
+
+    def __init__(self, curves: Any, top_k: int = 5, scores: Any = None,
+                 max_buckets: int = 16384, block_bytes: int = 64 << 20):
+        if not isinstance(curves, np.ndarray):
+            curves = np.asarray(curves, dtype=np.float64)
+        if curves.ndim == 1:
+            curves = curves.reshape(1, -1)
+        self.curves = curves  # Kept as given (a memmap stays a memmap)
+        self.mode = "bands"   # "bands" (p5/p50/p95) or "heatmap" (density)
+        self.n_runs, self.n_bars = int(curves.shape[0]), int(curves.shape[1])
+        self.base_step = max(1, -(-self.n_bars // max(1, int(max_buckets))))
+        ends = np.minimum(np.arange(1, -(-self.n_bars // self.base_step) + 1, dtype=np.int64) * self.base_step,
+                          self.n_bars)
+        self.sample_index = ends - 1  # Bar index sampled for each base bucket
+        n_buckets = len(ends)
+        self.sketch = np.full((n_buckets, len(self.QUANTILES)), np.nan, dtype=np.float32)
+        self.bucket_low = np.full(n_buckets, np.nan, dtype=np.float64)
+        self.bucket_high = np.full(n_buckets, np.nan, dtype=np.float64)
+        final = np.full(self.n_runs, np.nan, dtype=np.float64)
+
+        # Whole buckets per block, about block_bytes of float64 per block
+        row_bytes = max(1, self.n_runs * 8)
+        block_bars = max(1, int(block_bytes) // row_bytes // self.base_step) * self.base_step
+        with np.errstate(invalid="ignore"):
+            for b0 in range(0, self.n_bars, block_bars):
+                b1 = min(self.n_bars, b0 + block_bars)
+                block = np.asarray(curves[:, b0:b1], dtype=np.float64)
+                j0 = b0 // self.base_step
+                j1 = j0 + -(-(b1 - b0) // self.base_step)
+                cols = self.sample_index[j0:j1] - b0
+                self.sketch[j0:j1] = self._column_quantiles(block[:, cols])
+                starts = np.arange(0, b1 - b0, self.base_step)
+                self.bucket_low[j0:j1] = np.fmin.reduceat(np.fmin.reduce(block, axis=0), starts)
+                self.bucket_high[j0:j1] = np.fmax.reduceat(np.fmax.reduce(block, axis=0), starts)
+                if b1 == self.n_bars:
+                    final = block[:, -1].copy()
+        self.range_index = _RangeMinMaxIndex(self.bucket_low, self.bucket_high)
+
+        # Top-K by score (default: final balance); NaN scores rank last
+        if scores is None:
+            scores = final
+        scores = np.nan_to_num(np.asarray(scores, dtype=np.float64).reshape(-1), nan=-np.inf)
+        self.top_runs = np.argsort(-scores, kind="stable")[:max(0, min(int(top_k), self.n_runs))]
+        self.top_curves = [np.ascontiguousarray(curves[run], dtype=np.float64) for run in self.top_runs]
+
+    @classmethod
+    def _column_quantiles(cls, values: np.ndarray) -> np.ndarray:
+        """
+        (columns, len(QUANTILES)) quantiles of each column of values, NaNs ignored.
+
+        Same linear interpolation as np.nanquantile, from one sort per column
+        (several times faster than nanquantile for many cut points).
+        """
+        ordered = np.sort(values.T, axis=1)  # NaNs sort last
+        last = np.maximum(np.count_nonzero(~np.isnan(ordered), axis=1) - 1, 0)
+        pos = last[:, None] * cls.QUANTILES[None, :]
+        lower = np.floor(pos).astype(np.int64)
+        upper = np.minimum(lower + 1, last[:, None])
+        rows = np.arange(len(ordered))[:, None]
+        low_values = ordered[rows, lower]
+        return low_values + (ordered[rows, upper] - low_values) * (pos - lower)
+
+    def query(self, start: int, end: int) -> Tuple[float, float]:
+        """(min, max) of all runs over bars [start, end), at base bucket resolution (range index protocol)."""
+        return self.range_index.query(max(0, int(start)) // self.base_step, -(-int(end) // self.base_step))
+
+    def columns(self, start: int, end: int, max_columns: int) -> np.ndarray:
+        """
+        Base bucket indices to draw for bars [start, end): the bucket ends of the finest
+        level with at most max_columns buckets in view, plus one on each side.
+        """
+        n_buckets = len(self.sample_index)
+        j0 = max(0, int(start)) // self.base_step
+        j1 = min(n_buckets, -(-max(0, int(end)) // self.base_step))
+        stride = 1
+        while (j1 - j0) // stride > max(1, int(max_columns)):
+            stride *= 2
+        k0 = max(0, j0 // stride - 1)
+        k1 = min(-(-n_buckets // stride), j1 // stride + 2)
+        js = np.minimum(np.arange(k0, k1, dtype=np.int64) * stride + stride - 1, n_buckets - 1)
+        return np.unique(js)
+
+    def percentiles(self, js: np.ndarray, q: float) -> np.ndarray:
+        """Sketch value at quantile q (0..1) for the base buckets js (linear between cut points)."""
+        pos = float(q) * (len(self.QUANTILES) - 1)
+        i = min(int(pos), len(self.QUANTILES) - 2)
+        frac = pos - i
+        sketch = self.sketch[js]
+        return np.ascontiguousarray(sketch[:, i] * (1.0 - frac) + sketch[:, i + 1] * frac, dtype=np.float64)
+
+    def density(self, js: np.ndarray, y_min: float, y_max: float, rows: int) -> np.ndarray:
+        """
+        (rows, len(js)) fraction of runs per Y bin of [y_min, y_max] at the base buckets js,
+        from the piecewise linear CDF of each sketch column. Row 0 is the top bin (ImPlot order).
+        """
+        edges = np.linspace(y_min, y_max, int(rows) + 1)
+        values = np.zeros((int(rows), len(js)), dtype=np.float64)
+        for c, j in enumerate(js):
+            column = self.sketch[j]
+            if np.isnan(column).any():
+                continue
+            cdf = np.interp(edges, column, self.QUANTILES, left=0.0, right=1.0)
+            values[:, c] = np.diff(cdf)[::-1]
+        return values
+
+
+class _FrameProfiler:
+    """
+    Opt-in per-stage frame timer (time.perf_counter_ns).
+
+    Stages are accumulated per owner ("plot" or a panel index) during a frame; at
+    end_frame() the totals go into rolling windows for p50/p99 and, if a trace path
+    was given, one record per frame is written (.csv: frame,owner,stage,ns rows;
+    any other extension: one JSON object per line).
+    """
+
+    def __init__(self, window: int = 240, trace_path: Optional[str] = None):
+        self.window = max(1, int(window))
+        self.frame = 0
+        self._current: Dict[Tuple[Any, str], int] = {}
+        self._history: Dict[Tuple[Any, str], deque] = {}
+        self._stats: Dict[Any, List[Tuple[str, float, float]]] = {}
+        self._trace = None
+        self._trace_csv = False
+        if trace_path:
+            self._trace_csv = str(trace_path).lower().endswith(".csv")
+            self._trace = open(trace_path, "w", encoding="utf-8", newline="")
+            if self._trace_csv:
+                self._trace.write("frame,owner,stage,ns\n")
+
+    @staticmethod
+    def now() -> int:
+        return time.perf_counter_ns()
+
+    def add(self, owner: Any, stage: str, ns: int):
+        """Accumulate ns into (owner, stage) for the current frame."""
+        key = (owner, stage)
+        self._current[key] = self._current.get(key, 0) + int(ns)
+
+    def lap(self, owner: Any, stage: str, t_start: int, exclude_ns: int = 0) -> int:
+        """Add the time elapsed since t_start (minus exclude_ns) to (owner, stage); return the current time."""
+        t = time.perf_counter_ns()
+        self.add(owner, stage, t - t_start - exclude_ns)
+        return t
+
+    def total(self, owner: Any, stage: str) -> int:
+        """Time accumulated so far in this frame for (owner, stage)."""
+        return self._current.get((owner, stage), 0)
+
+    def end_frame(self):
+        """Close the frame: update rolling windows and percentiles, write the trace record."""
+        for key, ns in self._current.items():
+            history = self._history.get(key)
+            if history is None:
+                history = self._history[key] = deque(maxlen=self.window)
+            history.append(ns)
+
+        stats: Dict[Any, List[Tuple[str, float, float]]] = {}
+        for (owner, stage), history in self._history.items():
+            p50, p99 = np.percentile(np.fromiter(history, dtype=np.int64, count=len(history)), (50, 99))
+            stats.setdefault(owner, []).append((stage, float(p50) / 1e6, float(p99) / 1e6))
+        self._stats = stats
+
+        if self._trace is not None and self._current:
+            try:
+                if self._trace_csv:
+                    self._trace.writelines(
+                        f"{self.frame},{owner},{stage},{ns}\n" for (owner, stage), ns in self._current.items()
+                    )
+                else:
+                    record: Dict[str, Any] = {"frame": self.frame, "t_ns": time.time_ns()}
+                    for (owner, stage), ns in self._current.items():
+                        record.setdefault(str(owner), {})[stage] = ns
+                    self._trace.write(json.dumps(record) + "\n")
+            except Exception as e:
+                logger.warning("Profiler trace write error: %s", e)
+
+        self._current = {}
+        self.frame += 1
+
+    def stats(self, owner: Any) -> List[Tuple[str, float, float]]:
+        """Rolling (stage, p50_ms, p99_ms) list for owner, as of the last finished frame."""
+        return self._stats.get(owner, [])
+
+    def close(self):
+        if self._trace is not None:
+            try:
+                self._trace.close()
+            except Exception:
+                pass
+            self._trace = None
+
+
 class Panel:
     """
     Represents a single panel (subplot) that can contain multiple data series.
@@ -60,6 +884,16 @@ class Panel:
         self.data_items: List[DataItem] = []
         self.ohlc_data = None  # Special storage for OHLC data from CSVReader
         self.ohlc_array: Optional[np.ndarray] = None  # Direct OHLC array storage (N,4)
+        self.ohlc_pyramid: Optional[_OHLCPyramid] = None  # LOD levels built from the OHLC source
+        self.ohlc_range_index: Optional[_RangeMinMaxIndex] = None  # Low/High range index for Y autoscale
+        self._ohlc_buffer: Optional[_GrowableArray] = None  # Growable OHLC storage for live appends
+        # Storage dtype per array role (see STORAGE_DTYPES_FLOAT64); set by DataPlotterImgBundleNew.AddPanel
+        self.storage_dtypes: Dict[str, Any] = dict(STORAGE_DTYPES_FLOAT64)
+        # Bumped on every data change (setData/setOHLC/append*), used to invalidate caches
+        self.data_version: int = 0
+        # Last LOD result per slot ("ohlc" / item component), reused while its key is unchanged
+        self._lod_cache: Dict[Tuple, Tuple[Tuple, Any]] = {}
+        self._y_range_cache: Optional[Tuple[Tuple, Tuple[float, float]]] = None
         self.title = f"Panel {index}"
         self.y_axis_label = ""
         self.height_ratio = 1.0  # Relative height (1.0 = standard)
@@ -68,7 +902,7 @@ class Panel:
         self.fixed_height_px: Optional[float] = None
         self.fixed_width_px: Optional[float] = None
         # Optional external datetime labels (e.g., ["YYYY.MM.DD HH:MM:SS", ...])
-        self.datetime_labels: Optional[List[str]] = None
+        self.datetime_labels: Any = None  # List[str] or datetime64[s] array (see _to_datetime_source)
         # Info panel positioning (relative to plot origin)
         self.info_panel_dx: float = 100.0
         self.info_panel_dy: float = 2.0
@@ -126,11 +960,237 @@ class Panel:
         """Set OHLC data from CSVReader instance."""
         self.ohlc_data = csv_reader
         self.ohlc_array = None
+        self.ohlc_pyramid = None
+        self.ohlc_range_index = None
+        self.data_version += 1
+        try:
+            if csv_reader is not None:
+                ohlc = csv_reader.ohlc
+                # Reuse indexes the reader carries for this very array (shared OHLC, see getOHLCData)
+                pyramid = getattr(csv_reader, "pyramid", None)
+                range_index = getattr(csv_reader, "range_index", None)
+                self.ohlc_pyramid = (pyramid if pyramid is not None and pyramid.levels[0] is ohlc
+                                     else _OHLCPyramid(ohlc))
+                self.ohlc_range_index = (range_index if range_index is not None and range_index.source is ohlc
+                                         else self._build_ohlc_range_index(ohlc))
+        except Exception:
+            self.ohlc_pyramid = None
+            self.ohlc_range_index = None
 
     def setOHLC(self, ohlc: np.ndarray):
-        """Set OHLC data directly as array with shape (N,4) [Open, High, Low, Close]."""
-        self.ohlc_array = np.array(ohlc, dtype=np.float64).reshape(-1, 4)
+        """Set OHLC data directly as array with shape (N,4) [Open, High, Low, Close] (no copy if dtype matches)."""
+        self.ohlc_array = np.asarray(ohlc, dtype=self.storage_dtypes["price"]).reshape(-1, 4)
         self.ohlc_data = None
+        self.ohlc_pyramid = _OHLCPyramid(self.ohlc_array)
+        self.ohlc_range_index = self._build_ohlc_range_index(self.ohlc_array)
+        self.data_version += 1
+
+    def appendOHLC(self, ohlc: Any):
+        """
+        Append bars (k,4) to this panel's OHLC data without replacing it.
+
+        Storage grows with amortised doubling; the LOD pyramid and the Y-range
+        index are extended in place instead of being rebuilt.
+        """
+        rows = np.asarray(ohlc, dtype=self.storage_dtypes["price"]).reshape(-1, 4)
+        src = self._get_ohlc_source()
+        if src is None:
+            self.setOHLC(rows)
+            return
+        if len(rows) == 0:
+            return
+        if self._ohlc_buffer is None or self._ohlc_buffer.view is not src:
+            # Keeps the source dtype and layout (columnar sources stay columnar)
+            if src.T.flags.c_contiguous:
+                self._ohlc_buffer = _GrowableColumns(src.T)
+            else:
+                self._ohlc_buffer = _GrowableArray(src)
+        self._extend_ohlc_source(src, self._ohlc_buffer.append(rows))
+
+    def _extend_ohlc_source(self, src: np.ndarray, new_ohlc: np.ndarray):
+        """
+        Switch the OHLC source to new_ohlc, which starts with the bars of src.
+
+        The LOD pyramid and the Y-range index are extended in place. Used by
+        appendOHLC and by DataPlotterImgBundleNew.appendBars for panels that view
+        the plotter's shared OHLC buffer (which then grows only once).
+        """
+        if isinstance(self.ohlc_data, _ArrayOHLCReader):
+            self.ohlc_data._ohlc = new_ohlc
+        else:
+            self.ohlc_array = new_ohlc
+
+        # Indexes shared with other panels may already have been extended to new_ohlc
+        if self.ohlc_pyramid is not None and self.ohlc_pyramid.levels[0] is src:
+            self.ohlc_pyramid.extend(new_ohlc)
+        elif self.ohlc_pyramid is None or self.ohlc_pyramid.levels[0] is not new_ohlc:
+            self.ohlc_pyramid = _OHLCPyramid(new_ohlc)
+        if self.ohlc_range_index is not None and self.ohlc_range_index.source is src:
+            self.ohlc_range_index.extend(new_ohlc[:, 2], new_ohlc[:, 1])
+            self.ohlc_range_index.source = new_ohlc
+        elif self.ohlc_range_index is None or self.ohlc_range_index.source is not new_ohlc:
+            self.ohlc_range_index = self._build_ohlc_range_index(new_ohlc)
+        self.data_version += 1
+
+    def appendData(self, index: int, values: Any):
+        """
+        Append samples to the data item with this index (see setData).
+
+        values matches the item's data format: an array for Line/PnL/Balance/Volume/
+        Histogram/Stairs, a tuple of arrays for Bands (upper, lower) and TradeSignals.
+        """
+        item = next((it for it in self.data_items if it.index == index), None)
+        if item is None or item.data_type in (DataType.Levels, DataType.EquityOverlay):
+            logger.warning("appendData: panel %s has no appendable item %s", self.index, index)
+            return
+
+        is_tuple = isinstance(item.data, tuple)
+        old_parts = list(item.data) if is_tuple else [item.data]
+        new_parts = list(values) if is_tuple else [values]
+        if item.buffers is None or any(b.view is not d for b, d in zip(item.buffers, old_parts)):
+            item.buffers = [_GrowableArray(d) for d in old_parts]
+        parts = [buf.append(v) for buf, v in zip(item.buffers, new_parts)]
+        item.data = tuple(parts) if is_tuple else parts[0]
+
+        index_src = old_parts[1] if item.data_type == DataType.Bands else old_parts[0]
+        if item.range_index is not None and item.range_index.source is index_src:
+            if item.data_type == DataType.Bands:
+                item.range_index.extend(parts[1], parts[0])
+            else:
+                item.range_index.extend(parts[0])
+        else:
+            item.range_index = self._build_item_range_index(item.data_type, item.data)
+        if item.data_type != DataType.TradeSignals:
+            appended = tuple(part[len(old):] for part, old in zip(parts, old_parts))
+            tail_range = self._item_value_range(DataType.Bands, appended)
+            if item.value_range is None or tail_range is None:
+                item.value_range = item.value_range or tail_range
+            else:
+                item.value_range = (min(item.value_range[0], tail_range[0]), max(item.value_range[1], tail_range[1]))
+        if item.data_type == DataType.Stairs:
+            if item.transitions is not None and item.transitions.source is old_parts[0]:
+                item.transitions.extend(parts[0])
+            else:
+                item.transitions = _StepTransitions(parts[0])
+        self.data_version += 1
+
+    @staticmethod
+    def _build_ohlc_range_index(ohlc: np.ndarray) -> _RangeMinMaxIndex:
+        """Range index over the Low (min) and High (max) columns."""
+        index = _RangeMinMaxIndex(ohlc[:, 2], ohlc[:, 1])
+        index.source = ohlc
+        return index
+
+    def _get_ohlc_source(self) -> Optional[np.ndarray]:
+        """Return the (N,4) OHLC array of this panel (direct array or reader), if any."""
+        if self.ohlc_array is not None:
+            return self.ohlc_array
+        if self.ohlc_data is not None:
+            return self.ohlc_data.ohlc
+        return None
+
+    def getMemoryReport(self, counter: Optional[_MemoryCounter] = None) -> Dict[str, Any]:
+        """
+        Bytes held by this panel: OHLC source, LOD pyramid, Y-range indexes, LOD cache and per item.
+
+        Buffers already counted by counter (e.g. the plotter's shared OHLC that the
+        panel only views) report 0, so the totals of one report add up without
+        double counting.
+        """
+        counter = counter if counter is not None else _MemoryCounter()
+        try:
+            ohlc_src = self._get_ohlc_source()
+        except Exception:
+            ohlc_src = None
+        report: Dict[str, Any] = {
+            "title": self.title,
+            "ohlc": counter.add(ohlc_src, self._ohlc_buffer),
+            "ohlc_pyramid": counter.add(self.ohlc_pyramid),
+            "ohlc_range_index": counter.add(self.ohlc_range_index),
+            "lod_cache": counter.add(self._lod_cache),
+            "items": [
+                {
+                    "index": item.index,
+                    "label": item.label,
+                    "type": item.data_type.name,
+                    "dtype": str(item.data[0].dtype if isinstance(item.data, tuple) else
+                                 getattr(item.data, "dtype", "")),
+                    "bytes": counter.add(item.data, item.buffers, item.range_index, item.transitions),
+                }
+                for item in self.data_items
+            ],
+        }
+        report["total"] = (report["ohlc"] + report["ohlc_pyramid"] + report["ohlc_range_index"] +
+                           report["lod_cache"] + sum(it["bytes"] for it in report["items"]))
+        return report
+
+    @staticmethod
+    def _build_item_range_index(data_type: DataType, data: Any) -> Optional[_RangeMinMaxIndex]:
+        """Range index for the Y-autoscaled data types (None for the others)."""
+        if data_type in (DataType.Line, DataType.PnL, DataType.Balance, DataType.Volume, DataType.Histogram):
+            return _RangeMinMaxIndex(data)
+        if data_type == DataType.Bands:
+            upper_data, lower_data = data
+            return _RangeMinMaxIndex(lower_data, upper_data)
+        return None
+
+    def getVisibleYRange(self, start: int, end: int) -> Tuple[float, float]:
+        """
+        Return (y_min, y_max) of all Y-autoscaled content in bar window [start, end).
+
+        OHLC uses Low/High, Line/PnL/Balance/Volume/Histogram their values, Bands
+        lower/upper and Levels their constants; NaNs are ignored. Answers come from
+        the range indexes built in setOHLC/setOHLCData/setData, so the cost does not
+        depend on the window size. Returns (inf, -inf) when nothing is visible.
+        """
+        y_min = float('inf')
+        y_max = float('-inf')
+
+        ohlc_src = self._get_ohlc_source()
+        if ohlc_src is not None:
+            try:
+                index = self.ohlc_range_index
+                if index is None or index.source is not ohlc_src:
+                    index = self._build_ohlc_range_index(ohlc_src)
+                    self.ohlc_range_index = index
+                lo, hi = index.query(start, end)
+                if np.isfinite(lo):
+                    y_min = min(y_min, lo)
+                if np.isfinite(hi):
+                    y_max = max(y_max, hi)
+            except Exception:
+                pass
+
+        for item in self.data_items:
+            try:
+                if item.data_type == DataType.Levels:
+                    if item.value_range is None:
+                        item.value_range = self._item_value_range(item.data_type, item.data)
+                    if item.value_range is not None:
+                        y_min = min(y_min, item.value_range[0])
+                        y_max = max(y_max, item.value_range[1])
+                    continue
+                if item.range_index is None:
+                    item.range_index = self._build_item_range_index(item.data_type, item.data)
+                if item.range_index is None:
+                    continue
+                lo, hi = item.range_index.query(start, end)
+                if np.isfinite(lo):
+                    y_min = min(y_min, lo)
+                if np.isfinite(hi):
+                    y_max = max(y_max, hi)
+            except Exception:
+                pass
+
+        return y_min, y_max
+
+    def _get_ohlc_pyramid(self, ohlc: np.ndarray) -> _OHLCPyramid:
+        """Return the LOD pyramid for ohlc, rebuilding it only if the source array changed."""
+        pyramid = self.ohlc_pyramid
+        if pyramid is None or pyramid.levels[0] is not ohlc:
+            pyramid = _OHLCPyramid(ohlc)
+            self.ohlc_pyramid = pyramid
+        return pyramid
 
     # Info panel positioning setters
     def setInfoPanelPosition(self, dx: float, dy: float):
@@ -162,7 +1222,7 @@ class Panel:
     # ========================
     # Info Panel Builders
     # ========================
-    def BuildPanelInfo(self, idx: int, ohlc_src: Optional[np.ndarray], shared_labels: Optional[List[str]], shared_crosshair: Optional[Dict[str, Any]]):
+    def BuildPanelInfo(self, idx: int, ohlc_src: Optional[np.ndarray], shared_labels: Any, shared_crosshair: Optional[Dict[str, Any]]):
         """
         Draw a small info panel for this panel, tailored to its content.
 
@@ -195,10 +1255,7 @@ class Panel:
                     row_y = self.BuildPanelInfoOHLC(idx, ohlc_src, shared_crosshair, dl, label_x, value_x, row_y)
                     drew_any = True
             except Exception as e:
-                try:
-                    print(f"[DEBUG] BuildPanelInfoOHLC failed at idx={idx}: {e}")
-                except Exception:
-                    pass
+                logger.debug("BuildPanelInfoOHLC failed at idx=%s: %s", idx, e)
 
             # If not OHLC, render based on panel data types
             if not drew_any:
@@ -220,26 +1277,19 @@ class Panel:
                         elif t == DataType.Levels:
                             # Optional: show constant level(s)
                             row_y = self.BuildPanelInfoLevels(item, dl, label_x, value_x, row_y)
+                        elif t == DataType.EquityOverlay:
+                            row_y = self.BuildPanelInfoEquity(idx, item, dl, label_x, value_x, row_y)
                     except Exception as e:
-                        try:
-                            print(f"[DEBUG] Build info for {item.label} failed at idx={idx}: {e}")
-                        except Exception:
-                            pass
+                        logger.debug("Build info for %s failed at idx=%s: %s", item.label, idx, e)
 
             # BarIndex
             dl.add_text(ImVec2(label_x, row_y), 0xFFFFFFFF, "BarIndex")
             try:
                 dl.add_text(imgui.ImVec2(value_x, row_y), 0xFFFFFFFF, f" : {idx}")
             except Exception as e:
-                try:
-                    print(f"[DEBUG] Failed to draw BarIndex at idx={idx}: {e}")
-                except Exception:
-                    pass
+                logger.debug("Failed to draw BarIndex at idx=%s: %s", idx, e)
         except Exception as e:
-            try:
-                print(f"[DEBUG] BuildPanelInfo error: {e}")
-            except Exception:
-                pass
+            logger.debug("BuildPanelInfo error: %s", e)
 
     def BuildPanelInfoOHLC(self, idx: int, ohlc_src: np.ndarray, shared_crosshair: Dict[str, Any], dl, label_x: float, value_x: float, row_y: float) -> float:
         """Draw OHLC specific info and return updated row_y."""
@@ -324,7 +1374,7 @@ class Panel:
     def BuildPanelInfoVolume(self, idx: int, item: 'DataItem', dl, label_x: float, value_x: float, row_y: float) -> float:
         """Show the value of a Volume or Histogram item at idx (single item)."""
         try:
-            arr = np.array(item.data).reshape(-1)
+            arr = item.data
             val = None
             if 0 <= idx < len(arr):
                 val = float(arr[idx])
@@ -342,7 +1392,7 @@ class Panel:
 
     def BuildPanelInfoLine(self, idx: int, item: 'DataItem', dl, label_x: float, value_x: float, row_y: float) -> float:
         try:
-            arr = np.array(item.data).reshape(-1)
+            arr = item.data
             val = None
             if 0 <= idx < len(arr):
                 val = float(arr[idx])
@@ -355,7 +1405,7 @@ class Panel:
 
     def BuildPanelInfoHistogram(self, idx: int, item: 'DataItem', dl, label_x: float, value_x: float, row_y: float) -> float:
         try:
-            arr = np.array(item.data).reshape(-1)
+            arr = item.data
             val = None
             if 0 <= idx < len(arr):
                 val = float(arr[idx])
@@ -369,10 +1419,7 @@ class Panel:
     def BuildPanelInfoSignals(self, idx: int, item: 'DataItem', dl, label_x: float, value_x: float, row_y: float) -> float:
         try:
             x_indices, y_values, signal_types = item.data
-            x_indices = np.array(x_indices).astype(int)
-            y_values = np.array(y_values).reshape(-1)
-            signal_types = np.array(signal_types).astype(int)
-            match = np.where(x_indices == idx)[0]
+            match = np.flatnonzero(x_indices == idx)
             if len(match) > 0:
                 i = int(match[0])
                 sig = int(signal_types[i])
@@ -400,10 +1447,25 @@ class Panel:
             pass
         return row_y
 
+    def BuildPanelInfoEquity(self, idx: int, item: 'DataItem', dl, label_x: float, value_x: float, row_y: float) -> float:
+        """Show p95/p50/p5 of an EquityOverlay item at the base bucket containing idx."""
+        try:
+            overlay = item.data
+            if not 0 <= idx < overlay.n_bars:
+                return row_y
+            js = np.array([idx // overlay.base_step])
+            for name, q in (("p95", 0.95), ("p50", 0.50), ("p5", 0.05)):
+                dl.add_text(ImVec2(label_x, row_y), 0xFFFFFFFF, f"{item.label} {name}")
+                dl.add_text(imgui.ImVec2(value_x, row_y), 0xFFFFFFFF, f" : {float(overlay.percentiles(js, q)[0]):.2f}")
+                row_y += 16
+        except Exception:
+            pass
+        return row_y
+
     def BuildPanelInfoStairs(self, idx: int, item: 'DataItem', dl, label_x: float, value_x: float, row_y: float) -> float:
-        """Show the original (unscaled) value of a Stairs item at idx."""
+        """Show the value of a Stairs item at idx."""
         try:
-            arr = np.array(item.data).reshape(-1)
+            arr = item.data
             val = None
             if 0 <= idx < len(arr):
                 val = int(arr[idx])  # Stairs values are typically integers (-1, 0, 1)
@@ -486,14 +1548,38 @@ class Panel:
         except Exception:
             pass
 
-    def _fmt_time_label(self, idx: int, shared_labels: Optional[List[str]] = None) -> str:
+    def BuildProfilerInfoBottomRight(self, stats: List[Tuple[str, float, float]]) -> None:
+        """Draw rolling per-stage p50/p99 (ms) of this panel just above the LOD info box."""
+        if not stats:
+            return
+        try:
+            dl = implot.get_plot_draw_list()
+            plot_pos = implot.get_plot_pos()
+            plot_size = implot.get_plot_size()
+
+            lines = [f"{stage:<8} p50 {p50:6.2f}  p99 {p99:6.2f} ms" for stage, p50, p99 in stats]
+            text = "\n".join(lines)
+            text_size = imgui.calc_text_size(text)
+            lod_height = imgui.get_text_line_height()
+            margin = 8.0
+            base_x = plot_pos.x + plot_size.x - text_size.x - margin
+            base_y = plot_pos.y + plot_size.y - lod_height - margin - 6.0 - text_size.y
+            bg_min = ImVec2(base_x - 5, base_y - 2)
+            bg_max = ImVec2(base_x + text_size.x + 5, base_y + text_size.y + 2)
+            dl.add_rect_filled(bg_min, bg_max, 0xAA000000, 4)
+            dl.add_text(ImVec2(base_x, base_y), 0xFFFFCC66, text)
+        except Exception:
+            pass
+
+    def _fmt_time_label(self, idx: int, shared_labels: Any = None) -> str:
         """Format x-axis label from CSVReader date/time if available."""
         try:
-            # Prefer explicit datetime labels if provided
-            if self.datetime_labels is not None and 0 <= idx < len(self.datetime_labels):
-                return str(self.datetime_labels[idx])
-            if shared_labels is not None and 0 <= idx < len(shared_labels):
-                return str(shared_labels[idx])
+            # Prefer explicit datetime labels if provided (epoch sources are formatted here, on demand)
+            label = _format_datetime_label(self.datetime_labels, idx)
+            if label is None:
+                label = _format_datetime_label(shared_labels, idx)
+            if label is not None:
+                return label
             # C# verileriyle çalışıyoruz - bars yok
                 b = self.ohlc_data.bars[idx]
                 # Expecting b.date like YYYY.MM.DD and b.time like HH:MM:SS
@@ -503,24 +1589,19 @@ class Panel:
         return str(idx)
 
     def setDateTime(self, labels: Any):
-        """Set pre-formatted datetime labels for X-axis.
+        """Set datetime source for X-axis.
 
-        labels can be a list/array of strings like "YYYY.MM.DD HH:MM:SS" matching data length.
+        labels can be a list/array of strings like "YYYY.MM.DD HH:MM:SS" matching data length,
+        or an int64 epoch-seconds / datetime64 array, which is kept as-is and formatted lazily.
         """
         try:
-            if labels is None:
-                self.datetime_labels = None
-                return
-            # Convert to list of strings
-            if isinstance(labels, np.ndarray):
-                self.datetime_labels = [str(x) for x in labels.tolist()]
-            else:
-                self.datetime_labels = [str(x) for x in list(labels)]
+            self.datetime_labels = _to_datetime_source(labels)
         except Exception:
             # Fallback: store nothing
             self.datetime_labels = None
 
-    def setData(self, index: int, data_type: DataType, data: Any, label: str = "", color: Optional[Tuple] = None):
+    def setData(self, index: int, data_type: DataType, data: Any, label: str = "", color: Optional[Tuple] = None,
+                lod_mode: Optional[LODMode] = None, dtype: Any = None):
         """
         Add data to panel.
 
@@ -535,69 +1616,194 @@ class Panel:
                 - Levels: list of Y values for horizontal lines
                 - Histogram: np.ndarray of values (can be positive/negative)
                 - TradeSignals: tuple of (x_indices, y_values, signal_types)
+                - EquityOverlay: (runs, bars) matrix of curves (see setEquityCurves)
             label: Label for legend
             color: Optional RGBA tuple (0.0-1.0)
+            lod_mode: Optional LODMode for line-like series (None = plotter default)
+            dtype: Storage dtype of the value arrays (None = the panel's storage dtype for the
+                   item role: "volume" for Volume, "signal" for Stairs, "series" otherwise;
+                   data is normalised once, see _normalize_item_data)
         """
-        item = DataItem(index, data_type, data, label, color)
+        if data_type == DataType.EquityOverlay:
+            self.setEquityCurves(index, data, label or "Equity", color, lod_mode=lod_mode)
+            return
+        if dtype is None:
+            dtype = self.storage_dtypes[_ITEM_STORAGE_ROLES.get(data_type, "series")]
+        data = self._normalize_item_data(data_type, data, dtype)
+        item = DataItem(index, data_type, data, label, color, lod_mode)
+        item.value_range = self._item_value_range(data_type, data)
+        try:
+            item.range_index = self._build_item_range_index(data_type, data)
+        except Exception:
+            item.range_index = None
+        if data_type == DataType.Stairs:
+            try:
+                item.transitions = _StepTransitions(data)
+            except Exception:
+                item.transitions = None
         self.data_items.append(item)
         # Sort by index to maintain order
         self.data_items.sort(key=lambda x: x.index)
+        self.data_version += 1
+
+    def setEquityCurves(self, index: int, curves: Any, label: str = "Equity",
+                        color: Optional[Tuple] = None, mode: str = "bands", top_k: int = 5,
+                        scores: Any = None, lod_mode: Optional[LODMode] = None, max_buckets: int = 16384):
+        """
+        Add many equity curves as one item, e.g. the BakiyeFiyatList of every optimizer run.
+
+        curves is a (runs, bars) matrix and may be memory-mapped (np.load(mmap_mode='r'));
+        it is summarised once per LOD bucket (see _EquityOverlay) and not copied.
+        mode "bands" draws the p5-p95 band and the p50 line, "heatmap" the share of runs
+        per Y bin. The top_k runs by scores (default: final value) are drawn as lines.
+        """
+        if mode not in _EquityOverlay.MODES:
+            logger.warning("setEquityCurves: unknown mode %r, using 'bands'", mode)
+            mode = "bands"
+        overlay = _EquityOverlay(curves, top_k=top_k, scores=scores, max_buckets=max_buckets)
+        overlay.mode = mode
+        item = DataItem(index, DataType.EquityOverlay, overlay, label, color, lod_mode)
+        item.range_index = overlay  # query(start, end): min/max over all runs
+        lo, hi = overlay.query(0, overlay.n_bars)
+        item.value_range = (lo, hi) if lo <= hi else None
+        self.data_items.append(item)
+        self.data_items.sort(key=lambda x: x.index)
+        self.data_version += 1
+
+    def setEquityOverlayMode(self, index: int, mode: str):
+        """Switch the EquityOverlay item with this index between "bands" and "heatmap"."""
+        item = next((it for it in self.data_items
+                     if it.index == index and it.data_type == DataType.EquityOverlay), None)
+        if item is None or mode not in _EquityOverlay.MODES:
+            logger.warning("setEquityOverlayMode: panel %s has no overlay %s or bad mode %r", self.index, index, mode)
+            return
+        item.data.mode = mode
+        self.data_version += 1
+
+    @staticmethod
+    def _normalize_item_data(data_type: DataType, data: Any, dtype: Any = np.float64) -> Any:
+        """
+        Convert a setData payload once into contiguous 1-D numpy arrays.
+
+        Value arrays use dtype (no copy when the source already matches); Bands
+        become a tuple of two arrays, TradeSignals (int64 x, dtype y, int64 type).
+        Render and info paths then index item.data directly instead of converting
+        the whole series every frame.
+        """
+        def values(arr):
+            return np.ascontiguousarray(np.asarray(arr, dtype=dtype).reshape(-1))
+
+        if data_type == DataType.Bands:
+            upper_data, lower_data = data
+            return values(upper_data), values(lower_data)
+        if data_type == DataType.TradeSignals:
+            x_indices, y_values, signal_types = data
+            return (np.ascontiguousarray(np.asarray(x_indices, dtype=np.int64).reshape(-1)),
+                    values(y_values),
+                    np.ascontiguousarray(np.asarray(signal_types, dtype=np.int64).reshape(-1)))
+        if data_type == DataType.Levels:
+            return np.asarray(data, dtype=np.float64).reshape(-1)
+        return values(data)
+
+    @staticmethod
+    def _item_value_range(data_type: DataType, data: Any) -> Optional[Tuple[float, float]]:
+        """Global (min, max) of an item's values ignoring NaNs; None when there are none."""
+        if data_type == DataType.TradeSignals:
+            return None
+        parts = data if data_type == DataType.Bands else (data,)
+        lo, hi = float("inf"), float("-inf")
+        for part in parts:
+            if len(part) == 0 or not np.issubdtype(part.dtype, np.number):
+                continue
+            with np.errstate(invalid="ignore"):
+                part_lo, part_hi = float(np.fmin.reduce(part)), float(np.fmax.reduce(part))
+            if np.isfinite(part_lo):
+                lo = min(lo, part_lo)
+            if np.isfinite(part_hi):
+                hi = max(hi, part_hi)
+        return (lo, hi) if lo <= hi else None
+
+    @staticmethod
+    def _visible_window(time_data: np.ndarray, visible_range: Tuple[float, float]) -> Tuple[int, int]:
+        """
+        Return the [start, end) index window of time_data inside visible_range.
+
+        time_data is monotonic (bar indices), so two binary searches replace the
+        full-array boolean mask; the same window is shared by every item of a panel.
+        """
+        start = int(np.searchsorted(time_data, visible_range[0], side="left"))
+        end = int(np.searchsorted(time_data, visible_range[1], side="right"))
+        return start, max(start, end)
+
+    def _cached_lod(self, slot: Tuple, key: Tuple, compute: Callable[[], Tuple[np.ndarray, np.ndarray]],
+                    profiler: Optional[_FrameProfiler] = None):
+        """
+        Return the LOD output stored for slot if it was computed with the same key,
+        otherwise run compute() and store it.
+
+        key is (visible range, pixel width, bar count, data version, ...), so an idle
+        frame with no pan/zoom/resize/append reuses the previous arrays. Outputs that
+        are slices of read-only data (memory-mapped sessions, the shared OHLC view)
+        are copied once here; they are at most a few points per pixel.
+        """
+        t0 = _FrameProfiler.now() if profiler is not None else 0
+        cached = self._lod_cache.get(slot)
+        if cached is not None and cached[0] == key:
+            result = cached[1]
+        else:
+            result = tuple(_plottable(arr) for arr in compute())
+            self._lod_cache[slot] = (key, result)
+        if profiler is not None:
+            profiler.lap(self.index, "lod", t0)
+        return result
 
     def _calculate_lod_ohlc(self, time_data: np.ndarray, ohlc: np.ndarray,
-                            visible_range: Tuple[float, float], plot_width_pixels: float) -> Tuple[np.ndarray, np.ndarray]:
+                            visible_range: Tuple[float, float], plot_width_pixels: float,
+                            window: Optional[Tuple[int, int]] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Calculate LOD for OHLC data (from existing plotOhlcDataWithLOD logic).
+        Calculate LOD for OHLC data using the precomputed OHLC pyramid.
+
+        The visible window is located with a binary search on time_data (monotonic)
+        and the pyramid level is chosen from the bars-per-pixel ratio, so the cost
+        depends on the number of plotted candles rather than the total bar count.
 
         Returns:
             Tuple of (lod_time, lod_ohlc)
         """
-        x_min, x_max = visible_range
+        start, end = window if window is not None else self._visible_window(time_data, visible_range)
+        end = min(end, len(time_data), len(ohlc))
 
-        # Filter visible range
-        visible_mask = (time_data >= x_min) & (time_data <= x_max)
-        visible_indices = np.where(visible_mask)[0]
-
-        if len(visible_indices) == 0:
+        if end <= start:
             return np.array([]), np.array([]).reshape(0, 4)
 
-        visible_time = time_data[visible_indices]
-        visible_ohlc = ohlc[visible_indices]
-
         # Calculate bars per pixel
-        num_visible_bars = len(visible_time)
+        num_visible_bars = end - start
         bars_per_pixel = num_visible_bars / plot_width_pixels if plot_width_pixels > 0 else 0
 
         # LOD threshold
         if bars_per_pixel <= 1.0:
-            return visible_time, visible_ohlc
+            return time_data[start:end], ohlc[start:end]
 
-        # Downsampling
-        target_bars = int(plot_width_pixels * 1.5)
+        # Downsampling: pick the pyramid level closest to the target bucket size
+        target_bars = max(1, int(plot_width_pixels * 1.5))
         step = max(1, num_visible_bars // target_bars)
 
-        lod_time = []
-        lod_ohlc = []
+        pyramid = self._get_ohlc_pyramid(ohlc)
+        level = pyramid.level_for_step(step)
+        bucket_starts, lod_ohlc = pyramid.window(level, start, end)
 
-        for i in range(0, num_visible_bars, step):
-            chunk_end = min(i + step, num_visible_bars)
-            chunk = visible_ohlc[i:chunk_end]
-
-            # Aggregate: first open, max high, min low, last close
-            o = chunk[0, 0]
-            h = np.max(chunk[:, 1])
-            l = np.min(chunk[:, 2])
-            c = chunk[-1, 3]
-
-            lod_time.append(visible_time[i])
-            lod_ohlc.append([o, h, l, c])
-
-        return np.array(lod_time), np.array(lod_ohlc)
+        return time_data[bucket_starts], lod_ohlc
 
     def _calculate_lod_line(self, x_data: np.ndarray, y_data: np.ndarray,
-                            visible_range: Tuple[float, float], plot_width_pixels: float) -> Tuple[np.ndarray, np.ndarray]:
+                            visible_range: Tuple[float, float], plot_width_pixels: float,
+                            lod_mode: Optional[LODMode] = None,
+                            window: Optional[Tuple[int, int]] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Calculate LOD for line data using min-max preserving downsampling.
 
+        With lod_mode=LODMode.M4 every pixel column keeps its first/min/max/last
+        sample instead, which is pixel-perfect at one bucket per pixel.
+
         Returns:
             Tuple of (lod_x, lod_y)
         """
@@ -613,15 +1819,22 @@ class Panel:
 
         x_min, x_max = visible_range
 
-        # Filter visible range and NaN values
-        visible_mask = (x_data >= x_min) & (x_data <= x_max) & (~np.isnan(y_data))
-        visible_indices = np.where(visible_mask)[0]
-
-        if len(visible_indices) == 0:
+        # Slice the visible window, then drop NaN values from the slice only
+        start, end = window if window is not None else self._visible_window(x_data, visible_range)
+        end = min(end, len(x_data), len(y_data))
+        if end <= start:
             return np.array([]), np.array([])
 
-        visible_x = x_data[visible_indices]
-        visible_y = y_data[visible_indices]
+        # float64 for ImPlot; storage may be float32 (no copy when already float64)
+        visible_x = np.asarray(x_data[start:end], dtype=np.float64)
+        visible_y = np.asarray(y_data[start:end], dtype=np.float64)
+        finite = ~np.isnan(visible_y)
+        if not finite.all():
+            visible_x = visible_x[finite]
+            visible_y = visible_y[finite]
+
+        if len(visible_x) == 0:
+            return np.array([]), np.array([])
 
         # Calculate points per pixel
         num_visible_points = len(visible_x)
@@ -631,33 +1844,20 @@ class Panel:
         if points_per_pixel <= 2.0:
             return visible_x, visible_y
 
+        if lod_mode == LODMode.M4:
+            keep = _m4_indices(visible_x, visible_y, x_min, x_max, int(plot_width_pixels))
+            return visible_x[keep], visible_y[keep]
+
         # Downsampling with min-max preservation
         target_points = int(plot_width_pixels * 2.0)
         step = max(1, num_visible_points // target_points)
 
-        lod_x = []
-        lod_y = []
-
-        for i in range(0, num_visible_points, step):
-            chunk_end = min(i + step, num_visible_points)
-            chunk_y = visible_y[i:chunk_end]
-
-            # Add min and max points to preserve shape
-            min_idx = i + np.argmin(chunk_y)
-            max_idx = i + np.argmax(chunk_y)
-
-            # Add in order
-            if min_idx < max_idx:
-                lod_x.extend([visible_x[min_idx], visible_x[max_idx]])
-                lod_y.extend([visible_y[min_idx], visible_y[max_idx]])
-            else:
-                lod_x.extend([visible_x[max_idx], visible_x[min_idx]])
-                lod_y.extend([visible_y[max_idx], visible_y[min_idx]])
-
-        return np.array(lod_x), np.array(lod_y)
+        keep = _minmax_decimation_indices(visible_y, step)
+        return visible_x[keep], visible_y[keep]
 
     def _calculate_lod_bars(self, x_data: np.ndarray, y_data: np.ndarray,
-                           visible_range: Tuple[float, float], plot_width_pixels: float) -> Tuple[np.ndarray, np.ndarray]:
+                           visible_range: Tuple[float, float], plot_width_pixels: float,
+                           window: Optional[Tuple[int, int]] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Calculate LOD for bar data (volume, histogram) using max preserving downsampling.
 
@@ -674,17 +1874,14 @@ class Panel:
         # except Exception:
         #     y_data = np.array([], dtype=np.float64)
 
-        x_min, x_max = visible_range
-
-        # Filter visible range
-        visible_mask = (x_data >= x_min) & (x_data <= x_max)
-        visible_indices = np.where(visible_mask)[0]
-
-        if len(visible_indices) == 0:
+        # Slice the visible window (binary search, no full-array mask)
+        start, end = window if window is not None else self._visible_window(x_data, visible_range)
+        end = min(end, len(x_data), len(y_data))
+        if end <= start:
             return np.array([]), np.array([])
 
-        visible_x = x_data[visible_indices]
-        visible_y = y_data[visible_indices]
+        visible_x = x_data[start:end]
+        visible_y = np.asarray(y_data[start:end])
 
         # Calculate bars per pixel
         num_visible_bars = len(visible_x)
@@ -714,96 +1911,230 @@ class Panel:
         return np.array(lod_x), np.array(lod_y)
 
     def _calculate_lod_stairs(self, x_data: np.ndarray, y_data: np.ndarray,
-                             visible_range: Tuple[float, float], plot_width_pixels: float) -> Tuple[np.ndarray, np.ndarray]:
+                             visible_range: Tuple[float, float], plot_width_pixels: float,
+                             window: Optional[Tuple[int, int]] = None,
+                             transitions: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Calculate LOD for stairs/step data (trade signals) preserving value transitions.
-        Critical for step plots where horizontal-to-vertical transitions must be preserved.
+
+        A step series is fully described by its first sample, the samples where the
+        value changes and its last sample, so every transition is kept. transitions
+        (positions with y[i] != y[i-1], see _StepTransitions) is searched with two
+        binary searches; without it the visible window is scanned once. When there
+        are more transitions than the plot can resolve, each pixel column keeps only
+        its first/min/max/last transition (M4), which draws the same pixels and
+        bounds the output to ~4 points per pixel.
 
         Returns:
             Tuple of (lod_x, lod_y)
         """
-        # # Ensure numpy arrays (handle callers passing Python lists)
-        # try:
-        #     x_data = np.asarray(x_data, dtype=np.float64)
-        # except Exception:
-        #     x_data = np.array([], dtype=np.float64)
-        # try:
-        #     y_data = np.asarray(y_data, dtype=np.float64)
-        # except Exception:
-        #     y_data = np.array([], dtype=np.float64)
-
-        x_min, x_max = visible_range
-
-        # Filter visible range
-        visible_mask = (x_data >= x_min) & (x_data <= x_max)
-        visible_indices = np.where(visible_mask)[0]
-
-        if len(visible_indices) == 0:
+        start, end = window if window is not None else self._visible_window(x_data, visible_range)
+        end = min(end, len(x_data), len(y_data))
+        if end <= start:
             return np.array([]), np.array([])
 
-        visible_x = x_data[visible_indices]
-        visible_y = y_data[visible_indices]
-
-        # Calculate points per pixel
-        num_visible_points = len(visible_x)
-        points_per_pixel = num_visible_points / plot_width_pixels if plot_width_pixels > 0 else 0
-
-        # LOD threshold
-        if points_per_pixel <= 2.0:
-            return visible_x, visible_y
-
-        # Downsampling with value transition preservation
-        target_points = int(plot_width_pixels * 2.0)
-        step = max(1, num_visible_points // target_points)
+        if transitions is not None:
+            lo = int(np.searchsorted(transitions, start, side="right"))
+            hi = int(np.searchsorted(transitions, end - 1, side="right"))
+            changes = transitions[lo:hi]
+        else:
+            changes = np.flatnonzero(np.diff(np.asarray(y_data[start:end]))) + (start + 1)
+
+        # First sample, every transition, last sample (keeps the final step's extent)
+        indices = np.empty(len(changes) + 2, dtype=np.int64)
+        indices[0] = start
+        indices[1:-1] = changes
+        indices[-1] = end - 1
+        if indices[-2] == indices[-1]:
+            indices = indices[:-1]
+
+        n_columns = max(1, int(plot_width_pixels))
+        if len(indices) > 4 * n_columns:
+            y_sel = np.asarray(y_data[indices], dtype=np.float64)
+            if not np.all(np.isfinite(y_sel)):
+                y_sel = np.nan_to_num(y_sel)
+            indices = indices[_m4_indices(np.asarray(x_data[indices], dtype=np.float64), y_sel,
+                                          float(x_data[start]), float(x_data[end - 1]), n_columns)]
+
+        return (np.asarray(x_data[indices], dtype=np.float64),
+                np.asarray(y_data[indices], dtype=np.float64))
+
+    def _render_signal_segments(self, segments: Optional[_SignalSegments], ohlc: np.ndarray,
+                                visible_range: Tuple[float, float]) -> None:
+        """
+        Draw a horizontal line over every LONG/SHORT run in view.
 
-        lod_x = []
-        lod_y = []
+        LONG runs sit just above the High of their first bar (green), SHORT runs just
+        below its Low (red). Visible runs come from the precomputed segments with two
+        binary searches and each side is one segments polyline with a fixed hidden
+        label, so the ImPlot item count does not grow with the number of trades.
+        """
+        if segments is None:
+            return
+        start = max(0, int(np.floor(visible_range[0])))
+        end = min(len(ohlc), int(np.ceil(visible_range[1])) + 1)
+        if end <= start:
+            return
+        starts, ends, sides = segments.visible(start, end)
+        keep = starts < len(ohlc)
+        starts, ends, sides = starts[keep], ends[keep], sides[keep]
+        if len(starts) == 0:
+            return
 
-        for i in range(0, num_visible_points, step):
-            chunk_end = min(i + step, num_visible_points)
-            chunk_y = visible_y[i:chunk_end]
+        y_offset = 0.001  # Fraction of the first bar's range, visual separation from candlesticks
+        high = np.asarray(ohlc[starts, 1], dtype=np.float64)
+        low = np.asarray(ohlc[starts, 2], dtype=np.float64)
+        offset = (high - low) * y_offset
+        segments_flag = implot.LineFlags_.segments.value
+        for side, label, color in (
+            (1, "##Signal_Long", imgui.ImVec4(0.0, 1.0, 0.0, 1.0)),    # GREEN above the high
+            (-1, "##Signal_Short", imgui.ImVec4(1.0, 0.0, 0.0, 1.0)),  # RED below the low
+        ):
+            mask = sides == side
+            if not np.any(mask):
+                continue
+            y = high[mask] + offset[mask] if side == 1 else low[mask] - offset[mask]
+            xs = np.column_stack((starts[mask], ends[mask])).astype(np.float64).ravel()
+            ys = np.repeat(y, 2)
+            implot.set_next_line_style(color, 2.0)
+            implot.plot_line(label, xs, ys, segments_flag)
+
+    def _render_equity_overlay(self, item_pos: int, item: DataItem, time_data: np.ndarray,
+                               visible_range: Tuple[float, float], plot_width_pixels: float,
+                               visible_window: Tuple[int, int], lod_key: Tuple, lod_mode: LODMode,
+                               profiler: Optional[_FrameProfiler]) -> int:
+        """
+        Draw an EquityOverlay item: p5-p95 band + p50 line or density heatmap, then the
+        top-K runs. Returns the number of plotted points per curve.
+        """
+        overlay: _EquityOverlay = item.data
+        color = item.color if item.color else (0.3, 0.6, 1.0, 1.0)
+        start, end = visible_window
+
+        def sample_x(js: np.ndarray) -> np.ndarray:
+            idx = overlay.sample_index[js]
+            if len(time_data) >= overlay.n_bars:
+                return np.asarray(time_data[idx], dtype=np.float64)
+            return idx.astype(np.float64)
+
+        plotted = 0
+        if overlay.mode == "heatmap":
+            # Cell rows follow the current Y limits; ~3 px wide columns keep the cell count low
+            y_lim = implot.get_plot_limits().y
+            y_lo, y_hi = float(y_lim.min), float(y_lim.max)
+
+            def density():
+                js = overlay.columns(start, end, max(1, int(plot_width_pixels) // 3))
+                return sample_x(js), overlay.density(js, y_lo, y_hi, 64)
+
+            x, values = self._cached_lod(("item", item_pos, "density"), lod_key + (y_lo, y_hi), density, profiler)
+            if len(x) > 1 and y_hi > y_lo:
+                implot.push_colormap(implot.Colormap_.viridis.value)
+                implot.plot_heatmap(item.label, values, 0.0, max(float(values.max()), 1e-9), "",
+                                    implot.Point(float(x[0]), y_lo), implot.Point(float(x[-1]), y_hi))
+                implot.pop_colormap()
+                plotted = len(x)
+        else:
+            def bands():
+                js = overlay.columns(start, end, max(1, int(plot_width_pixels)))
+                return (sample_x(js), overlay.percentiles(js, 0.05),
+                        overlay.percentiles(js, 0.50), overlay.percentiles(js, 0.95))
+
+            x, p5, p50, p95 = self._cached_lod(("item", item_pos, "bands"), lod_key, bands, profiler)
+            if len(x) > 0:
+                implot.set_next_fill_style(imgui.ImVec4(color[0], color[1], color[2], 0.25))
+                implot.plot_shaded(f"{item.label} p5-p95", x, p5, p95)
+                implot.set_next_line_style(imgui.ImVec4(*color), 2.0)
+                implot.plot_line(f"{item.label} p50", x, p50)
+                plotted = len(x)
+
+        # Top-K runs at full resolution (same LOD as Line items)
+        for k, (run, curve) in enumerate(zip(overlay.top_runs, overlay.top_curves)):
+            lod_x, lod_y = self._cached_lod(
+                ("item", item_pos, "top", k),
+                lod_key + (lod_mode,),
+                lambda: self._calculate_lod_line(time_data, curve, visible_range, plot_width_pixels,
+                                                 lod_mode, visible_window),
+                profiler
+            )
+            if len(lod_x) > 0:
+                implot.set_next_line_style(imgui.ImVec4(*_EquityOverlay.TOP_COLORS[k % len(_EquityOverlay.TOP_COLORS)]), 1.5)
+                implot.plot_line(f"{item.label} #{int(run)}", lod_x, lod_y)
+                plotted = max(plotted, len(lod_x))
+        return plotted
+
+    def _render_candles(self, lod_time: np.ndarray, lod_ohlc: np.ndarray,
+                        signals_array: Optional[np.ndarray], x_limits: Tuple[float, float]) -> None:
+        """
+        Draw candlesticks with a handful of batched ImPlot calls.
 
-            # For stairs, preserve value changes within chunk
-            if len(chunk_y) > 1:
-                transitions = np.where(chunk_y[:-1] != chunk_y[1:])[0]
-                
-                # If too many transitions (noisy data), fallback to Min/Max preservation
-                # This prevents generating millions of points for 2M datasets
-                if len(transitions) > 4:
-                    # Find indices of min and max values to capture the range
-                    min_idx = np.argmin(chunk_y)
-                    max_idx = np.argmax(chunk_y)
-                    
-                    indices_to_keep = sorted(list(set([0, min_idx, max_idx, len(chunk_y) - 1])))
-                    
-                    for idx in indices_to_keep:
-                        lod_x.append(visible_x[i + idx])
-                        lod_y.append(visible_y[i + idx])
-                
-                elif len(transitions) > 0:
-                    # Include first point, all transition points, and last point
-                    indices_to_keep = [0]
-                    indices_to_keep.extend(transitions.tolist())
-                    indices_to_keep.extend((transitions + 1).tolist())
-                    if (len(chunk_y) - 1) not in indices_to_keep:
-                        indices_to_keep.append(len(chunk_y) - 1)
-
-                    # Remove duplicates and sort
-                    indices_to_keep = sorted(set(indices_to_keep))
-
-                    for idx in indices_to_keep:
-                        lod_x.append(visible_x[i + idx])
-                        lod_y.append(visible_y[i + idx])
-                else:
-                    # No transitions in this chunk, just keep first point
-                    lod_x.append(visible_x[i])
-                    lod_y.append(visible_y[i])
-            else:
-                # Single point in chunk
-                lod_x.append(visible_x[i])
-                lod_y.append(visible_y[i])
+        Candles are grouped by colour (bull/long = green, bear/short = red,
+        flat signal = white, see _candle_color_classes). Per colour group the wicks and the hollow bullish
+        bodies are drawn as one segment polyline each, and the filled bearish
+        bodies as one error-bar item whose line weight equals the body width.
+        All items share the "OHLC" label so they toggle together in the legend.
+        """
+        n = len(lod_time)
+        if n == 0:
+            return
+        x = np.asarray(lod_time, dtype=np.float64)
+        o = np.asarray(lod_ohlc[:, 0], dtype=np.float64)
+        h = np.asarray(lod_ohlc[:, 1], dtype=np.float64)
+        l = np.asarray(lod_ohlc[:, 2], dtype=np.float64)
+        c = np.asarray(lod_ohlc[:, 3], dtype=np.float64)
+        bullish = c >= o
+
+        # Colour class per candle: 0 = green, 1 = red, 2 = white
+        color_class = _candle_color_classes(x, bullish, signals_array)
+
+        colors = (
+            imgui.ImVec4(0.0, 1.0, 0.0, 1.0),  # Green (bullish / LONG)
+            imgui.ImVec4(1.0, 0.0, 0.0, 1.0),  # Red (bearish / SHORT)
+            imgui.ImVec4(1.0, 1.0, 1.0, 1.0),  # White (FLAT signal)
+        )
 
-        return np.array(lod_x), np.array(lod_y)
+        body_width = 0.6
+        half = body_width / 2
+        # Body width in pixels for the filled (error bar) bodies
+        try:
+            x_span = float(x_limits[1] - x_limits[0])
+            px_per_unit = implot.get_plot_size().x / x_span if x_span > 0 else 1.0
+        except Exception:
+            px_per_unit = 1.0
+        body_px = max(1.0, body_width * px_per_unit)
+
+        label = "OHLC"
+        segments = implot.LineFlags_.segments.value
+        for cls, color in enumerate(colors):
+            in_class = color_class == cls
+            if not np.any(in_class):
+                continue
+
+            # High-Low wicks: one segment per candle
+            xs = np.repeat(x[in_class], 2)
+            ys = np.column_stack((l[in_class], h[in_class])).ravel()
+            implot.set_next_line_style(color, 1.0)
+            implot.plot_line(label, xs, ys, segments)
+
+            # Bullish bodies: hollow outline (4 segments per candle)
+            hollow = in_class & bullish
+            if np.any(hollow):
+                xl = x[hollow] - half
+                xr = x[hollow] + half
+                ob = o[hollow]
+                cb = c[hollow]
+                xs = np.column_stack((xl, xr, xr, xr, xr, xl, xl, xl)).ravel()
+                ys = np.column_stack((ob, ob, ob, cb, cb, cb, cb, ob)).ravel()
+                implot.set_next_line_style(color, 2.0)
+                implot.plot_line(label, xs, ys, segments)
+
+            # Bearish bodies: filled, drawn as thick error bars from close to open
+            filled = in_class & ~bullish
+            if np.any(filled):
+                mid = 0.5 * (o[filled] + c[filled])
+                err = 0.5 * (o[filled] - c[filled])
+                implot.set_next_error_bar_style(imgui.ImVec4(color.x, color.y, color.z, 0.8), 0.0, body_px)
+                implot.plot_error_bars(label, x[filled], mid, err)
 
     def render(
         self,
@@ -813,7 +2144,7 @@ class Panel:
         visible_count: int,
         needs_update: bool,
         desired_size: Optional[Tuple[float, float]] = None,
-        shared_labels: Optional[List[str]] = None,
+        shared_labels: Any = None,
         shared_crosshair: Optional[Dict[str, Any]] = None,
         shared_lod: Optional[Dict[str, Any]] = None,
         event_handler: Optional[Callable[[Dict[str, Any]], None]] = None,
@@ -834,6 +2165,9 @@ class Panel:
             panel_y_overrides: Per-panel Y override dict {panel_idx: (y_min, y_max)}
         """
         # Check if this panel has X override (from UpdateOtherPlotsX or hover sync)
+        # Opt-in stage timing (DataPlotterImgBundleNew.enableProfiler)
+        profiler: Optional[_FrameProfiler] = shared_lod.get("profiler") if shared_lod is not None else None
+
         has_x_override = False
         if panel_x_overrides is not None and self.index in panel_x_overrides:
             offset, visible_count = panel_x_overrides[self.index]
@@ -874,73 +2208,17 @@ class Panel:
         x_min = float(offset)
         x_max = float(offset + visible_count)
 
-        # Calculate Y-axis limits from ALL visible data in this panel (vectorized, no Python loops over elements)
-        y_min = float('inf')
-        y_max = float('-inf')
-
-        # Collect Y min/max from OHLC data (from array or reader)
-        ohlc_src = None
-        if self.ohlc_array is not None:
-            ohlc_src = self.ohlc_array
-        elif self.ohlc_data is not None:
-            ohlc_src = self.ohlc_data.ohlc
-        if ohlc_src is not None:
-            start_idx = max(0, offset)
-            end_idx = min(len(ohlc_src), offset + visible_count)
-            if end_idx > start_idx:
-                visible_ohlc = ohlc_src[start_idx:end_idx]
-                try:
-                    y_max = max(y_max, float(np.max(visible_ohlc[:, 1])))  # High
-                    y_min = min(y_min, float(np.min(visible_ohlc[:, 2])))  # Low
-                except Exception:
-                    pass
-
-        # Collect Y min/max from data items
-        for item in self.data_items:
-            try:
-                if item.data_type in [DataType.Line, DataType.PnL, DataType.Balance]:
-                    # Single line data
-                    start_idx = max(0, offset)
-                    end_idx = min(len(item.data), offset + visible_count)
-                    if end_idx > start_idx:
-                        visible_data = np.asarray(item.data[start_idx:end_idx], dtype=np.float64)
-                        if visible_data.size > 0:
-                            # Ignore NaNs in min/max
-                            if np.any(~np.isnan(visible_data)):
-                                y_min = min(y_min, float(np.nanmin(visible_data)))
-                                y_max = max(y_max, float(np.nanmax(visible_data)))
-
-                elif item.data_type in [DataType.Volume, DataType.Histogram]:
-                    # Bar data
-                    start_idx = max(0, offset)
-                    end_idx = min(len(item.data), offset + visible_count)
-                    if end_idx > start_idx:
-                        visible_data = np.asarray(item.data[start_idx:end_idx], dtype=np.float64)
-                        if visible_data.size > 0:
-                            y_min = min(y_min, float(np.min(visible_data)))
-                            y_max = max(y_max, float(np.max(visible_data)))
-
-                elif item.data_type == DataType.Bands:
-                    # Bands (upper, lower)
-                    upper_data, lower_data = item.data
-                    start_idx = max(0, offset)
-                    end_idx = min(len(upper_data), offset + visible_count)
-                    if end_idx > start_idx:
-                        visible_upper = np.asarray(upper_data[start_idx:end_idx], dtype=np.float64)
-                        visible_lower = np.asarray(lower_data[start_idx:end_idx], dtype=np.float64)
-                        if visible_upper.size > 0:
-                            y_max = max(y_max, float(np.nanmax(visible_upper)))
-                        if visible_lower.size > 0:
-                            y_min = min(y_min, float(np.nanmin(visible_lower)))
-
-                elif item.data_type == DataType.Levels:
-                    # Horizontal levels
-                    levels = np.asarray(item.data, dtype=np.float64)
-                    if levels.size > 0:
-                        y_min = min(y_min, float(np.min(levels)))
-                        y_max = max(y_max, float(np.max(levels)))
-            except Exception:
-                pass
+        # Calculate Y-axis limits from ALL visible data in this panel (range indexes, O(1) per item)
+        t_stage = _FrameProfiler.now() if profiler is not None else 0
+        ohlc_src = self._get_ohlc_source()
+        y_key = (max(0, offset), offset + visible_count, self.data_version, ohlc_src is not None and len(ohlc_src))
+        if self._y_range_cache is not None and self._y_range_cache[0] == y_key:
+            y_min, y_max = self._y_range_cache[1]
+        else:
+            y_min, y_max = self.getVisibleYRange(max(0, offset), offset + visible_count)
+            self._y_range_cache = (y_key, (y_min, y_max))
+        if profiler is not None:
+            profiler.lap(self.index, "y_scale", t_stage)
 
         if not np.isfinite(y_min) or not np.isfinite(y_max):
             y_min, y_max = 0.0, 100.0
@@ -972,6 +2250,11 @@ class Panel:
         # Get visible range for LOD calculation
         x_lim = implot.get_plot_limits()
         visible_range = (x_lim.x.min, x_lim.x.max)
+        # Visible index window, computed once per frame and shared by all items
+        visible_window = self._visible_window(time_data, visible_range)
+        # LOD cache key: an unchanged view reuses last frame's LOD output
+        lod_key = (float(visible_range[0]), float(visible_range[1]), int(plot_width_pixels),
+                   len(time_data), self.data_version)
         # Publish limits and hover info
         try:
             if shared_lod is not None:
@@ -1002,13 +2285,22 @@ class Panel:
         except Exception:
             pass
 
+        if profiler is not None:
+            t_stage, lod_ns = profiler.now(), profiler.total(self.index, "lod")
+
         # Render OHLC data if present
         if ohlc_src is not None:
-            lod_time, lod_ohlc = self._calculate_lod_ohlc(
-                time_data,
-                ohlc_src,
-                visible_range,
-                plot_width_pixels
+            lod_time, lod_ohlc = self._cached_lod(
+                ("ohlc",),
+                lod_key + (len(ohlc_src),),
+                lambda: self._calculate_lod_ohlc(
+                    time_data,
+                    ohlc_src,
+                    visible_range,
+                    plot_width_pixels,
+                    visible_window
+                ),
+                profiler
             )
 
             if len(lod_time) > 0:
@@ -1025,134 +2317,46 @@ class Panel:
                     show_signals = shared_lod.get("show_trade_signals", False)
                     signals_array = shared_lod.get("trade_signals", None)
 
-                for i in range(len(lod_time)):
-                    o, h, l, c = lod_ohlc[i]
-
-                    # Determine color based on trade signals if enabled
-                    bar_index = int(lod_time[i])  # Original bar index
-                    signal_color = None
-
-                    if show_signals and signals_array is not None and 0 <= bar_index < len(signals_array):
-                        signal = signals_array[bar_index]
-                        if signal == 1:  # LONG
-                            signal_color = imgui.ImVec4(0.0, 1.0, 0.0, 1.0)  # GREEN
-                        elif signal == -1:  # SHORT
-                            signal_color = imgui.ImVec4(1.0, 0.0, 0.0, 1.0)  # RED
-                        else:
-                            signal_color = imgui.ImVec4(1.0, 1.0, 1.0, 1.0)  # WHITE
-                        # signal == 0 (FLAT): use default color
-
-                    # Use signal color if available, otherwise default color
-                    if signal_color is not None:
-                        color = signal_color
-                    else:
-                        # Default color: green if bullish, red if bearish
-                        if c >= o:
-                            color = imgui.ImVec4(0.0, 1.0, 0.0, 1.0)  # Green (bullish)
-                        else:
-                            color = imgui.ImVec4(1.0, 0.0, 0.0, 1.0)  # Red (bearish)
-
-                    # Draw candlestick
-                    x = lod_time[i]
-                    body_width = 0.6
-                    x_left = x - body_width/2
-                    x_right = x + body_width/2
-
-                    # All candlesticks use "OHLC" label
-                    # ImPlot will create only one legend entry and control all together
-                    label = "OHLC"
-
-                    # High-Low wick (thin line)
-                    implot.set_next_line_style(color, 1.0)
-                    implot.plot_line(label, np.array([x, x]), np.array([l, h]))
-
-                    # Open-Close body (filled rectangle)
-                    if c >= o:
-                        # Bullish - hollow (just outline)
-                        implot.set_next_line_style(color, 2.0)
-                        xs = np.array([x_left, x_right, x_right, x_left, x_left])
-                        ys = np.array([o, o, c, c, o])
-                        implot.plot_line(label, xs, ys)
-                    else:
-                        # Bearish - filled rectangle
-                        implot.set_next_fill_style(color, 0.8)
-                        xs_top = np.array([x_left, x_right])
-                        xs_bottom = np.array([x_left, x_right])
-                        ys_top = np.array([c, c])
-                        ys_bottom = np.array([o, o])
-                        implot.plot_shaded(label, xs_top, ys_top, ys_bottom)
+                self._render_candles(
+                    lod_time,
+                    lod_ohlc,
+                    signals_array if show_signals else None,
+                    (x_lim.x.min, x_lim.x.max),
+                )
 
                 # Draw horizontal lines for Buy/Sell signals (TODO 4)
                 if show_signals and signals_array is not None:
                     try:
-                        # Find signal segments in visible range
-                        start_idx = max(0, int(np.floor(visible_range[0])))
-                        end_idx = min(len(signals_array), int(np.ceil(visible_range[1])))
-
-                        if end_idx > start_idx:
-                            # Scan for signal segments (Buy=1, Sell=-1, Flat=0)
-                            i = start_idx
-                            while i < end_idx:
-                                signal = signals_array[i]
-
-                                # Skip Flat signals
-                                if signal == 0:
-                                    i += 1
-                                    continue
-
-                                # Found Buy or Sell signal, find the segment end
-                                segment_start = i
-                                current_signal = signal
-
-                                # Find where this signal ends (changes to different signal)
-                                while i < end_idx and signals_array[i] == current_signal:
-                                    i += 1
-                                segment_end = i - 1
-
-                                # Get OHLC data for this segment
-                                segment_ohlc = ohlc_src[segment_start:segment_end + 1]
-
-                                y_offset = 0.001 # 5% offset applied for visual separation from candlesticks
-
-                                if len(segment_ohlc) > 0:
-                                    # Calculate line position based on signal type
-                                    if current_signal == 1:  # BUY
-                                        # Green line above the first bar's high
-                                        y_pos = float(segment_ohlc[0, 1])  # First bar's High
-                                        offset = (segment_ohlc[0, 1] - segment_ohlc[0, 2]) * y_offset  # First bar height
-                                        y_pos += offset  # Above the high
-                                        line_color = imgui.ImVec4(0.0, 1.0, 0.0, 1.0)  # GREEN
-                                    else:  # SELL (-1)
-                                        # Red line below the first bar's low
-                                        y_pos = float(segment_ohlc[0, 2])  # First bar's Low
-                                        offset = (segment_ohlc[0, 1] - segment_ohlc[0, 2]) * y_offset  # First bar height
-                                        y_pos -= offset  # Below the low
-                                        line_color = imgui.ImVec4(1.0, 0.0, 0.0, 1.0)  # RED
-
-                                    # Draw horizontal line for this segment
-                                    x_start = float(segment_start)
-                                    x_end = float(segment_end + 1)
-                                    implot.set_next_line_style(line_color, 2.0)
-                                    implot.plot_line(
-                                        f"##Signal_{current_signal}_{segment_start}",  # ## prefix hides from legend
-                                        np.array([x_start, x_end]),
-                                        np.array([y_pos, y_pos])
-                                    )
+                        self._render_signal_segments(shared_lod.get("trade_signal_segments"), ohlc_src, visible_range)
                     except Exception as e:
-                        try:
-                            print(f"[DEBUG] Signal line drawing error: {e}")
-                        except Exception:
-                            pass
+                        logger.debug("Signal line drawing error: %s", e)
+
+        if profiler is not None:
+            t_stage = profiler.lap(self.index, "candles", t_stage, profiler.total(self.index, "lod") - lod_ns)
+            lod_ns = profiler.total(self.index, "lod")
+
+        # Default LOD mode for line-like items (per-item lod_mode has priority)
+        default_lod_mode = LODMode.MinMax
+        if shared_lod is not None and shared_lod.get("line_lod_mode") is not None:
+            default_lod_mode = shared_lod["line_lod_mode"]
 
         # Render other data items
-        for item in self.data_items:
+        for item_pos, item in enumerate(self.data_items):
+            line_lod_mode = item.lod_mode if item.lod_mode is not None else default_lod_mode
             if item.data_type == DataType.Line or item.data_type == DataType.PnL or item.data_type == DataType.Balance:
                 # Line plot with LOD
-                lod_x, lod_y = self._calculate_lod_line(
-                    time_data,
-                    item.data,
-                    visible_range,
-                    plot_width_pixels
+                lod_x, lod_y = self._cached_lod(
+                    ("item", item_pos),
+                    lod_key + (line_lod_mode,),
+                    lambda: self._calculate_lod_line(
+                        time_data,
+                        item.data,
+                        visible_range,
+                        plot_width_pixels,
+                        line_lod_mode,
+                        visible_window
+                    ),
+                    profiler
                 )
 
                 if len(lod_x) > 0:
@@ -1166,11 +2370,17 @@ class Panel:
 
             elif item.data_type == DataType.Volume or item.data_type == DataType.Histogram:
                 # Bar plot with LOD
-                lod_x, lod_y = self._calculate_lod_bars(
-                    time_data,
-                    item.data,
-                    visible_range,
-                    plot_width_pixels
+                lod_x, lod_y = self._cached_lod(
+                    ("item", item_pos),
+                    lod_key,
+                    lambda: self._calculate_lod_bars(
+                        time_data,
+                        item.data,
+                        visible_range,
+                        plot_width_pixels,
+                        visible_window
+                    ),
+                    profiler
                 )
 
                 # Fallback if LOD produced nothing but we have visible data
@@ -1218,11 +2428,21 @@ class Panel:
                 # Bands (upper, lower)
                 upper_data, lower_data = item.data
 
-                lod_x_upper, lod_y_upper = self._calculate_lod_line(
-                    time_data, upper_data, visible_range, plot_width_pixels
+                lod_x_upper, lod_y_upper = self._cached_lod(
+                    ("item", item_pos, "upper"),
+                    lod_key + (line_lod_mode,),
+                    lambda: self._calculate_lod_line(
+                        time_data, upper_data, visible_range, plot_width_pixels, line_lod_mode, visible_window
+                    ),
+                    profiler
                 )
-                lod_x_lower, lod_y_lower = self._calculate_lod_line(
-                    time_data, lower_data, visible_range, plot_width_pixels
+                lod_x_lower, lod_y_lower = self._cached_lod(
+                    ("item", item_pos, "lower"),
+                    lod_key + (line_lod_mode,),
+                    lambda: self._calculate_lod_line(
+                        time_data, lower_data, visible_range, plot_width_pixels, line_lod_mode, visible_window
+                    ),
+                    profiler
                 )
 
                 if len(lod_x_upper) > 0 and len(lod_x_lower) > 0:
@@ -1264,7 +2484,8 @@ class Panel:
                 visible_types = signal_types[visible_mask]
 
                 if len(visible_x_indices) > 0:
-                    visible_x = time_data[visible_x_indices]
+                    visible_x = np.asarray(time_data[visible_x_indices], dtype=np.float64)
+                    visible_y = np.asarray(visible_y, dtype=np.float64)
 
                     # Separate buy/sell signals
                     buy_mask = visible_types == 1
@@ -1280,27 +2501,25 @@ class Panel:
 
             elif item.data_type == DataType.Stairs:
                 # Stairs/step plot for trade signal states (e.g., -1, 0, 1)
-                # Auto-scale small value ranges for better visibility
-                data_array = np.array(item.data, dtype=np.float64)
-                
-                # Check if data is in small range (e.g., -1 to 1) and scale it
-                data_min = np.min(data_array)
-                data_max = np.max(data_array)
-                data_range = data_max - data_min
-                
-                # If range is very small (< 10), scale by 100 for better visibility
-                scale_factor = 1.0
-                if data_range > 0 and data_range < 10:
-                    scale_factor = 1.0
-                    data_scaled = data_array * scale_factor
-                else:
-                    data_scaled = data_array
-                
-                lod_x, lod_y = self._calculate_lod_stairs(
-                    time_data,
-                    data_scaled,
-                    visible_range,
-                    plot_width_pixels
+                # item.data is stored as-is (setData, any numeric storage dtype, e.g. int8);
+                # only the LOD output is converted to float64
+                # Cached transition positions (rebuilt only if data was replaced outside setData/appendData)
+                if item.transitions is None or item.transitions.source is not item.data:
+                    item.transitions = _StepTransitions(item.data)
+                stairs_transitions = item.transitions.positions
+
+                lod_x, lod_y = self._cached_lod(
+                    ("item", item_pos),
+                    lod_key,
+                    lambda: self._calculate_lod_stairs(
+                        time_data,
+                        item.data,
+                        visible_range,
+                        plot_width_pixels,
+                        visible_window,
+                        stairs_transitions
+                    ),
+                    profiler
                 )
 
                 if len(lod_x) > 0:
@@ -1337,6 +2556,15 @@ class Panel:
 
                         implot.plot_line(item.label, np.array(stairs_x), np.array(stairs_y))
 
+            elif item.data_type == DataType.EquityOverlay:
+                plotted_bars = max(plotted_bars, self._render_equity_overlay(
+                    item_pos, item, time_data, visible_range, plot_width_pixels,
+                    visible_window, lod_key, line_lod_mode, profiler
+                ))
+
+        if profiler is not None:
+            t_stage = profiler.lap(self.index, "series", t_stage, profiler.total(self.index, "lod") - lod_ns)
+
         # Shared crosshair & interactions (vertical synced, horizontal local + info)
         try:
             if shared_crosshair and shared_crosshair.get("enabled"):
@@ -1488,10 +2716,10 @@ class Panel:
 
         except Exception as e:
             # Debug: avoid swallowing errors silently
-            try:
-                print(f"[DEBUG] Panel info draw error: {e}")
-            except Exception:
-                pass
+            logger.debug("Panel info draw error: %s", e)
+
+        if profiler is not None:
+            t_stage = profiler.lap(self.index, "overlay", t_stage)
 
         # # Apply Y zoom if requested (scale around center)
         # try:
@@ -1546,9 +2774,14 @@ class Panel:
                             draw_list.add_text(imgui.ImVec2(px - 60, base_y), 0xFFFFFFFF, label)
                     # LOD info box: show at bottom-right for all panels
                     self.BuildLODPanelInfoBottomRight(visible_bars, plotted_bars)
+                    if profiler is not None:
+                        self.BuildProfilerInfoBottomRight(profiler.stats(self.index))
         except Exception:
             pass
 
+        if profiler is not None:
+            t_stage = profiler.lap(self.index, "labels", t_stage)
+
         # Basic per-plot event dispatch (hover/mouse) to DataPlotter.eventHandler
         try:
             if event_handler is not None:
@@ -1707,9 +2940,62 @@ class Panel:
         except Exception:
             pass
 
+        if profiler is not None:
+            profiler.lap(self.index, "events", t_stage)
+
         implot.end_plot()
 
 
+class _PlotViewState:
+    """
+    View state of one DataPlotterImgBundleNew across Plot() frames.
+
+    Holds the visible window (offset, visible_count), toolbar selections, per-panel
+    limits and one-shot sync overrides, range slider drag state and scroll-mode
+    culling state. Each plotter owns one, so plotters rendered in the same app
+    do not share views.
+    """
+
+    def __init__(self, bar_count: int):
+        self.combo_items = [
+            "FitToScreen (Normal)",
+            "FitToScreen (Wide)",
+            "FitToScreen (Ultra)",
+            "Full Data",
+            "Last N Data",
+            "First N Data",
+            "Range"
+        ]
+        self.combo_current = 2  # Default: FitToScreen (Ultra)
+
+        # Pan controls
+        self.pan_modes = ["VisibleScreenWidth", "UserDefined", "1 Bar", "10 Bar", "100 Bar", "10000 Bar"]
+        self.pan_mode_current = 0  # Default: VisibleScreenWidth
+        self.pan_step_value = "100"  # Default step for UserDefined
+        self.n_value = "1000"
+        self.n2_value = "2000"
+
+        self.offset = 0
+        self.visible_count = min(1000, bar_count)
+        self.needs_update = False
+        self.auto_apply = True
+        self.pending_fit = False
+        self.fit_mode: Optional[str] = None
+        # Live append: pinned to the right edge ("Sona >|") and bar count of the last frame
+        self.follow_end = False
+        self.followed_bar_count = bar_count
+        self.src_panel_id: Optional[int] = None  # Last clicked/interacted panel
+        self.src_panel_limits: Optional[Tuple[float, float, float, float]] = None  # Saved limits from ReadSrcPlotParams (x_min, x_max, y_min, y_max)
+        self.panel_limits: Dict[int, Tuple[float, float, float, float]] = {}  # X/Y limits per panel {panel_idx: (x_min, x_max, y_min, y_max)}
+        self.panel_x_overrides: Dict[int, Tuple[int, int]] = {}  # Per-panel X override {panel_idx: (offset, visible_count)}, excludes src
+        self.panel_y_overrides: Dict[int, Tuple[float, float]] = {}  # Per-panel Y override {panel_idx: (y_min, y_max)}, includes src + Y-sync group
+        # Range slider drag state (None / "pan" / "resize_left" / "resize_right")
+        self.rs_mode: Optional[str] = None
+        # Scroll mode viewport culling: last rendered height per panel, panels that missed an axis update
+        self.scroll_panel_heights: Dict[int, float] = {}
+        self.scroll_stale_panels: set = set()
+
+
 class DataPlotterImgBundleNew:
     """
     Main orchestrator for multi-panel plotting with synchronized axes.
@@ -1719,6 +3005,8 @@ class DataPlotterImgBundleNew:
     def __init__(self):
         self.panels: Dict[int, Panel] = {}
         self.time_data: Optional[np.ndarray] = None
+        # Storage dtype per array role (setStorageDtypes); default keeps full float64 precision
+        self.storage_dtypes: Dict[str, Any] = dict(STORAGE_DTYPES_FLOAT64)
         self.window_title = "Multi-Panel Chart"
         self.grafik_sembol = "..."
         self.grafik_periyot = "..."
@@ -1726,10 +3014,15 @@ class DataPlotterImgBundleNew:
         # Vertical scroll mode for stacked panels (Yaplacak 3)
         self.enable_vertical_scrollbar: bool = False
         # Shared datetime labels (strings) for all panels
-        self.datetime_labels: Optional[List[str]] = None
+        self.datetime_labels: Any = None  # List[str] or datetime64[s] array (see _to_datetime_source)
         # Shared OHLC (can be reader-like or direct array)
+        # shared_ohlc_array is the (N,4) transpose of an owned columnar (4,N) buffer
         self.shared_ohlc_array: Optional[np.ndarray] = None
         self.shared_ohlc_reader: Optional[Any] = None
+        # Read-only view of shared_ohlc_array given to panels (getOHLCData) and its (pyramid, range index)
+        self._shared_ohlc_view: Optional[np.ndarray] = None
+        self._shared_ohlc_view_source: Optional[np.ndarray] = None
+        self._shared_ohlc_indexes: Tuple[Optional[_OHLCPyramid], Optional[_RangeMinMaxIndex]] = (None, None)
         # Shared Volume array
         self.shared_volume_array: Optional[np.ndarray] = None
         # Shared Lot array
@@ -1751,6 +3044,8 @@ class DataPlotterImgBundleNew:
         self.enable_shared_xaxis: bool = False
         # Trade signals array (1=LONG, -1=SHORT, 0=FLAT)
         self.trade_signals: Optional[np.ndarray] = None
+        # Run-length segments of trade_signals for the Buy/Sell line overlay (setTradeSignals)
+        self.trade_signal_segments: Optional[_SignalSegments] = None
         # Show trade signals on OHLC bars
         self.show_trade_signals: bool = False
         # Source panel + button states for event logging
@@ -1765,6 +3060,23 @@ class DataPlotterImgBundleNew:
         # Range slider (Plotly-style overview + selection)
         self.enable_range_slider: bool = False
         self.range_slider_height: float = 120.0  # Default height in pixels
+        # Default LOD mode for line-like series (DataItem.lod_mode overrides per item)
+        self.line_lod_mode: LODMode = LODMode.MinMax
+        # Live append support (appendBars): growable buffers per shared array + data version
+        self._live_buffers: Dict[str, _GrowableArray] = {}
+        self.data_version: int = 0
+        # Idle frame rate (hello_imgui idling): without input the app redraws at this FPS; 0 disables idling
+        self.fps_idle: float = 4.0
+        self._applied_fps_idle: Optional[float] = None
+        # Opt-in frame-time profiler (enableProfiler)
+        self.profiler: Optional[_FrameProfiler] = None
+        # Range slider envelope, rebuilt per data version (see _get_range_slider_overview)
+        self._range_overview: Optional[_RangeSliderOverview] = None
+        # Per-instance view state of Plot (offset, visible_count, limits, overrides, UI), created on first frame
+        self._view_state: Optional[_PlotViewState] = None
+        # Cached subplot row ratios (see _get_row_col_ratios)
+        self._row_col_ratios_key: Optional[Tuple] = None
+        self._row_col_ratios: Any = None
 
     def AddPanel(self, index: int) -> Panel:
         """
@@ -1777,6 +3089,7 @@ class DataPlotterImgBundleNew:
             The created Panel instance
         """
         panel = Panel(index)
+        panel.storage_dtypes = dict(self.storage_dtypes)
         self.panels[index] = panel
         return panel
 
@@ -1875,12 +3188,12 @@ class DataPlotterImgBundleNew:
             if etype == "wheel":
                 self._src_panel = pid
                 self._auto_sync_request = True # On scroll events, request auto sync (Tum plotlarda sync bu flag ile saglaniyor
-                print(f"[EVENT] panel={pid} {etype} evt={ {k:v for k,v in event.items() if k!='ppx'} }")
+                logger.debug("event: panel=%s %s evt=%s", pid, etype, {k:v for k,v in event.items() if k!='ppx'})
                 return
 
             # hover event: always log (no src_panel tracking, can be spammy)
             if etype == "hover" and 1 == 0:
-                print(f"[EVENT] panel={pid} {etype} x={event.get('x'):.2f} y={event.get('y'):.2f}")
+                logger.debug("event: panel=%s %s x=%.2f y=%.2f", pid, etype, event.get('x'), event.get('y'))
                 return
 
             # set src on first actionable event (last clicked/interacted panel)
@@ -1907,7 +3220,8 @@ class DataPlotterImgBundleNew:
                 "selection_start","selecting","selection_finished",
             ):
 
-                print(f"[EVENT] src={self._src_panel} {etype} evt={ {k:v for k,v in event.items() if k!='ppx'} }")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("event: src=%s %s evt=%s", self._src_panel, etype, {k:v for k,v in event.items() if k!='ppx'})
         except Exception:
             pass
 
@@ -1917,7 +3231,7 @@ class DataPlotterImgBundleNew:
     def _event_end_update_other_plots_xy(self, event: Dict[str, Any]) -> None:
         """If shared X is enabled, simulate UpdateOtherPlotsXY after an event.
 
-        - Reads src limits from static.panel_limits using last interacted or current event panel
+        - Reads src limits from the view state's panel_limits using last interacted or current event panel
         - Applies X window to all panels via one-shot overrides
         - Applies Y limits to same Y-sync group
         """
@@ -1925,7 +3239,7 @@ class DataPlotterImgBundleNew:
             if not getattr(self, "enable_shared_xaxis", False):
                 return
 
-            static = DataPlotterImgBundleNew.Plot
+            static = self._view_state
 
             # Determine source panel id
             src_id = getattr(self, "_src_panel", None)
@@ -1946,6 +3260,31 @@ class DataPlotterImgBundleNew:
         except Exception:
             pass  # aykut kod buraya eklendi
 
+    def setStorageDtypes(self, mode: Optional[str] = None, **dtypes: Any):
+        """
+        Set the dtypes used to store data passed to the setters afterwards (and to new panels).
+
+        Args:
+            mode: "float64" (default, full precision) or "compact" (float32 prices and
+                  series, int8 signals, int64 volume/lot: about half the memory)
+            dtypes: Per-role overrides (price, series, signal, volume), e.g.
+                    setStorageDtypes("compact", volume=np.float64) for fractional volume
+
+        Rendering is unchanged: LOD outputs are converted to float64 for ImPlot.
+        """
+        if mode is not None:
+            if mode not in STORAGE_MODES:
+                logger.warning("setStorageDtypes: unknown mode %r (expected one of %s)", mode, list(STORAGE_MODES))
+                return
+            self.storage_dtypes = dict(STORAGE_MODES[mode])
+        for role, dtype in dtypes.items():
+            if role not in self.storage_dtypes:
+                logger.warning("setStorageDtypes: unknown role %r", role)
+                continue
+            self.storage_dtypes[role] = dtype
+        for panel in self.panels.values():
+            panel.storage_dtypes = dict(self.storage_dtypes)
+
     def setTimeData(self, time_data: np.ndarray):
         """
         Set the shared time/X-axis data for all panels.
@@ -1954,21 +3293,16 @@ class DataPlotterImgBundleNew:
             time_data: Array of time values or indices
         """
         self.time_data = time_data
+        self.data_version += 1
 
     def setWindowTitle(self, title: str):
         """Set main window title."""
         self.window_title = title
 
     def setDateTimeLabels(self, labels: Any):
-        """Set shared datetime labels for X-axis on all panels."""
+        """Set shared datetime labels for X-axis on all panels (strings, epoch seconds or datetime64)."""
         try:
-            if labels is None:
-                self.datetime_labels = None
-                return
-            if isinstance(labels, np.ndarray):
-                self.datetime_labels = [str(x) for x in labels.tolist()]
-            else:
-                self.datetime_labels = [str(x) for x in list(labels)]
+            self.datetime_labels = _to_datetime_source(labels)
         except Exception:
             self.datetime_labels = None
 
@@ -1978,39 +3312,106 @@ class DataPlotterImgBundleNew:
         Accepts either:
           - reader-like object (has 'bars' / 'ohlc' / 'ohlc_data')
           - numpy array-like with shape (N,4)
+
+        Arrays are stored once in a columnar (4,N) buffer of the price dtype;
+        shared_ohlc_array is its (N,4) transpose (see setOHLCColumns).
         """
         self.shared_ohlc_array = None
         self.shared_ohlc_reader = None
+        self.data_version += 1
         if source is None:
             return
         try:
-            arr = np.array(source)
+            arr = np.asarray(source)
             if arr.ndim == 2 and arr.shape[1] == 4:
-                self.shared_ohlc_array = arr.astype(np.float64)
+                # No copy if arr already is the transpose of a contiguous (4,N) price-dtype buffer
+                self.shared_ohlc_array = np.ascontiguousarray(arr.T, dtype=self.storage_dtypes["price"]).T
                 return
         except Exception:
             pass
         # Treat as reader-like and store
         self.shared_ohlc_reader = source
 
+    def setOHLCColumns(self, opens: Any, highs: Any, lows: Any, closes: Any):
+        """
+        Set shared OHLC data from separate Open/High/Low/Close arrays.
+
+        The columns are copied once into the owned columnar (4,N) buffer (no
+        intermediate (N,4) stack), so Close/High/Low are contiguous for reductions.
+        """
+        self.shared_ohlc_reader = None
+        self.data_version += 1
+        columns = [np.asarray(c).reshape(-1) for c in (opens, highs, lows, closes)]
+        n = min(len(c) for c in columns)
+        buf = np.empty((4, n), dtype=self.storage_dtypes["price"])
+        for row, column in zip(buf, columns):
+            row[:] = column[:n]
+        self.shared_ohlc_array = buf.T
+
     def getOHLCData(self) -> Optional[Any]:
         """Return a reader-like object for Panel.setOHLCData or None.
 
-        If a reader was set, returns it. If an array was set, returns an adapter exposing .ohlc.
+        If a reader was set, returns it. If an array was set, returns an adapter over a
+        read-only view of the shared buffer: panels reference it without copying, and
+        appendBars grows it once for all of them. The adapter also carries the LOD
+        pyramid and Y-range index of the view, built once and shared by every panel
+        attached this way (also across plotters, see shareOHLCFrom).
         """
         if self.shared_ohlc_reader is not None:
             return self.shared_ohlc_reader
         if self.shared_ohlc_array is not None:
-            return _ArrayOHLCReader(self.shared_ohlc_array)
+            view = self._get_shared_ohlc_view()
+            pyramid, range_index = self._get_shared_ohlc_indexes()
+            return _ArrayOHLCReader(view, pyramid=pyramid, range_index=range_index)
         return None
 
+    def _get_shared_ohlc_indexes(self) -> Tuple[_OHLCPyramid, _RangeMinMaxIndex]:
+        """LOD pyramid and Y-range index of the shared OHLC view, rebuilt only if the view changed."""
+        view = self._get_shared_ohlc_view()
+        pyramid, range_index = self._shared_ohlc_indexes
+        if pyramid is None or pyramid.levels[0] is not view:
+            pyramid = _OHLCPyramid(view)
+        if range_index is None or range_index.source is not view:
+            range_index = Panel._build_ohlc_range_index(view)
+        self._shared_ohlc_indexes = (pyramid, range_index)
+        return pyramid, range_index
+
+    def shareOHLCFrom(self, other: "DataPlotterImgBundleNew"):
+        """
+        Reference other's bar data instead of holding a copy (backtests run on the same OHLC).
+
+        Shares the OHLC buffer with its read-only view, LOD pyramid and Y-range index,
+        and the time, datetime label, volume and lot arrays. Panels attached through
+        getOHLCData afterwards reuse the indexes, so N plotters over one data set hold
+        the bars and their indexes once. Meant for read-only comparison: after an
+        appendBars on either plotter the other rebuilds its own indexes.
+        """
+        self.shared_ohlc_reader = other.shared_ohlc_reader
+        self.shared_ohlc_array = other.shared_ohlc_array
+        if other.shared_ohlc_array is not None:
+            self._shared_ohlc_view = other._get_shared_ohlc_view()
+            self._shared_ohlc_view_source = other.shared_ohlc_array
+            self._shared_ohlc_indexes = other._get_shared_ohlc_indexes()
+        self.time_data = other.time_data
+        self.datetime_labels = other.datetime_labels
+        self.shared_volume_array = other.shared_volume_array
+        self.shared_lot_array = other.shared_lot_array
+        self.data_version += 1
+
+    def _get_shared_ohlc_view(self) -> np.ndarray:
+        """Read-only view of shared_ohlc_array handed to panels (same object until the array changes)."""
+        if self._shared_ohlc_view is None or self._shared_ohlc_view_source is not self.shared_ohlc_array:
+            self._shared_ohlc_view = _readonly_view(self.shared_ohlc_array)
+            self._shared_ohlc_view_source = self.shared_ohlc_array
+        return self._shared_ohlc_view
+
     def setVolumeData(self, source: Any):
         """Set shared Volume data array from various sources."""
         self.shared_volume_array = None
         if source is None:
             return
         try:
-            arr = np.array(source, dtype=np.float64).reshape(-1)
+            arr = np.asarray(source, dtype=self.storage_dtypes["volume"]).reshape(-1)
             self.shared_volume_array = arr
             return
         except Exception:
@@ -2018,10 +3419,10 @@ class DataPlotterImgBundleNew:
         # Try reader-like
         try:
             if hasattr(source, 'volume_data'):
-                self.shared_volume_array = np.array(source.volume_data, dtype=np.float64).reshape(-1)
+                self.shared_volume_array = np.array(source.volume_data, dtype=self.storage_dtypes["volume"]).reshape(-1)
                 return
             if hasattr(source, 'bars'):
-                self.shared_volume_array = np.array([b.volume for b in source.bars], dtype=np.float64).reshape(-1)
+                self.shared_volume_array = np.array([b.volume for b in source.bars], dtype=self.storage_dtypes["volume"]).reshape(-1)
                 return
         except Exception:
             self.shared_volume_array = None
@@ -2035,7 +3436,7 @@ class DataPlotterImgBundleNew:
         if source is None:
             return
         try:
-            arr = np.array(source, dtype=np.float64).reshape(-1)
+            arr = np.asarray(source, dtype=self.storage_dtypes["volume"]).reshape(-1)
             self.shared_lot_array = arr
             return
         except Exception:
@@ -2043,10 +3444,10 @@ class DataPlotterImgBundleNew:
         # Try reader-like
         try:
             if hasattr(source, 'lot_data'):
-                self.shared_lot_array = np.array(source.lot_data, dtype=np.float64).reshape(-1)
+                self.shared_lot_array = np.array(source.lot_data, dtype=self.storage_dtypes["volume"]).reshape(-1)
                 return
             if hasattr(source, 'bars'):
-                self.shared_lot_array = np.array([b.lot for b in source.bars], dtype=np.float64).reshape(-1)
+                self.shared_lot_array = np.array([b.lot for b in source.bars], dtype=self.storage_dtypes["volume"]).reshape(-1)
                 return
         except Exception:
             self.shared_lot_array = None
@@ -2061,7 +3462,7 @@ class DataPlotterImgBundleNew:
             return
         # Try direct array-like
         try:
-            arr = np.array(source, dtype=np.float64).reshape(-1)
+            arr = np.asarray(source, dtype=self.storage_dtypes["series"]).reshape(-1)
             self.shared_delta_array = arr
             return
         except Exception:
@@ -2069,10 +3470,10 @@ class DataPlotterImgBundleNew:
         # Try reader-like
         try:
             if hasattr(source, 'delta'):
-                self.shared_delta_array = np.array(source.delta, dtype=np.float64).reshape(-1)
+                self.shared_delta_array = np.array(source.delta, dtype=self.storage_dtypes["series"]).reshape(-1)
                 return
             if hasattr(source, 'bars'):
-                self.shared_delta_array = np.array([getattr(b, 'delta', 0.0) for b in source.bars], dtype=np.float64).reshape(-1)
+                self.shared_delta_array = np.array([getattr(b, 'delta', 0.0) for b in source.bars], dtype=self.storage_dtypes["series"]).reshape(-1)
                 return
         except Exception:
             self.shared_delta_array = None
@@ -2087,7 +3488,7 @@ class DataPlotterImgBundleNew:
             return
         # Try direct array-like
         try:
-            arr = np.array(source, dtype=np.float64).reshape(-1)
+            arr = np.asarray(source, dtype=self.storage_dtypes["series"]).reshape(-1)
             self.shared_delta_pct_array = arr
             return
         except Exception:
@@ -2095,10 +3496,10 @@ class DataPlotterImgBundleNew:
         # Try reader-like
         try:
             if hasattr(source, 'delta_pct'):
-                self.shared_delta_pct_array = np.array(source.delta_pct, dtype=np.float64).reshape(-1)
+                self.shared_delta_pct_array = np.array(source.delta_pct, dtype=self.storage_dtypes["series"]).reshape(-1)
                 return
             if hasattr(source, 'bars'):
-                self.shared_delta_pct_array = np.array([getattr(b, 'delta_pct', 0.0) for b in source.bars], dtype=np.float64).reshape(-1)
+                self.shared_delta_pct_array = np.array([getattr(b, 'delta_pct', 0.0) for b in source.bars], dtype=self.storage_dtypes["series"]).reshape(-1)
                 return
         except Exception:
             self.shared_delta_pct_array = None
@@ -2136,7 +3537,172 @@ class DataPlotterImgBundleNew:
         Args:
             signals: numpy array with values: 1 = LONG, -1 = SHORT, 0 = FLAT
         """
+        if signals is not None:
+            signals = np.asarray(signals, dtype=self.storage_dtypes["signal"]).reshape(-1)
         self.trade_signals = signals
+        self.trade_signal_segments = _SignalSegments(signals) if signals is not None else None
+
+    def _get_trade_signal_segments(self) -> Optional[_SignalSegments]:
+        """Segments of trade_signals, rebuilt only if the array was replaced directly."""
+        if self.trade_signals is None:
+            return None
+        segments = self.trade_signal_segments
+        if segments is None or segments.source is not self.trade_signals:
+            segments = self.trade_signal_segments = _SignalSegments(self.trade_signals)
+        return segments
+
+    def _get_range_slider_overview(self) -> Optional[_RangeSliderOverview]:
+        """Range slider envelope of the shared OHLC (None without OHLC), refreshed when the data version changes."""
+        if self.shared_ohlc_reader is not None:
+            ohlc = getattr(self.shared_ohlc_reader, "ohlc", None)
+            candidates = (ohlc,)
+        else:
+            ohlc = self.shared_ohlc_array
+            candidates = (ohlc, self._get_shared_ohlc_view()) if ohlc is not None else ()
+        if ohlc is None or len(ohlc) == 0:
+            return None
+        if self._range_overview is None:
+            self._range_overview = _RangeSliderOverview()
+        key = (self.data_version, len(ohlc))
+        if self._range_overview.key != key:
+            # Reuse the pyramid of a panel showing the same OHLC (no second pyramid)
+            pyramid = next((p.ohlc_pyramid for p in self.panels.values()
+                            if p.ohlc_pyramid is not None and any(p.ohlc_pyramid.levels[0] is c for c in candidates)),
+                           None)
+            self._range_overview.update(ohlc, key, pyramid)
+        return self._range_overview
+
+    def getMemoryReport(self) -> Dict[str, Any]:
+        """
+        Bytes held by the plotter's shared arrays and by each panel (per item), without double counting.
+
+        Returns {"shared": {name: bytes}, "panels": {index: Panel.getMemoryReport()},
+        "total": bytes}. Shared buffers are counted first; panels that only view
+        them (getOHLCData) report 0 for that data. Growable buffers count their
+        full capacity.
+        """
+        counter = _MemoryCounter()
+        reader_ohlc = getattr(self.shared_ohlc_reader, "ohlc", None) if self.shared_ohlc_reader is not None else None
+        shared = {
+            "ohlc": counter.add(self.shared_ohlc_array, reader_ohlc),
+            "time": counter.add(self.time_data),
+            "datetime_labels": counter.add(self.datetime_labels),
+            "volume": counter.add(self.shared_volume_array),
+            "lot": counter.add(self.shared_lot_array),
+            "delta": counter.add(self.shared_delta_array),
+            "delta_pct": counter.add(self.shared_delta_pct_array),
+            "trade_signals": counter.add(self.trade_signals, self.trade_signal_segments),
+            "live_buffers": counter.add(self._live_buffers),
+            "range_slider": counter.add(self._range_overview),
+        }
+        panels = {idx: self.panels[idx].getMemoryReport(counter) for idx in sorted(self.panels)}
+        return {
+            "shared": shared,
+            "panels": panels,
+            "total": sum(shared.values()) + sum(p["total"] for p in panels.values()),
+        }
+
+    def _append_shared(self, name: str, current: Any, values: np.ndarray) -> np.ndarray:
+        """Append values to a shared array through its growable buffer (created on first use)."""
+        buf = self._live_buffers.get(name)
+        if buf is None or buf.view is not current:
+            if current is None:
+                current = np.empty((0,) + values.shape[1:], dtype=values.dtype)
+            buf = _GrowableArray(current, dtype=values.dtype)
+            self._live_buffers[name] = buf
+        return buf.append(values)
+
+    def appendBars(self, ohlc: Any, volume: Any = None, signals: Any = None,
+                   series: Optional[Dict[Tuple[int, int], Any]] = None,
+                   lots: Any = None, times: Any = None):
+        """
+        Append live bars (e.g. a StockDataReader.GetNextBatch batch) without replacing arrays.
+
+        Args:
+            ohlc: (k,4) array of new bars [Open, High, Low, Close]
+            volume, lots, signals: Optional k values for the shared volume/lot/trade signal arrays
+            series: Optional {(panel_index, item_index): values} for panel data items
+                    (values as in Panel.appendData, e.g. (upper, lower) for Bands)
+            times: Optional k epoch seconds / datetime64 values (or label strings)
+                   appended to the shared datetime labels
+
+        Shared arrays live in preallocated buffers with amortised doubling; panel OHLC
+        pyramids and Y-range indexes are extended in place. If the view is pinned to
+        the right edge ("Sona >|"), Plot follows the new bars on the next frame.
+        """
+        dtypes = self.storage_dtypes
+        rows = np.asarray(ohlc, dtype=dtypes["price"]).reshape(-1, 4)
+        k = len(rows)
+        if k == 0:
+            return
+
+        n0 = len(self.time_data) if self.time_data is not None else 0
+        first_x = float(self.time_data[-1]) + 1.0 if n0 > 0 else 0.0
+        self.time_data = self._append_shared("time", self.time_data, first_x + np.arange(k, dtype=np.float64))
+
+        # Panels viewing the shared OHLC buffer follow it instead of appending their own copy
+        shared_view = None
+        old_ohlc = self.shared_ohlc_array
+        if self.shared_ohlc_reader is None:
+            if self.shared_ohlc_array is not None:
+                shared_view = self._get_shared_ohlc_view()
+            buf = self._live_buffers.get("ohlc")
+            if buf is None or buf.view is not self.shared_ohlc_array:
+                if self.shared_ohlc_array is None:
+                    buf = _GrowableColumns(np.empty((4, 0), dtype=rows.dtype))
+                else:
+                    buf = _GrowableColumns(self.shared_ohlc_array.T)
+                self._live_buffers["ohlc"] = buf
+            self.shared_ohlc_array = buf.append(rows)
+            overview = self._range_overview
+            if overview is not None and overview.pyramid is not None and overview.pyramid.levels[0] is old_ohlc:
+                overview.pyramid.extend(self.shared_ohlc_array)
+        if volume is not None:
+            self.shared_volume_array = self._append_shared(
+                "volume", self.shared_volume_array, np.asarray(volume, dtype=dtypes["volume"]).reshape(-1))
+        if lots is not None:
+            self.shared_lot_array = self._append_shared(
+                "lot", self.shared_lot_array, np.asarray(lots, dtype=dtypes["volume"]).reshape(-1))
+        if signals is not None:
+            old_signals = self.trade_signals
+            self.trade_signals = self._append_shared(
+                "signals", self.trade_signals, np.asarray(signals, dtype=dtypes["signal"]).reshape(-1))
+            if self.trade_signal_segments is not None and self.trade_signal_segments.source is old_signals:
+                self.trade_signal_segments.extend(self.trade_signals)
+            else:
+                self.trade_signal_segments = _SignalSegments(self.trade_signals)
+
+        if times is not None:
+            new_labels = _to_datetime_source(times)
+            if isinstance(new_labels, np.ndarray) and (
+                    self.datetime_labels is None or isinstance(self.datetime_labels, np.ndarray)):
+                self.datetime_labels = self._append_shared("datetime", self.datetime_labels, new_labels)
+            elif isinstance(self.datetime_labels, list):
+                self.datetime_labels.extend(
+                    [_format_datetime_label(new_labels, i) for i in range(len(new_labels))]
+                    if isinstance(new_labels, np.ndarray) else new_labels)
+
+        for panel in self.panels.values():
+            try:
+                src = panel._get_ohlc_source()
+                if src is not None and src is shared_view:
+                    panel._extend_ohlc_source(src, self._get_shared_ohlc_view())
+                elif src is not None:
+                    panel.appendOHLC(rows)
+            except Exception as e:
+                logger.warning("appendBars: panel %s OHLC append failed: %s", panel.index, e)
+
+        for (panel_index, item_index), values in (series or {}).items():
+            panel = self.panels.get(panel_index)
+            if panel is None:
+                logger.warning("appendBars: no panel %s", panel_index)
+                continue
+            try:
+                panel.appendData(item_index, values)
+            except Exception as e:
+                logger.warning("appendBars: panel %s item %s append failed: %s", panel_index, item_index, e)
+
+        self.data_version += 1
 
     def setShowTradeSignals(self, enabled: bool):
         """
@@ -2175,50 +3741,123 @@ class DataPlotterImgBundleNew:
         """Set range slider height in pixels (default 120.0)."""
         self.range_slider_height = float(max(50.0, height))
 
+    def setLineLODMode(self, mode: LODMode):
+        """
+        Set the default LOD mode for Line/PnL/Balance/Bands series on all panels.
+
+        LODMode.M4 keeps first/min/max/last per pixel column (exact drawdown troughs
+        with the fewest points); LODMode.MinMax is the classic min/max scheme.
+        Items created with setData(..., lod_mode=...) keep their own mode.
+        """
+        self.line_lod_mode = mode if isinstance(mode, LODMode) else LODMode[str(mode)]
+
+    def setIdleFps(self, fps: float):
+        """
+        Set the frame rate used while the window is idle (no input for a short while).
+
+        Input, resize or window focus wakes the loop to full rate; appended data shows
+        up on the next idle tick. Unchanged frames reuse each panel's cached LOD output
+        and Y range. 0 disables idling (always full rate).
+        """
+        self.fps_idle = max(0.0, float(fps))
+
+    def enableProfiler(self, enabled: bool = True, trace_path: Optional[str] = None, window: int = 240):
+        """
+        Enable/disable per-stage frame timing.
+
+        Plot times its toolbar and panel sections, each Panel.render times y_scale,
+        lod, candles, series, overlay, labels and events. Rolling p50/p99 over the last
+        window frames is drawn above each panel's LOD box. trace_path (optional)
+        streams every frame to a .csv (frame,owner,stage,ns) or .jsonl file.
+        """
+        if self.profiler is not None:
+            self.profiler.close()
+            self.profiler = None
+        if enabled:
+            try:
+                self.profiler = _FrameProfiler(window, trace_path)
+            except Exception as e:
+                logger.warning("Profiler init error: %s", e)
+                self.profiler = None
+
+    def _get_row_col_ratios(self, sorted_indices: List[int]):
+        """
+        Return the implot.SubplotsRowColRatios for the panels' normalized height ratios.
+
+        The object is built once and reused until the panel set or a height_ratio
+        changes (Plot runs every frame). None if it cannot be created.
+        """
+        key = tuple((idx, float(self.panels[idx].height_ratio)) for idx in sorted_indices)
+        if key == self._row_col_ratios_key:
+            return self._row_col_ratios
+
+        row_col_ratios = None
+        try:
+            ratios = [max(0.01, ratio) for _, ratio in key]
+            total = sum(ratios)
+            if total > 0:
+                row_ratios_list = [r / total for r in ratios]
+                logger.debug("Panel height_ratios: %s -> normalized %s", [r for _, r in key], row_ratios_list)
+                try:
+                    row_col_ratios = implot.SubplotsRowColRatios(row_ratios_list, None)
+                except Exception as e1:
+                    logger.debug("SubplotsRowColRatios(rows, None) failed: %s", e1)
+                    # Fallback: empty constructor + set rows
+                    row_col_ratios = implot.SubplotsRowColRatios()
+                    if hasattr(row_col_ratios, 'set_row_ratios'):
+                        row_col_ratios.set_row_ratios(row_ratios_list)
+                    elif hasattr(row_col_ratios, 'row_ratios'):
+                        row_col_ratios.row_ratios = row_ratios_list
+        except Exception as e:
+            logger.debug("Failed to create row_col_ratios: %s", e, exc_info=True)
+            row_col_ratios = None
+
+        self._row_col_ratios_key = key
+        self._row_col_ratios = row_col_ratios
+        return row_col_ratios
+
+    def _apply_idle_fps(self):
+        """Push fps_idle into the running hello_imgui runner when it changed."""
+        if self._applied_fps_idle == self.fps_idle:
+            return
+        try:
+            fps_idling = hello_imgui.get_runner_params().fps_idling
+            fps_idling.enable_idling = self.fps_idle > 0
+            if self.fps_idle > 0:
+                fps_idling.fps_idle = self.fps_idle
+        except Exception as e:
+            logger.debug("Idle FPS setup error: %s", e)
+        self._applied_fps_idle = self.fps_idle
+
     def Plot(self):
         """
         Main rendering function. Creates vertical stack of panels with synchronized axes.
         This function is called repeatedly by immapp.run().
+
+        All widgets are scoped under an ID unique to this instance and the view
+        state lives in self._view_state, so several plotters can render in one
+        ImGui app (tabs, docked windows) without sharing state or caches.
         """
+        imgui.push_id(f"DataPlotterImgBundleNew_{id(self)}")
+        try:
+            self._plot_frame()
+        finally:
+            imgui.pop_id()
+
+    def _plot_frame(self):
+        """One frame of Plot (inside this instance's ID scope)."""
         if self.time_data is None or len(self.panels) == 0:
             imgui.text("No data to plot")
             return
 
-        static = DataPlotterImgBundleNew.Plot
-
-        # Initialize static variables (like Legacy system)
-        if not hasattr(static, "initialized"):
-            bar_count = len(self.time_data)
+        self._apply_idle_fps()
+        profiler = self.profiler
+        t_frame = _FrameProfiler.now() if profiler is not None else 0
 
-            static.combo_items = [
-                "FitToScreen (Normal)",
-                "FitToScreen (Wide)",
-                "FitToScreen (Ultra)",
-                "Full Data",
-                "Last N Data",
-                "First N Data",
-                "Range"
-            ]
-            static.combo_current = 2  # Default: FitToScreen (Ultra)
-
-            # Pan controls
-            static.pan_modes = ["VisibleScreenWidth", "UserDefined", "1 Bar", "10 Bar", "100 Bar", "10000 Bar"]
-            static.pan_mode_current = 0  # Default: VisibleScreenWidth
-            static.pan_step_value = "100"  # Default step for UserDefined
-            static.n_value = "1000"
-            static.n2_value = "2000"
-
-            static.offset = 0
-            static.visible_count = min(1000, bar_count)
-            static.needs_update = False
-            static.auto_apply = True
-            static.src_panel_id = None  # Last clicked/interacted panel
-            static.src_panel_limits = None  # Saved limits from ReadSrcPlotParams (x_min, x_max, y_min, y_max)
-            static.panel_limits = {}  # Store X/Y limits per panel {panel_idx: (x_min, x_max, y_min, y_max)}
-            static.panel_x_overrides = {}  # Per-panel X override {panel_idx: (offset, visible_count)}, excludes src
-            static.panel_y_overrides = {}  # Per-panel Y override {panel_idx: (y_min, y_max)}, includes src + Y-sync group
-
-            static.initialized = True
+        # View state of this plotter instance (formerly attributes on the Plot function object)
+        static = self._view_state
+        if static is None:
+            static = self._view_state = _PlotViewState(len(self.time_data))
 
         imgui.bullet_text(
             f"{self.grafik_sembol}  |  {self.grafik_periyot} {self.grafik_periyot_extension}")
@@ -2330,71 +3969,8 @@ class DataPlotterImgBundleNew:
                 
                 # Iterate all panels and calculate local min/max for visible range
                 for idx, panel in self.panels.items():
-                    local_y_min = float('inf')
-                    local_y_max = float('-inf')
-                    found_data = False
-
-                    # Check OHLC data
-                    ohlc_src = None
-                    if panel.ohlc_array is not None:
-                        ohlc_src = panel.ohlc_array
-                    elif panel.ohlc_data is not None:
-                        ohlc_src = panel.ohlc_data.ohlc
-                    
-                    if ohlc_src is not None:
-                        # Slice visible OHLC
-                        visible_slice = ohlc_src[start_idx:end_idx]
-                        if len(visible_slice) > 0:
-                            try:
-                                local_y_max = max(local_y_max, float(np.max(visible_slice[:, 1]))) # High
-                                local_y_min = min(local_y_min, float(np.min(visible_slice[:, 2]))) # Low
-                                found_data = True
-                            except Exception:
-                                pass
-
-                    # Check other data items
-                    for item in panel.data_items:
-                        try:
-                            # Helper to get visible data slice
-                            d_len = len(item.data) if hasattr(item.data, '__len__') else 0
-                            s_i = max(0, min(start_idx, d_len))
-                            e_i = max(s_i, min(end_idx, d_len))
-                            
-                            if item.data_type in [DataType.Line, DataType.PnL, DataType.Balance]:
-                                visible_data = np.asarray(item.data[s_i:e_i], dtype=np.float64)
-                                if visible_data.size > 0 and np.any(~np.isnan(visible_data)):
-                                    local_y_min = min(local_y_min, float(np.nanmin(visible_data)))
-                                    local_y_max = max(local_y_max, float(np.nanmax(visible_data)))
-                                    found_data = True
-                                    
-                            elif item.data_type in [DataType.Volume, DataType.Histogram]:
-                                visible_data = np.asarray(item.data[s_i:e_i], dtype=np.float64)
-                                if visible_data.size > 0:
-                                    local_y_min = min(local_y_min, float(np.min(visible_data)))
-                                    local_y_max = max(local_y_max, float(np.max(visible_data)))
-                                    found_data = True
-                                    
-                            elif item.data_type == DataType.Bands:
-                                upper, lower = item.data
-                                v_upper = np.asarray(upper[s_i:e_i], dtype=np.float64)
-                                v_lower = np.asarray(lower[s_i:e_i], dtype=np.float64)
-                                if v_upper.size > 0:
-                                    local_y_max = max(local_y_max, float(np.nanmax(v_upper)))
-                                    found_data = True
-                                if v_lower.size > 0:
-                                    local_y_min = min(local_y_min, float(np.nanmin(v_lower)))
-                                    found_data = True
-                            
-                            elif item.data_type == DataType.Levels:
-                                levels = np.asarray(item.data, dtype=np.float64)
-                                if levels.size > 0:
-                                    local_y_min = min(local_y_min, float(np.min(levels)))
-                                    local_y_max = max(local_y_max, float(np.max(levels)))
-                                    found_data = True
-                                    
-                            # Note: Stairs/Signals usually handled by auto-scaling or fixed ranges
-                        except Exception:
-                            pass
+                    local_y_min, local_y_max = panel.getVisibleYRange(start_idx, end_idx)
+                    found_data = local_y_min <= local_y_max
 
                     # Apply if valid range found
                     if found_data and np.isfinite(local_y_min) and np.isfinite(local_y_max):
@@ -2527,10 +4103,11 @@ class DataPlotterImgBundleNew:
                 static.offset = 0
                 static.needs_update = True
             elif pan_end_clicked:
-                # Go to end
+                # Go to end (and stay pinned there while live bars are appended)
                 max_offset = max(0, bar_count - static.visible_count)
                 static.offset = max_offset
                 static.needs_update = True
+                static.follow_end = True
             else:
                 # Pan left/right with step
                 # Calculate step size
@@ -2608,13 +4185,34 @@ class DataPlotterImgBundleNew:
         if load_plots_clicked:
             self.LoadPlots()
 
-        # Scroll Bar
+        # Live append: keep the view pinned to the right edge after "Sona >|".
+        # Any navigation that leaves the edge (pan, slider, zoom sync) unpins it.
         bar_count = len(self.time_data)
+        if getattr(static, "follow_end", False):
+            prev_count = getattr(static, "followed_bar_count", bar_count)
+            edge_offsets = (max(0, prev_count - static.visible_count), max(0, bar_count - static.visible_count))
+            if static.offset not in edge_offsets:
+                static.follow_end = False
+            elif bar_count != prev_count:
+                static.offset = edge_offsets[1]
+                static.needs_update = True
+        static.followed_bar_count = bar_count
+
+        # Scroll Bar
         # Shared LOD info store for this frame (updated by hovered panel)
         shared_lod = {
             "show_trade_signals": self.show_trade_signals,
-            "trade_signals": self.trade_signals
+            "trade_signals": self.trade_signals,
+            "trade_signal_segments": self._get_trade_signal_segments(),
+            "line_lod_mode": self.line_lod_mode,
+            "profiler": profiler,
         }
+        if profiler is not None:
+            t_panels = profiler.lap("plot", "toolbar", t_frame)
+            frame_stats = profiler.stats("plot")
+            if frame_stats:
+                imgui.text("Frame  " + "  |  ".join(
+                    f"{stage} p50 {p50:.2f} / p99 {p99:.2f} ms" for stage, p50, p99 in frame_stats))
 
         if static.visible_count < bar_count:
             # Scrollbar header + inline LOD of hovered panel
@@ -2641,40 +4239,10 @@ class DataPlotterImgBundleNew:
                     imgui.separator()
                     imgui.text("Range Slider")
 
-                    # Get close price data for mini chart
-                    close_prices = None
-                    if self.shared_ohlc_array is not None and len(self.shared_ohlc_array) > 0:
-                        close_prices = self.shared_ohlc_array[:, 3]  # Close column
-                    elif self.shared_ohlc_reader is not None:
-                        try:
-                            ohlc_data = self.shared_ohlc_reader.ohlc
-                            if ohlc_data is not None and len(ohlc_data) > 0:
-                                close_prices = ohlc_data[:, 3]
-                        except Exception:
-                            pass
-
-                    if close_prices is not None and len(close_prices) > 0:
-                        # Prepare LOD data for mini chart (cache for performance)
-                        if not hasattr(static, 'range_slider_lod_cache'):
-                            # Use aggressive LOD for entire dataset
-                            full_x = np.arange(len(close_prices), dtype=np.float64)
-                            full_range = (0, len(close_prices))
-
-                            # Simple downsampling for mini chart
-                            target_points = 300  # Max points for mini chart
-                            if len(close_prices) > target_points:
-                                step = max(1, len(close_prices) // target_points)
-                                lod_indices = np.arange(0, len(close_prices), step, dtype=int)
-                                lod_x = full_x[lod_indices]
-                                lod_y = close_prices[lod_indices]
-                            else:
-                                lod_x = full_x
-                                lod_y = close_prices
-
-                            static.range_slider_lod_cache = (lod_x, lod_y)
-
-                        lod_x, lod_y = static.range_slider_lod_cache
+                    # High/low envelope of the whole series (per instance, refreshed per data version)
+                    overview = self._get_range_slider_overview()
 
+                    if overview is not None and len(overview.x) > 0:
                         # Mini chart size
                         plot_size = imgui.ImVec2(-1, self.range_slider_height)
                         plot_flags = (
@@ -2694,10 +4262,11 @@ class DataPlotterImgBundleNew:
                                 imgui.Cond_.always
                             )
 
-                            # Auto-fit Y axis to data
-                            if len(lod_y) > 0:
-                                y_min = float(np.nanmin(lod_y))
-                                y_max = float(np.nanmax(lod_y))
+                            # Auto-fit Y axis to the envelope
+                            with np.errstate(invalid="ignore"):
+                                y_min = float(np.fmin.reduce(overview.low))
+                                y_max = float(np.fmax.reduce(overview.high))
+                            if np.isfinite(y_min) and np.isfinite(y_max):
                                 y_range = y_max - y_min
                                 y_padding = y_range * 0.05 if y_range > 0 else 1.0
                                 implot.setup_axis_limits(
@@ -2706,9 +4275,11 @@ class DataPlotterImgBundleNew:
                                     imgui.Cond_.always
                                 )
 
-                            # Plot mini chart line
+                            # Plot mini chart: shaded high/low envelope + last close per bucket
+                            implot.set_next_fill_style(imgui.ImVec4(0.5, 0.7, 1.0, 0.35))
+                            implot.plot_shaded("Envelope", overview.x, overview.low, overview.high)
                             implot.set_next_line_style(imgui.ImVec4(0.5, 0.7, 1.0, 1.0))
-                            implot.plot_line("Data", lod_x, lod_y)
+                            implot.plot_line("Data", overview.x, overview.close)
 
                             # Get plot position and size for overlay drawing
                             plot_pos = implot.get_plot_pos()
@@ -2860,10 +4431,7 @@ class DataPlotterImgBundleNew:
                             implot.end_plot()
                 except Exception as e:
                     # Silently handle range slider errors to avoid breaking main plot
-                    try:
-                        print(f"[DEBUG] Range slider error: {e}")
-                    except Exception:
-                        pass
+                    logger.debug("Range slider error: %s", e)
             imgui.set_next_item_width(-1)
             old_offset = static.offset
             _, static.offset = imgui.slider_int(
@@ -2885,10 +4453,8 @@ class DataPlotterImgBundleNew:
             if 0 in self.panels:
                 p0 = self.panels[0]
                 if getattr(p0, 'ohlc_array', None) is None and getattr(p0, 'ohlc_data', None) is None:
-                    if self.shared_ohlc_array is not None:
-                        p0.setOHLC(self.shared_ohlc_array)
-                    elif self.shared_ohlc_reader is not None:
-                        p0.setOHLCData(self.shared_ohlc_reader)
+                    if self.shared_ohlc_array is not None or self.shared_ohlc_reader is not None:
+                        p0.setOHLCData(self.getOHLCData())
         except Exception:
             pass
 
@@ -2908,43 +4474,8 @@ class DataPlotterImgBundleNew:
 
             size = imgui.ImVec2(-1, -1)
             flags_int = subplot_flags
-            # Build row ratios from panels' height_ratio (normalized)
-            try:
-                ratios = [max(0.01, float(self.panels[idx].height_ratio)) for idx in sorted_indices]
-                total = sum(ratios)
-                row_ratios_list = [r/total for r in ratios] if total > 0 else None
-
-                print(f"[DEBUG] Panel height_ratios: {[self.panels[idx].height_ratio for idx in sorted_indices]}")
-                print(f"[DEBUG] Normalized ratios: {row_ratios_list}")
-
-                # Create SubplotsRowColRatios object if ratios are available
-                if row_ratios_list is not None:
-                    # Try creating SubplotsRowColRatios object with constructor
-                    try:
-                        row_col_ratios = implot.SubplotsRowColRatios(row_ratios_list, None)
-                        print(f"[DEBUG] Created SubplotsRowColRatios object successfully")
-                    except Exception as e1:
-                        print(f"[DEBUG] Constructor with args failed: {e1}")
-                        try:
-                            # Try without arguments
-                            row_col_ratios = implot.SubplotsRowColRatios()
-                            print(f"[DEBUG] Created empty SubplotsRowColRatios, trying to set rows...")
-                            # Try different methods to set ratios
-                            if hasattr(row_col_ratios, 'set_row_ratios'):
-                                row_col_ratios.set_row_ratios(row_ratios_list)
-                            elif hasattr(row_col_ratios, 'row_ratios'):
-                                row_col_ratios.row_ratios = row_ratios_list
-                            print(f"[DEBUG] Set row_ratios on object")
-                        except Exception as e2:
-                            print(f"[DEBUG] Empty constructor failed: {e2}")
-                            row_col_ratios = None
-                else:
-                    row_col_ratios = None
-            except Exception as e:
-                print(f"[DEBUG] Failed to create row_col_ratios: {e}")
-                import traceback
-                traceback.print_exc()
-                row_col_ratios = None
+            # Row ratios object is cached; rebuilt only when panels or height ratios change
+            row_col_ratios = self._get_row_col_ratios(sorted_indices)
 
             # FitToScreen calculation (if pending)
             if hasattr(static, "pending_fit") and static.pending_fit:
@@ -3087,6 +4618,12 @@ class DataPlotterImgBundleNew:
 
                 # Render panels with fixed or ratio-based pixel heights
                 base_height = 220.0
+                # Viewport culling: panels outside the scroll viewport (plus a small margin) are
+                # replaced by a placeholder of their last rendered height and skip LOD / Y-scale work.
+                # A panel that misses an axis update while hidden gets it once it scrolls into view.
+                cull_margin = 64.0
+                view_top = imgui.get_scroll_y() - cull_margin
+                view_bottom = imgui.get_scroll_y() + imgui.get_window_height() + cull_margin
                 for idx in sorted_indices:
                     panel = self.panels[idx]
 
@@ -3107,13 +4644,23 @@ class DataPlotterImgBundleNew:
                         # ratio mode: use base_height scaled by ratio
                         my_height_px = base_height * float(max(0.2, panel.height_ratio))
 
+                    panel_top = imgui.get_cursor_pos_y()
+                    panel_height = static.scroll_panel_heights.get(idx, my_height_px)
+                    if panel_top + panel_height < view_top or panel_top > view_bottom:
+                        imgui.dummy(imgui.ImVec2(desired_w if desired_w is not None else max(1.0, avail_width),
+                                                 panel_height))
+                        if static.needs_update:
+                            static.scroll_stale_panels.add(idx)
+                        imgui.dummy(imgui.ImVec2(1, 6))
+                        continue
+
                     shared_cross = locals().get('shared_cross', {"enabled": getattr(self, "enable_shared_crosshair", False), "x": None})
                     panel.render(
                         self.time_data,
                         lod_width,
                         static.offset,
                         static.visible_count,
-                        static.needs_update,
+                        static.needs_update or idx in static.scroll_stale_panels,
                         (desired_w, my_height_px),
                         getattr(self, "datetime_labels", None),
                         shared_cross,
@@ -3123,6 +4670,10 @@ class DataPlotterImgBundleNew:
                         static.panel_y_overrides,
                         shared_xaxis_enabled=getattr(self, "enable_shared_xaxis", False),
                     )
+                    static.scroll_stale_panels.discard(idx)
+                    # Placeholder height: the dummy item adds the same item spacing the panel did
+                    rendered_height = imgui.get_cursor_pos_y() - panel_top - imgui.get_style().item_spacing.y
+                    static.scroll_panel_heights[idx] = rendered_height if rendered_height > 0 else my_height_px
                     # Add a small separator between panels
                     imgui.dummy(imgui.ImVec2(1, 6))
 
@@ -3219,6 +4770,11 @@ class DataPlotterImgBundleNew:
             static.pending_fit = True
             static.needs_update = True
 
+        if profiler is not None:
+            profiler.lap("plot", "panels", t_panels)
+            profiler.lap("plot", "frame", t_frame)
+            profiler.end_frame()
+
 
 
 
@@ -251,6 +251,8 @@ namespace AlgoTradeWithOptimizationSupportWinFormsApp.Plotting
                     dynamic plotModule = Py.Import("dynamic_plotter");
 
                     // Panel verilerini Python dictionary'sine çevir
+                    // Sayısal seriler sabitlenip (pinned) pointer olarak gönderilir (bkz. PinnedArrays)
+                    using (var pinned = new PinnedArrays())
                     using (var panelDataDict = new PyDict())
                     {
                         foreach (var panelEntry in _panels)
@@ -281,13 +283,7 @@ namespace AlgoTradeWithOptimizationSupportWinFormsApp.Plotting
                                         if (series.Type == SeriesType.Line)
                                         {
                                             // Line grafiği için Values
-                                            using (var pyValues = new PyList())
-                                            {
-                                                foreach (var val in series.Values)
-                                                    pyValues.Append(new PyFloat(val));
-
-                                                seriesDict["values"] = pyValues;
-                                            }
+                                            seriesDict["values"] = pinned.Pin(series.Values.ToArray());
 
                                             seriesDict["linestyle"] = new PyString(series.LineStyle);
                                             seriesDict["linewidth"] = new PyFloat(series.LineWidth);
@@ -295,25 +291,10 @@ namespace AlgoTradeWithOptimizationSupportWinFormsApp.Plotting
                                         else if (series.Type == SeriesType.OHLC)
                                         {
                                             // OHLC için Opens, Highs, Lows, Closes
-                                            using (var pyOpens = new PyList())
-                                            using (var pyHighs = new PyList())
-                                            using (var pyLows = new PyList())
-                                            using (var pyCloses = new PyList())
-                                            {
-                                                foreach (var val in series.Opens)
-                                                    pyOpens.Append(new PyFloat(val));
-                                                foreach (var val in series.Highs)
-                                                    pyHighs.Append(new PyFloat(val));
-                                                foreach (var val in series.Lows)
-                                                    pyLows.Append(new PyFloat(val));
-                                                foreach (var val in series.Closes)
-                                                    pyCloses.Append(new PyFloat(val));
-
-                                                seriesDict["opens"] = pyOpens;
-                                                seriesDict["highs"] = pyHighs;
-                                                seriesDict["lows"] = pyLows;
-                                                seriesDict["closes"] = pyCloses;
-                                            }
+                                            seriesDict["opens"] = pinned.Pin(series.Opens.ToArray());
+                                            seriesDict["highs"] = pinned.Pin(series.Highs.ToArray());
+                                            seriesDict["lows"] = pinned.Pin(series.Lows.ToArray());
+                                            seriesDict["closes"] = pinned.Pin(series.Closes.ToArray());
                                         }
 
                                         seriesDict["label"] = new PyString(series.Label);
@@ -23,6 +23,23 @@ namespace AlgoTradeWithOptimizationSupportWinFormsApp.Plotting
         private readonly string _pythonDllPath;
         private readonly string _scriptDirectory;
 
+        // AlgoTradeWithPythonWithGemini venv site-packages adayları (ilk bulunan kullanılır)
+        internal static readonly string[] VenvSitePackagesPaths = new[]
+        {
+            @"D:\sage1\AlgoTrade\AlgoTradeWithPaythonWithGemini\.venv\Lib\site-packages",
+            @"D:\sage1\AlgoTrade\AlgoTradeWithPaythonWithGemini\venv\Lib\site-packages",
+            @"D:\Aykut\Projects\AlgoTradeWithPaythonWithGemini\venv\Lib\site-packages",
+            @"D:\Aykut\Projects\AlgoTradeWithPaythonWithGemini\.venv\Lib\site-packages",
+            @"D:\Aykut\Projects\AlgoTradeWithPaythonWithGemini\Aykut\venv\Lib\site-packages",
+        };
+
+        // AlgoTradeWithPythonWithGemini/src adayları (DataPlotterImgBundle.py için)
+        internal static readonly string[] GeminiSrcPaths = new[]
+        {
+            @"D:\sage1\AlgoTrade\AlgoTradeWithPaythonWithGemini\src",
+            @"D:\Aykut\Projects\AlgoTradeWithPaythonWithGemini\src",
+        };
+
         // Global Python initialization state (singleton pattern)
         private static bool _globalPythonInitialized = false;
         private static readonly object _pythonInitLock = new object();
@@ -39,7 +56,7 @@ namespace AlgoTradeWithOptimizationSupportWinFormsApp.Plotting
             InitializePython();
         }
 
-        private string FindPythonDll()
+        internal static string FindPythonDll()
         {
             // NOT: pythonnet 3.0.5, Python 3.14'ü henüz desteklemiyor.
             // Python 3.14 desteği geldiğinde buraya eklenebilir.
@@ -109,16 +126,7 @@ namespace AlgoTradeWithOptimizationSupportWinFormsApp.Plotting
                         dynamic sys = Py.Import("sys");
 
                         // 1. Venv site-packages yolu ekle
-                        string[] venvPaths = new[]
-                        {
-                            @"D:\sage1\AlgoTrade\AlgoTradeWithPaythonWithGemini\.venv\Lib\site-packages",
-                            @"D:\sage1\AlgoTrade\AlgoTradeWithPaythonWithGemini\venv\Lib\site-packages",
-                            @"D:\Aykut\Projects\AlgoTradeWithPaythonWithGemini\venv\Lib\site-packages",
-                            @"D:\Aykut\Projects\AlgoTradeWithPaythonWithGemini\.venv\Lib\site-packages",
-                            @"D:\Aykut\Projects\AlgoTradeWithPaythonWithGemini\Aykut\venv\Lib\site-packages",
-                        };
-
-                        foreach (var venvPath in venvPaths)
+                        foreach (var venvPath in VenvSitePackagesPaths)
                         {
                             if (Directory.Exists(venvPath))
                             {
@@ -129,12 +137,7 @@ namespace AlgoTradeWithOptimizationSupportWinFormsApp.Plotting
                         }
 
                         // 2. AlgoTradeWithPythonWithGemini/src yolu ekle (DataPlotterImgBundle.py için)
-                        string[] srcPaths = new[]
-                        {
-                            @"D:\sage1\AlgoTrade\AlgoTradeWithPaythonWithGemini\src",
-                            @"D:\Aykut\Projects\AlgoTradeWithPaythonWithGemini\src",
-                        };
-                        foreach (var srcPath in srcPaths)
+                        foreach (var srcPath in GeminiSrcPaths)
                         {
                             if (Directory.Exists(srcPath))
                             {
@@ -233,49 +236,39 @@ namespace AlgoTradeWithOptimizationSupportWinFormsApp.Plotting
                     // plotDataImgBundleNew modülünü import et
                     dynamic plotModule = Py.Import("plotDataImgBundleNew");
 
-                    // Tarihleri string'e çevir ("YYYY.MM.DD HH:MM:SS" formatı)
-                    var dateStrings = new List<string>();
-                    foreach (var dt in dates)
+                    // Tarihleri epoch saniyesine çevir (string üretilmez).
+                    // Duvar saati UTC kabul edilir; Python "YYYY.MM.DD HH:MM:SS" etiketlerini
+                    // yalnızca görünen tick'ler için formatlar.
+                    var epochSeconds = new long[dataCount];
+                    for (int i = 0; i < dataCount; i++)
                     {
-                        dateStrings.Add(dt.ToString("yyyy.MM.dd HH:mm:ss"));
+                        epochSeconds[i] = (dates[i].Ticks - DateTime.UnixEpoch.Ticks) / TimeSpan.TicksPerSecond;
                     }
 
-                    // Python listelerine çevir
-                    using (var pyDates = new PyList())
-                    using (var pyOpens = new PyList())
-                    using (var pyHighs = new PyList())
-                    using (var pyLows = new PyList())
-                    using (var pyCloses = new PyList())
-                    using (var pyVolumes = new PyList())
-                    using (var pyLots = new PyList())
-                    using (var pySinyal = new PyList())
-                    using (var pyKarZarar = new PyList())
-                    using (var pyBakiye = new PyList())
-                    using (var pyGetiri = new PyList())
-                    using (var pyGetiriNet = new PyList())
-                    using (var pyMost = new PyList())
-                    using (var pyExmov = new PyList())
+                    // Sayısal diziler eleman eleman PyFloat'a çevrilmez: diziler sabitlenir (pinned)
+                    // ve Python'a (address, length, dtype) olarak gönderilir, numpy kopyasız okur.
+                    // Bellek, plot_data_img_bundle_new dönene kadar (pencere kapanana kadar) sabit kalır.
+                    using (var pinned = new PinnedArrays())
                     {
-                        // Tarihleri ekle
-                        foreach (var date in dateStrings)
-                            pyDates.Append(new PyString(date));
+                        // Tarihler (epoch saniye, "<i8")
+                        var pyDates = pinned.Pin(epochSeconds);
 
                         // OHLC verileri
-                        foreach (var val in opens) pyOpens.Append(new PyFloat(val));
-                        foreach (var val in highs) pyHighs.Append(new PyFloat(val));
-                        foreach (var val in lows) pyLows.Append(new PyFloat(val));
-                        foreach (var val in closes) pyCloses.Append(new PyFloat(val));
+                        var pyOpens = pinned.Pin(opens.ToArray());
+                        var pyHighs = pinned.Pin(highs.ToArray());
+                        var pyLows = pinned.Pin(lows.ToArray());
+                        var pyCloses = pinned.Pin(closes.ToArray());
 
-                        // Volume/Lot
-                        foreach (var val in volumes) pyVolumes.Append(new PyFloat(val));
-                        foreach (var val in lots) pyLots.Append(new PyFloat(val));
+                        // Volume/Lot (long -> "<i8", Python tarafında float64'e çevrilir)
+                        var pyVolumes = pinned.Pin(volumes.ToArray());
+                        var pyLots = pinned.Pin(lots.ToArray());
 
                         // Trading verileri
-                        foreach (var val in sinyalList) pySinyal.Append(new PyFloat(val));
-                        foreach (var val in karZararFiyatList) pyKarZarar.Append(new PyFloat(val));
-                        foreach (var val in bakiyeFiyatList) pyBakiye.Append(new PyFloat(val));
-                        foreach (var val in getiriFiyatList) pyGetiri.Append(new PyFloat(val));
-                        foreach (var val in getiriFiyatNetList) pyGetiriNet.Append(new PyFloat(val));
+                        var pySinyal = pinned.Pin(sinyalList.ToArray());
+                        var pyKarZarar = pinned.Pin(karZararFiyatList.ToArray());
+                        var pyBakiye = pinned.Pin(bakiyeFiyatList.ToArray());
+                        var pyGetiri = pinned.Pin(getiriFiyatList.ToArray());
+                        var pyGetiriNet = pinned.Pin(getiriFiyatNetList.ToArray());
 
                         // Strategy indicators (dinamik) - Python dict olarak geçeceğiz
                         dynamic pyIndicators = new PyDict();
@@ -286,13 +279,8 @@ namespace AlgoTradeWithOptimizationSupportWinFormsApp.Plotting
                             {
                                 if (kvp.Value != null && kvp.Value.Length > 0)
                                 {
-                                    // Her indicator için Python listesi oluştur
-                                    dynamic pyList = new PyList();
-                                    foreach (var val in kvp.Value)
-                                    {
-                                        pyList.Append(new PyFloat(val));
-                                    }
-                                    pyIndicators[kvp.Key] = pyList;
+                                    // Her indicator dizisi doğrudan sabitlenir (kopya yok)
+                                    pyIndicators[kvp.Key] = pinned.Pin(kvp.Value);
                                     Console.WriteLine($"✓ Indicator '{kvp.Key}' Python'a gönderiliyor ({kvp.Value.Length} değer)");
                                 }
                             }
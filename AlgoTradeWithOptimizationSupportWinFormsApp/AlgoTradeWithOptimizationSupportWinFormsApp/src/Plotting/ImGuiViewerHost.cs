@@ -0,0 +1,257 @@
+using Newtonsoft.Json.Linq;
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Runtime.InteropServices;
+using System.Text;
+
+namespace AlgoTradeWithOptimizationSupportWinFormsApp.Plotting
+{
+    /// <summary>
+    /// ImGui görüntüleyicisini ayrı bir Python sürecinde (imgui_viewer.py) açar.
+    ///
+    /// ImGuiPlotter.PlotDataBundle'dan farkı: Python gömülü interpreter'da GIL tutularak
+    /// çalıştırılmaz. Diziler bir oturum klasörüne .npy olarak yazılır (görüntüleyici
+    /// np.load(mmap_mode='r') ile kopyasız eşler), manifest.json en son yazılır (sinyal)
+    /// ve görüntüleyici beklenmeden başlatılır. Birden fazla backtest yan yana açılabilir,
+    /// optimizer bloklanmaz.
+    ///
+    /// Kullanım:
+    ///   var process = ImGuiViewerHost.OpenBacktest(dates, opens, highs, lows, closes, volumes, lots,
+    ///                                              sinyalList, karZararList, bakiyeList, ...);
+    ///
+    /// Çok sayıda backtest tek pencerede sekmeler halinde karşılaştırılacaksa
+    /// PublishToMultiViewer kullanılır (imgui_multi_viewer.py; aynı OHLC'li
+    /// backtest'ler bar verisini ortak kullanır).
+    /// </summary>
+    public static class ImGuiViewerHost
+    {
+        private const string ManifestName = "manifest.json";
+        private const int SessionFormat = 1;
+
+        private static readonly object MultiViewerLock = new object();
+        private static Process? _multiViewerProcess;
+
+        /// <summary>
+        /// Oturumu geçici klasöre yazar ve görüntüleyiciyi başlatır (beklemez)
+        /// </summary>
+        public static Process OpenBacktest(
+            List<DateTime> dates,
+            List<double> opens,
+            List<double> highs,
+            List<double> lows,
+            List<double> closes,
+            List<long> volumes,
+            List<long> lots,
+            List<double> sinyalList,
+            List<double> karZararFiyatList,
+            List<double> bakiyeFiyatList,
+            List<double> getiriFiyatList,
+            List<double> getiriFiyatNetList,
+            Dictionary<string, double[]>? strategyIndicators = null,
+            string title = "AlgoTrade",
+            string periyot = "1H",
+            string? pythonExe = null,
+            string? scriptDirectory = null)
+        {
+            string sessionDir = Path.Combine(
+                Path.GetTempPath(),
+                "AlgoTradeViewer",
+                $"{DateTime.Now:yyyyMMdd_HHmmss}_{Guid.NewGuid():N}");
+
+            WriteSession(sessionDir, dates, opens, highs, lows, closes, volumes, lots,
+                         sinyalList, karZararFiyatList, bakiyeFiyatList, getiriFiyatList, getiriFiyatNetList,
+                         strategyIndicators, title, periyot);
+
+            return LaunchViewer(sessionDir, pythonExe, scriptDirectory);
+        }
+
+        /// <summary>
+        /// Oturumu spool klasörüne yazar; çok sekmeli görüntüleyici çalışmıyorsa bir kez başlatır.
+        /// Görüntüleyici spool klasörünü tarar ve her yeni oturumu bir sekme olarak açar.
+        /// </summary>
+        /// <returns>Oturum klasörü</returns>
+        public static string PublishToMultiViewer(
+            List<DateTime> dates,
+            List<double> opens,
+            List<double> highs,
+            List<double> lows,
+            List<double> closes,
+            List<long> volumes,
+            List<long> lots,
+            List<double> sinyalList,
+            List<double> karZararFiyatList,
+            List<double> bakiyeFiyatList,
+            List<double> getiriFiyatList,
+            List<double> getiriFiyatNetList,
+            Dictionary<string, double[]>? strategyIndicators = null,
+            string title = "AlgoTrade",
+            string periyot = "1H",
+            string? spoolDirectory = null,
+            string? pythonExe = null,
+            string? scriptDirectory = null)
+        {
+            spoolDirectory ??= Path.Combine(Path.GetTempPath(), "AlgoTradeViewer", "spool");
+            string sessionDir = Path.Combine(spoolDirectory, $"{DateTime.Now:yyyyMMdd_HHmmss}_{Guid.NewGuid():N}");
+
+            WriteSession(sessionDir, dates, opens, highs, lows, closes, volumes, lots,
+                         sinyalList, karZararFiyatList, bakiyeFiyatList, getiriFiyatList, getiriFiyatNetList,
+                         strategyIndicators, title, periyot);
+
+            lock (MultiViewerLock)
+            {
+                if (_multiViewerProcess == null || _multiViewerProcess.HasExited)
+                    _multiViewerProcess = LaunchScript("imgui_multi_viewer.py", spoolDirectory, pythonExe, scriptDirectory);
+            }
+            return sessionDir;
+        }
+
+        /// <summary>
+        /// Backtest dizilerini .npy dosyaları olarak yazar, manifest.json'u en son ve atomik olarak yayınlar
+        /// </summary>
+        /// <returns>Manifest dosyasının yolu</returns>
+        public static string WriteSession(
+            string sessionDir,
+            List<DateTime> dates,
+            List<double> opens,
+            List<double> highs,
+            List<double> lows,
+            List<double> closes,
+            List<long> volumes,
+            List<long> lots,
+            List<double> sinyalList,
+            List<double> karZararFiyatList,
+            List<double> bakiyeFiyatList,
+            List<double> getiriFiyatList,
+            List<double> getiriFiyatNetList,
+            Dictionary<string, double[]>? strategyIndicators = null,
+            string title = "AlgoTrade",
+            string periyot = "1H")
+        {
+            if (dates == null || closes == null || dates.Count == 0)
+                throw new ArgumentException("dates ve closes verileri gerekli!");
+
+            Directory.CreateDirectory(sessionDir);
+
+            // Tarihler epoch saniye (duvar saati UTC kabul edilir, bkz. ImGuiPlotter)
+            var epochSeconds = new long[dates.Count];
+            for (int i = 0; i < dates.Count; i++)
+                epochSeconds[i] = (dates[i].Ticks - DateTime.UnixEpoch.Ticks) / TimeSpan.TicksPerSecond;
+
+            var series = new JObject
+            {
+                ["dates"] = WriteNpy(sessionDir, "dates", epochSeconds, "<i8"),
+                ["opens"] = WriteNpy(sessionDir, "opens", opens),
+                ["highs"] = WriteNpy(sessionDir, "highs", highs),
+                ["lows"] = WriteNpy(sessionDir, "lows", lows),
+                ["closes"] = WriteNpy(sessionDir, "closes", closes),
+                ["volumes"] = WriteNpy<long>(sessionDir, "volumes", CollectionsMarshal.AsSpan(volumes), "<i8"),
+                ["lots"] = WriteNpy<long>(sessionDir, "lots", CollectionsMarshal.AsSpan(lots), "<i8"),
+                ["sinyal_list"] = WriteNpy(sessionDir, "sinyal_list", sinyalList),
+                ["kar_zarar_fiyat_list"] = WriteNpy(sessionDir, "kar_zarar_fiyat_list", karZararFiyatList),
+                ["bakiye_fiyat_list"] = WriteNpy(sessionDir, "bakiye_fiyat_list", bakiyeFiyatList),
+                ["getiri_fiyat_list"] = WriteNpy(sessionDir, "getiri_fiyat_list", getiriFiyatList),
+                ["getiri_fiyat_net_list"] = WriteNpy(sessionDir, "getiri_fiyat_net_list", getiriFiyatNetList),
+            };
+
+            var indicators = new JObject();
+            if (strategyIndicators != null)
+            {
+                int i = 0;
+                foreach (var kvp in strategyIndicators)
+                {
+                    if (kvp.Value != null && kvp.Value.Length > 0)
+                        indicators[kvp.Key] = WriteNpy(sessionDir, $"ind_{i++}", kvp.Value, "<f8");
+                }
+            }
+
+            var manifest = new JObject
+            {
+                ["format"] = SessionFormat,
+                ["title"] = title,
+                ["periyot"] = periyot,
+                ["n_bars"] = closes.Count,
+                ["series"] = series,
+                ["indicators"] = indicators,
+            };
+
+            // Manifest en son yazılır: görüntüleyici için "veri hazır" sinyali
+            string manifestPath = Path.Combine(sessionDir, ManifestName);
+            string tmpPath = manifestPath + ".tmp";
+            File.WriteAllText(tmpPath, manifest.ToString(), new UTF8Encoding(false));
+            File.Move(tmpPath, manifestPath, overwrite: true);
+            return manifestPath;
+        }
+
+        /// <summary>
+        /// imgui_viewer.py'yi ayrı süreçte başlatır; venv site-packages ve Gemini/src yolları PYTHONPATH'e eklenir
+        /// </summary>
+        public static Process LaunchViewer(string sessionDir, string? pythonExe = null, string? scriptDirectory = null)
+            => LaunchScript("imgui_viewer.py", sessionDir, pythonExe, scriptDirectory);
+
+        private static Process LaunchScript(string scriptName, string argument, string? pythonExe, string? scriptDirectory)
+        {
+            scriptDirectory ??= Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "src", "Plotting");
+            pythonExe ??= Path.Combine(Path.GetDirectoryName(ImGuiPlotter.FindPythonDll())!, "python.exe");
+
+            var pythonPath = new List<string> { scriptDirectory };
+            foreach (var path in ImGuiPlotter.VenvSitePackagesPaths)
+            {
+                if (Directory.Exists(path)) { pythonPath.Add(path); break; }
+            }
+            foreach (var path in ImGuiPlotter.GeminiSrcPaths)
+            {
+                if (Directory.Exists(path)) { pythonPath.Add(path); break; }
+            }
+
+            var startInfo = new ProcessStartInfo
+            {
+                FileName = pythonExe,
+                UseShellExecute = false,
+                WorkingDirectory = scriptDirectory,
+            };
+            startInfo.ArgumentList.Add(Path.Combine(scriptDirectory, scriptName));
+            startInfo.ArgumentList.Add(argument);
+            startInfo.Environment["PYTHONPATH"] = string.Join(Path.PathSeparator, pythonPath);
+
+            var process = Process.Start(startInfo)
+                ?? throw new Exception($"Görüntüleyici başlatılamadı: {pythonExe}");
+            System.Diagnostics.Debug.WriteLine($"✓ ImGui viewer başlatıldı (pid {process.Id}): {scriptName} {argument}");
+            return process;
+        }
+
+        private static string WriteNpy(string sessionDir, string name, List<double> values)
+            => WriteNpy<double>(sessionDir, name, CollectionsMarshal.AsSpan(values), "<f8");
+
+        /// <summary>
+        /// 1 boyutlu diziyi NPY v1.0 formatında yazar (header + ham little-endian veri, kopya yok)
+        /// </summary>
+        private static string WriteNpy<T>(string sessionDir, string name, ReadOnlySpan<T> values, string descr)
+            where T : struct
+        {
+            string fileName = name + ".npy";
+
+            // Header: magic + version + uint16 uzunluk + dict; toplam 64 byte'a hizalanır ve '\n' ile biter
+            string dict = $"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({values.Length},), }}";
+            int preamble = 6 + 2 + 2;
+            int padding = 64 - (preamble + dict.Length + 1) % 64;
+            if (padding == 64) padding = 0;
+            string header = dict + new string(' ', padding) + "\n";
+
+            using (var stream = File.Create(Path.Combine(sessionDir, fileName)))
+            using (var writer = new BinaryWriter(stream))
+            {
+                writer.Write(new byte[] { 0x93, (byte)'N', (byte)'U', (byte)'M', (byte)'P', (byte)'Y', 1, 0 });
+                writer.Write((ushort)header.Length);
+                writer.Write(Encoding.ASCII.GetBytes(header));
+                writer.Write(MemoryMarshal.AsBytes(values));
+            }
+            return fileName;
+        }
+
+        private static string WriteNpy<T>(string sessionDir, string name, T[] values, string descr)
+            where T : struct
+            => WriteNpy(sessionDir, name, new ReadOnlySpan<T>(values), descr);
+    }
+}
@@ -0,0 +1,60 @@
+using Python.Runtime;
+using System;
+using System.Collections.Generic;
+using System.Runtime.InteropServices;
+
+namespace AlgoTradeWithOptimizationSupportWinFormsApp.Plotting
+{
+    /// <summary>
+    /// .NET dizilerini GC'de sabitler (pinned) ve Python'a (address, length, dtype)
+    /// tuple'ı olarak gönderir. Python tarafında numpy_bridge.as_numpy bu belleği
+    /// np.frombuffer ile kopyalamadan okur.
+    ///
+    /// Kullanım:
+    ///   using (var pinned = new PinnedArrays())
+    ///   {
+    ///       var pyCloses = pinned.Pin(closes.ToArray());
+    ///       plotModule.plot_xxx(pyCloses, ...);   // Python çağrısı bitene kadar bellek sabit kalır
+    ///   }
+    /// </summary>
+    public sealed class PinnedArrays : IDisposable
+    {
+        private readonly List<GCHandle> _handles = new List<GCHandle>();
+        private readonly List<PyObject> _descriptors = new List<PyObject>();
+
+        /// <summary>double[] için "&lt;f8" tanımı döndürür (GIL altında çağrılmalı)</summary>
+        public PyObject Pin(double[] values) => PinArray(values, values.Length, "<f8");
+
+        /// <summary>long[] için "&lt;i8" tanımı döndürür (GIL altında çağrılmalı)</summary>
+        public PyObject Pin(long[] values) => PinArray(values, values.Length, "<i8");
+
+        private PyObject PinArray(Array values, int length, string dtype)
+        {
+            var handle = GCHandle.Alloc(values, GCHandleType.Pinned);
+            _handles.Add(handle);
+
+            var descriptor = new PyTuple(new PyObject[]
+            {
+                new PyInt(handle.AddrOfPinnedObject().ToInt64()),
+                new PyInt(length),
+                new PyString(dtype)
+            });
+            _descriptors.Add(descriptor);
+            return descriptor;
+        }
+
+        public void Dispose()
+        {
+            foreach (var descriptor in _descriptors)
+                descriptor.Dispose();
+            _descriptors.Clear();
+
+            foreach (var handle in _handles)
+            {
+                if (handle.IsAllocated)
+                    handle.Free();
+            }
+            _handles.Clear();
+        }
+    }
+}
@@ -0,0 +1,372 @@
+"""
+benchmark_lod.py
+----------------
+DataPlotterImgBundleNew LOD ve render hattı için ekransız (headless) benchmark.
+
+Ölçülenler (her veri boyutu x zoom seviyesi x piksel genişliği için):
+    lod_ohlc, lod_line_minmax, lod_line_m4, lod_bars, lod_stairs  -> Panel._calculate_lod_*
+    y_autoscale                                                   -> Panel.getVisibleYRange
+    render_cold / render_cached                                   -> Panel.render (LOD cache boş / dolu)
+Ayrıca veri boyutu başına bir kez: setup_ohlc (setOHLC + piramit + range index).
+
+Pencere açılmaz: Panel.render sırasında modüldeki implot/imgui, çizim çağrılarını
+yalnızca sayan sahte nesnelerle değiştirilir (enum'lar gerçek imgui_bundle'dan gelir).
+
+Çıktı JSON'dur (sürümler arası takip için); her sonuç satırı:
+    {"case", "bars", "zoom", "visible_bars", "width_px", "calls",
+     "latency_us": {"min", "p50", "p95", "mean"},
+     "alloc_peak_bytes", "alloc_retained_bytes", "alloc_blocks", "points"}
+
+Kullanım:
+    python benchmark_lod.py                              # 10k / 100k / 1M / 5M
+    python benchmark_lod.py --sizes 10000 100000 --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+
+import DataPlotterImgBundleNew as dp
+from DataPlotterImgBundleNew import DataType, LODMode, Panel
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000, 5_000_000)
+# Görünür bar oranı (1.0 = tüm veri) veya sabit bar sayısı (int)
+DEFAULT_ZOOMS = (1.0, 0.1, 0.01, 200)
+DEFAULT_WIDTHS = (800, 1920, 3840)
+
+
+# ---------------------------------------------------------------------------
+# Sahte implot / imgui (çizim yapmaz, yalnızca gönderilen nokta sayısını sayar)
+# ---------------------------------------------------------------------------
+
+class _Vec:
+    def __init__(self, x=0.0, y=0.0):
+        self.x = x
+        self.y = y
+
+
+class _Range:
+    def __init__(self, lo=0.0, hi=1.0):
+        self.min = lo
+        self.max = hi
+
+
+class _Limits:
+    def __init__(self):
+        self.x = _Range()
+        self.y = _Range()
+
+
+class _NullDrawList:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _NullImPlot:
+    """implot yerine geçer: eksen limitlerini tutar, plot_* çağrılarındaki noktaları sayar."""
+
+    def __init__(self, real, plot_size):
+        self._real = real
+        self._plot_size = plot_size
+        self._limits = _Limits()
+        self._draw_list = _NullDrawList()
+        self.points = 0
+        self.items = 0
+
+    def __getattr__(self, name):
+        # Enum'lar (Flags_, ImAxis_, LineFlags_, Marker_ ...) gerçek modülden
+        if name.endswith("_"):
+            return getattr(self._real, name)
+        return lambda *args, **kwargs: None
+
+    def begin_plot(self, *args, **kwargs):
+        return True
+
+    def setup_axis_limits(self, axis, v_min, v_max, cond=None):
+        target = self._limits.x if axis == self._real.ImAxis_.x1 else self._limits.y
+        target.min, target.max = float(v_min), float(v_max)
+
+    def get_plot_limits(self, *args, **kwargs):
+        return self._limits
+
+    def get_plot_size(self):
+        return _Vec(*self._plot_size)
+
+    def get_plot_pos(self):
+        return _Vec(0.0, 0.0)
+
+    def get_plot_draw_list(self):
+        return self._draw_list
+
+    def get_plot_mouse_pos(self, *args, **kwargs):
+        return _Vec(0.0, 0.0)
+
+    def plot_to_pixels(self, x, y, *args, **kwargs):
+        return _Vec(float(x), float(y))
+
+    def is_plot_hovered(self):
+        return False
+
+    def _count(self, *args, **kwargs):
+        self.items += 1
+        if len(args) > 1:
+            self.points += int(np.size(args[1]))
+
+    plot_line = plot_bars = plot_scatter = plot_stairs = plot_error_bars = _count
+
+
+class _NullIO:
+    mouse_wheel = 0.0
+    mouse_delta = _Vec(0.0, 0.0)
+
+
+class _NullImGui:
+    """imgui yerine geçer: fare/hover sorguları False, metin ölçüleri sabit."""
+
+    def __init__(self, real):
+        self._real = real
+        self._io = _NullIO()
+
+    def __getattr__(self, name):
+        if name.endswith("_") or name.startswith("ImVec"):
+            return getattr(self._real, name)
+        return lambda *args, **kwargs: False
+
+    def calc_text_size(self, text, *args, **kwargs):
+        lines = str(text).split("\n")
+        return _Vec(7.0 * max(len(line) for line in lines), 13.0 * len(lines))
+
+    def get_text_line_height(self):
+        return 13.0
+
+    def get_io(self):
+        return self._io
+
+
+@contextmanager
+def headless_imgui(plot_size):
+    """DataPlotterImgBundleNew içindeki implot/imgui'yi geçici olarak sahteleriyle değiştirir."""
+    real_implot, real_imgui = dp.implot, dp.imgui
+    fake_implot = _NullImPlot(real_implot, plot_size)
+    dp.implot, dp.imgui = fake_implot, _NullImGui(real_imgui)
+    try:
+        yield fake_implot
+    finally:
+        dp.implot, dp.imgui = real_implot, real_imgui
+
+
+# ---------------------------------------------------------------------------
+# Sentetik veri
+# ---------------------------------------------------------------------------
+
+def make_dataset(n_bars, seed=42):
+    """Rastgele yürüyüş OHLC, hacim, iki çizgi serisi ve -1/0/1 sinyal dizisi üretir."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 0.5, n_bars))
+    open_ = np.empty_like(close)
+    open_[0] = close[0]
+    open_[1:] = close[:-1]
+    spread = np.abs(rng.normal(0.0, 0.4, n_bars))
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    ohlc = np.column_stack((open_, high, low, close))
+
+    volume = rng.integers(100, 10_000, n_bars).astype(np.float64)
+    # Trend takipçisi benzeri sinyal: ortalama 50 barlık durum blokları
+    changes = rng.random(n_bars) < 0.02
+    signals = rng.choice(np.array([-1.0, 0.0, 1.0]), size=int(changes.sum()) + 1)[np.cumsum(changes)]
+    ema = close.copy()
+    ema[1:] = (close[1:] + close[:-1]) / 2.0
+    balance = 100_000.0 + np.cumsum(rng.normal(0.0, 50.0, n_bars))
+
+    return {
+        "time": np.arange(n_bars, dtype=np.float64),
+        "ohlc": ohlc,
+        "volume": volume,
+        "line": ema,
+        "balance": balance,
+        "signals": signals,
+    }
+
+
+def build_panel(data):
+    """Fiyat + EMA + Balance + Volume + Stairs içeren tek bir panel kurar."""
+    panel = Panel(0)
+    panel.setOHLC(data["ohlc"])
+    panel.setData(0, DataType.Line, data["line"], "EMA")
+    panel.setData(1, DataType.Balance, data["balance"], "Balance")
+    panel.setData(2, DataType.Volume, data["volume"], "Volume")
+    panel.setData(3, DataType.Stairs, data["signals"], "Signal")
+    return panel
+
+
+def visible_window(n_bars, zoom):
+    """Zoom değerinden (offset, visible_count) üretir; görünüm verinin sonuna hizalanır."""
+    if isinstance(zoom, float):
+        count = max(1, int(round(n_bars * zoom)))
+    else:
+        count = max(1, min(int(zoom), n_bars))
+    return n_bars - count, count
+
+
+# ---------------------------------------------------------------------------
+# Ölçüm
+# ---------------------------------------------------------------------------
+
+def measure(fn, repeat, setup=None):
+    """
+    fn'i repeat kez çalıştırıp gecikme istatistiklerini (µs), ardından tracemalloc altında
+    tek bir çağrının tahsis (allocation) bilgisini döndürür. setup her çağrıdan önce çalışır.
+    """
+    samples = np.empty(repeat, dtype=np.int64)
+    result = None
+    for i in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter_ns()
+        result = fn()
+        samples[i] = time.perf_counter_ns() - t0
+    us = samples / 1e3
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        base_current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    finally:
+        tracemalloc.stop()
+
+    return result, {
+        "calls": int(repeat),
+        "latency_us": {
+            "min": round(float(us.min()), 2),
+            "p50": round(float(np.percentile(us, 50)), 2),
+            "p95": round(float(np.percentile(us, 95)), 2),
+            "mean": round(float(us.mean()), 2),
+        },
+        "alloc_peak_bytes": int(peak - base_current),
+        "alloc_retained_bytes": int(current - base_current),
+        "alloc_blocks": int(blocks),
+    }
+
+
+def _points(result):
+    """LOD çıktısındaki nokta sayısı (x dizisinin uzunluğu)."""
+    try:
+        return int(len(result[0]))
+    except Exception:
+        return None
+
+
+def bench_size(n_bars, zooms, widths, repeat):
+    data = make_dataset(n_bars)
+    time_data = data["time"]
+    results = []
+
+    panel, setup_stats = measure(lambda: build_panel(data), 1)
+    results.append(dict(case="setup_ohlc", bars=n_bars, **setup_stats))
+    ohlc = panel._get_ohlc_source()
+    stairs_transitions = next(it for it in panel.data_items if it.data_type == DataType.Stairs).transitions.positions
+
+    for zoom in zooms:
+        offset, count = visible_window(n_bars, zoom)
+        visible_range = (float(offset), float(offset + count))
+        window = panel._visible_window(time_data, visible_range)
+
+        for width in widths:
+            common = dict(bars=n_bars, zoom=zoom, visible_bars=count, width_px=width)
+            cases = {
+                "lod_ohlc": lambda: panel._calculate_lod_ohlc(time_data, ohlc, visible_range, width, window),
+                "lod_line_minmax": lambda: panel._calculate_lod_line(
+                    time_data, data["line"], visible_range, width, LODMode.MinMax, window),
+                "lod_line_m4": lambda: panel._calculate_lod_line(
+                    time_data, data["line"], visible_range, width, LODMode.M4, window),
+                "lod_bars": lambda: panel._calculate_lod_bars(time_data, data["volume"], visible_range, width, window),
+                "lod_stairs": lambda: panel._calculate_lod_stairs(
+                    time_data, data["signals"], visible_range, width, window, stairs_transitions),
+            }
+            for name, fn in cases.items():
+                out, stats = measure(fn, repeat)
+                results.append(dict(case=name, points=_points(out), **common, **stats))
+
+            _, stats = measure(lambda: panel.getVisibleYRange(offset, offset + count), repeat)
+            results.append(dict(case="y_autoscale", **common, **stats))
+
+            with headless_imgui((float(width), 400.0)) as fake:
+                def render():
+                    fake.points = 0
+                    panel.render(time_data, float(width), offset, count, True, (float(width), 400.0),
+                                 None, None, {"line_lod_mode": LODMode.MinMax}, None)
+                    return fake.points
+
+                def clear_caches():
+                    panel._lod_cache.clear()
+                    panel._y_range_cache = None
+
+                points, stats = measure(render, repeat, setup=clear_caches)
+                results.append(dict(case="render_cold", points=points, **common, **stats))
+                render()
+                points, stats = measure(render, repeat)
+                results.append(dict(case="render_cached", points=points, **common, **stats))
+
+    return results
+
+
+def _max_rss_kb():
+    try:
+        import resource
+        return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    except Exception:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless LOD/render benchmark for DataPlotterImgBundleNew")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Bar counts")
+    parser.add_argument("--widths", type=int, nargs="+", default=list(DEFAULT_WIDTHS), help="Plot widths in pixels")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per case")
+    parser.add_argument("--output", default=None, help="Write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "repeat": args.repeat,
+        },
+        "results": [],
+    }
+    for n_bars in args.sizes:
+        print(f"benchmark: {n_bars} bars ...", file=sys.stderr)
+        report["results"].extend(bench_size(n_bars, DEFAULT_ZOOMS, args.widths, args.repeat))
+    # ru_maxrss: Linux'ta KB, macOS'ta byte; Windows'ta None
+    report["meta"]["max_rss_kb"] = _max_rss_kb()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"benchmark: {len(report['results'])} results -> {os.path.abspath(args.output)}", file=sys.stderr)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
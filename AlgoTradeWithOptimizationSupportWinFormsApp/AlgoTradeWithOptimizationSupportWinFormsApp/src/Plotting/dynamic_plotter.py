@@ -5,8 +5,23 @@ Line ve OHLC (candlestick) desteği
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.patches import Rectangle
 
+from numpy_bridge import as_numpy
+
+# Sayısal seri alanları (as_numpy ile kopyasız okunur)
+_ARRAY_KEYS = ('values', 'opens', 'highs', 'lows', 'closes')
+
+
+def _normalize_series(series):
+    """Serinin sayısal alanlarını numpy array'e çevirir (girdi dict'i değiştirilmez)."""
+    series = dict(series)
+    for key in _ARRAY_KEYS:
+        if key in series:
+            series[key] = as_numpy(series[key])
+    return series
+
 
 def plot_candlestick(ax, bar_indices, opens, highs, lows, closes, color='black', alpha=0.8):
     """
@@ -61,6 +76,8 @@ def plot_dynamic_panels(panel_data, config):
     Parameters:
     -----------
     panel_data : dict
+        Sayısal alanlar (values, opens, highs, lows, closes) liste, ndarray, buffer
+        veya (address, length, dtype) pointer tanımı olabilir (bkz. numpy_bridge).
         {
             0: [  # Panel 0
                 {
@@ -106,6 +123,10 @@ def plot_dynamic_panels(panel_data, config):
         print("=== plot_dynamic_panels BAŞLADI ===")
         print(f"Panel sayısı: {len(panel_data)}")
 
+        # Sayısal alanları numpy'a çevir (pointer/buffer ise kopyasız)
+        panel_data = {idx: [_normalize_series(s) for s in series_list]
+                      for idx, series_list in panel_data.items()}
+
         # Panel index'lerini sırala
         panel_indices = sorted(panel_data.keys())
         num_panels = len(panel_indices)
@@ -149,7 +170,7 @@ def plot_dynamic_panels(panel_data, config):
                     linewidth = series.get('linewidth', 1.5)
 
                     # Bar index kullan (tarih yerine)
-                    bar_indices = list(range(len(values)))
+                    bar_indices = np.arange(len(values))
 
                     # Çiz
                     ax.plot(bar_indices, values,
@@ -166,7 +187,7 @@ def plot_dynamic_panels(panel_data, config):
                     lows = series['lows']
                     closes = series['closes']
 
-                    bar_indices = list(range(len(opens)))
+                    bar_indices = np.arange(len(opens))
 
                     # Candlestick çiz
                     plot_candlestick(ax, bar_indices, opens, highs, lows, closes,
@@ -189,17 +210,18 @@ def plot_dynamic_panels(panel_data, config):
             ax.grid(True, alpha=0.3, linestyle='--')
 
             # Y ekseninde sıfır çizgisi ekle (eğer veriler pozitif/negatif geçiş yapıyorsa)
-            y_values = []
+            y_arrays = []
             for s in series_list:
                 if s.get('type', 'line') == 'line':
-                    y_values.extend(s['values'])
+                    y_arrays.append(s['values'])
                 elif s.get('type', 'line') == 'ohlc':
-                    y_values.extend(s['lows'])
-                    y_values.extend(s['highs'])
+                    y_arrays.append(s['lows'])
+                    y_arrays.append(s['highs'])
+            y_arrays = [a for a in y_arrays if len(a) > 0]
 
-            if y_values:
-                y_min = min(y_values)
-                y_max = max(y_values)
+            if y_arrays:
+                y_min = min(float(np.min(a)) for a in y_arrays)
+                y_max = max(float(np.max(a)) for a in y_arrays)
                 if y_min < 0 < y_max:
                     ax.axhline(y=0, color='black', linestyle='-', linewidth=1, alpha=0.5)
 
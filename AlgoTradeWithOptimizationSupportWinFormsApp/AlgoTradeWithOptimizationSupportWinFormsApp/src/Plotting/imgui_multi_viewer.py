@@ -0,0 +1,262 @@
+"""
+imgui_multi_viewer.py
+---------------------
+Birden fazla backtest'i tek pencerede, sekmeler halinde gösteren görüntüleyici.
+
+imgui_viewer.py her backtest için ayrı bir süreç/pencere açar; optimizasyon
+sonrası onlarca sonuç karşılaştırılırken bu hem bellek hem pencere kalabalığı
+demektir. Bu görüntüleyici tek süreçte N adet DataPlotterImgBundleNew tutar:
+
+    - Veri bir kuyruktan gelir: aynı süreçten submit() (thread-safe) veya bir
+      spool klasörüne yazılan oturumlar (imgui_viewer.write_session formatı,
+      manifest.json en son yazılır) periyodik olarak taranır.
+    - Her karede kuyruktan en fazla bir oturum kurulur; arayüz donmaz.
+    - Yalnızca seçili sekmenin Plot()'u çağrılır; gizli sekmeler hiç çizilmez
+      (görünüm durumu her plotter'da saklandığından geri dönülünce korunur).
+    - Aynı OHLC verisiyle çalışan backtest'ler (aynı sembol/periyot, farklı
+      parametre) bar verisini, LOD piramidini ve Y-aralık indeksini ortak
+      kullanır (bkz. DataPlotterImgBundleNew.shareOHLCFrom); yalnızca sinyal,
+      kar/zarar ve bakiye serileri backtest başına bellek tutar.
+
+Kullanım:
+    python imgui_multi_viewer.py <spool_dir>
+
+    # Host tarafı (her backtest için)
+    publish_session(spool_dir, title="BTCUSDT #12", periyot="1H", dates=..., opens=..., ...)
+"""
+
+import hashlib
+import os
+import queue
+import subprocess
+import sys
+import time
+import uuid
+
+import numpy as np
+
+from imgui_viewer import MANIFEST_NAME, load_session, write_session
+
+# OHLC paylaşım anahtarına giren seriler (aynıysa bar verisi ortak kullanılır)
+OHLC_KEY_SERIES = ("dates", "opens", "highs", "lows", "closes", "volumes", "lots")
+
+
+def _ohlc_key(kwargs):
+    """Bar verisinin içerik özeti; aynı OHLC ile kurulan backtest'ler aynı anahtarı alır."""
+    h = hashlib.blake2b(digest_size=16)
+    for name in OHLC_KEY_SERIES:
+        arr = np.ascontiguousarray(np.asarray(kwargs.get(name)))
+        h.update(f"{name}:{arr.dtype.str}:{arr.shape};".encode())
+        if arr.dtype != object:
+            h.update(arr.reshape(-1).view(np.uint8))
+        else:
+            h.update(repr(arr.tolist()).encode())
+    return h.hexdigest()
+
+
+class _Tab:
+    """Bir sekme: plotter ve OHLC paylaşım anahtarı."""
+
+    def __init__(self, tab_id, title, plotter, ohlc_key=None):
+        self.tab_id = tab_id
+        self.title = title
+        self.plotter = plotter
+        self.ohlc_key = ohlc_key
+        self.open = True
+
+    @property
+    def label(self):
+        # ### sonrası ImGui kimliği: aynı başlıklı sekmeler çakışmaz
+        return f"{self.title}###backtest_{self.tab_id}"
+
+
+class MultiViewer:
+    """
+    Backtest sekmelerini yöneten görüntüleyici.
+
+    spool_dir: verilirse alt klasörlerdeki yayınlanmış oturumlar (manifest.json)
+    poll_interval saniyede bir taranır. storage: build_plotter_img_bundle_new'e
+    iletilir ("float64" veya "compact").
+    """
+
+    def __init__(self, spool_dir=None, poll_interval=0.5, storage="float64",
+                 window_title="AlgoTrade Backtests"):
+        self.spool_dir = spool_dir
+        self.poll_interval = poll_interval
+        self.storage = storage
+        self.window_title = window_title
+        self.tabs = []
+        # Thread-safe giriş kuyruğu: ("kwargs", dict) veya ("plotter", plotter, title)
+        self._queue = queue.Queue()
+        # OHLC anahtarı -> bar verisinin sahibi olan plotter
+        self._ohlc_owners = {}
+        self._seen_sessions = set()
+        self._last_poll = 0.0
+        self._next_tab_id = 0
+
+    # ------------------------------------------------------------------
+    # Giriş
+    # ------------------------------------------------------------------
+    def submit(self, **kwargs):
+        """
+        build_plotter_img_bundle_new parametreleriyle (title, periyot dahil) bir backtest
+        kuyruğa ekler. Herhangi bir thread'den çağrılabilir; kurulum arayüz thread'inde yapılır.
+        """
+        self._queue.put(("kwargs", kwargs))
+
+    def submit_plotter(self, plotter, title="Backtest"):
+        """Hazır kurulmuş bir plotter'ı yeni sekme olarak ekler (OHLC paylaşımı yapılmaz)."""
+        self._queue.put(("plotter", plotter, title))
+
+    def _poll_spool(self):
+        """Spool klasöründe yeni yayınlanmış oturumları kuyruğa ekler."""
+        if not self.spool_dir:
+            return
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval:
+            return
+        self._last_poll = now
+
+        try:
+            names = sorted(os.listdir(self.spool_dir))
+        except OSError:
+            return
+
+        for name in names:
+            session_dir = os.path.join(self.spool_dir, name)
+            if session_dir in self._seen_sessions:
+                continue
+            if not os.path.isfile(os.path.join(session_dir, MANIFEST_NAME)):
+                continue
+            self._seen_sessions.add(session_dir)
+            try:
+                self.submit(**load_session(session_dir))
+            except Exception as e:
+                print(f"❌ Oturum okunamadı ({session_dir}): {e}")
+
+    def _build_next(self):
+        """Kuyruktan bir backtest alır ve sekmesini kurar (kare başına en fazla bir tane)."""
+        try:
+            item = self._queue.get_nowait()
+        except queue.Empty:
+            return
+
+        try:
+            if item[0] == "plotter":
+                self._add_tab(item[2], item[1])
+                return
+
+            from plotDataImgBundleNew import build_plotter_img_bundle_new
+
+            kwargs = dict(item[1])
+            kwargs.pop("storage", None)
+            key = _ohlc_key(kwargs)
+            owner = self._ohlc_owners.get(key)
+            plotter = build_plotter_img_bundle_new(**kwargs, storage=self.storage, ohlc_from=owner)
+            if owner is None:
+                self._ohlc_owners[key] = plotter
+            else:
+                print(f"✓ OHLC verisi paylaşıldı: {kwargs.get('title')}")
+            self._add_tab(f"{kwargs.get('title', 'BTCUSDT')} {kwargs.get('periyot', '1H')}", plotter, key)
+        except Exception as e:
+            print(f"❌ Backtest sekmesi kurulamadı: {e}")
+            import traceback
+            traceback.print_exc()
+
+    def _add_tab(self, title, plotter, ohlc_key=None):
+        self.tabs.append(_Tab(self._next_tab_id, title, plotter, ohlc_key))
+        self._next_tab_id += 1
+
+    def _close_tab(self, tab):
+        """Sekmeyi kaldırır; bar verisinin sahibi kapanırsa sahiplik açık bir paylaşana geçer."""
+        self.tabs.remove(tab)
+        if tab.ohlc_key is None or self._ohlc_owners.get(tab.ohlc_key) is not tab.plotter:
+            return
+        for other in self.tabs:
+            if other.ohlc_key == tab.ohlc_key:
+                self._ohlc_owners[tab.ohlc_key] = other.plotter
+                return
+        del self._ohlc_owners[tab.ohlc_key]
+
+    # ------------------------------------------------------------------
+    # Çizim
+    # ------------------------------------------------------------------
+    def gui(self):
+        """Kare fonksiyonu: kuyruğu işler, sekmeleri çizer (yalnızca seçili sekme render edilir)."""
+        from imgui_bundle import imgui
+
+        self._poll_spool()
+        self._build_next()
+
+        if not self.tabs:
+            imgui.text_disabled("Backtest bekleniyor...")
+            if self.spool_dir:
+                imgui.text_disabled(f"Spool: {self.spool_dir}")
+            return
+
+        flags = imgui.TabBarFlags_.reorderable | imgui.TabBarFlags_.fitting_policy_scroll
+        if imgui.begin_tab_bar("##backtest_tabs", flags):
+            for tab in list(self.tabs):
+                selected, tab.open = imgui.begin_tab_item(tab.label, tab.open)
+                if selected:
+                    tab.plotter.Plot()
+                    imgui.end_tab_item()
+            imgui.end_tab_bar()
+
+        for tab in [t for t in self.tabs if not t.open]:
+            self._close_tab(tab)
+
+    def run(self, window_size=(1600, 1200), fps_idle=10.0):
+        """Pencereyi açar; kapanınca döner."""
+        from imgui_bundle import immapp
+
+        immapp.run(self.gui, with_implot=True, window_title=self.window_title,
+                   window_size=window_size, fps_idle=fps_idle)
+
+
+def publish_session(spool_dir, title="BTCUSDT", periyot="1H", strategy_indicators=None, **series):
+    """
+    Backtest'i spool klasörüne yeni bir oturum olarak yazar (bkz. imgui_viewer.write_session).
+    Çalışan MultiViewer oturumu bir sonraki taramada sekme olarak açar. Oturum klasörünü döndürür.
+    """
+    session_dir = os.path.join(spool_dir, f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex}")
+    write_session(session_dir, title=title, periyot=periyot,
+                  strategy_indicators=strategy_indicators, **series)
+    return session_dir
+
+
+def launch_multi_viewer(spool_dir, python_exe=None, extra_paths=None):
+    """Çok sekmeli görüntüleyiciyi ayrı bir süreçte başlatır ve beklemeden Popen nesnesini döndürür."""
+    env = dict(os.environ)
+    paths = [os.path.dirname(os.path.abspath(__file__))] + list(extra_paths or [])
+    if env.get("PYTHONPATH"):
+        paths.append(env["PYTHONPATH"])
+    env["PYTHONPATH"] = os.pathsep.join(paths)
+
+    return subprocess.Popen(
+        [python_exe or sys.executable, os.path.abspath(__file__), os.path.abspath(spool_dir)],
+        env=env,
+        close_fds=True,
+    )
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 1:
+        print("Kullanım: python imgui_multi_viewer.py <spool_dir>")
+        return 2
+
+    from plotDataImgBundleNew import IMPORTS_OK
+    if not IMPORTS_OK:
+        print("❌ DataPlotterImgBundle import edilemedi!")
+        return 1
+
+    spool_dir = argv[0]
+    os.makedirs(spool_dir, exist_ok=True)
+    print(f"=== imgui_multi_viewer: {spool_dir} ===")
+    MultiViewer(spool_dir).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
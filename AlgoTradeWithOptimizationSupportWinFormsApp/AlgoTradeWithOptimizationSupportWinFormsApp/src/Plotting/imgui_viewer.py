@@ -0,0 +1,184 @@
+"""
+imgui_viewer.py
+---------------
+DataPlotterImgBundleNew için bağımsız (out-of-process) görüntüleyici.
+
+Host (C# veya Python) backtest dizilerini bir oturum klasörüne .npy dosyaları
+olarak yazar, en son manifest.json'u yazar (sinyal) ve bu scripti ayrı bir
+süreç olarak başlatır. Görüntüleyici dizileri np.load(mmap_mode='r') ile
+belleğe eşler (kopya yok); host'un GIL'i veya UI thread'i bloklanmaz ve her
+backtest kendi penceresinde, yan yana açılabilir.
+
+Oturum klasörü:
+    <session_dir>/manifest.json
+        {"format": 1, "title": "...", "periyot": "...", "n_bars": N,
+         "series": {"dates": "dates.npy", "opens": "opens.npy", ...},
+         "indicators": {"MA(5)": "ind_0.npy", ...}}
+    <session_dir>/*.npy
+
+Not: multiprocessing.shared_memory yerine memory-mapped .npy dosyaları
+kullanılır; Windows'ta paylaşılan bellek bloğu son handle kapanınca yok olur,
+dosya ise host bir sonraki backtest'e geçse bile görüntüleyici açık kaldıkça
+geçerlidir ve C# tarafından ek bağımlılık olmadan yazılabilir.
+
+Kullanım:
+    python imgui_viewer.py <session_dir>
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+MANIFEST_NAME = "manifest.json"
+SESSION_FORMAT = 1
+
+# plot_data_img_bundle_new parametre sırası (zorunlu seriler)
+REQUIRED_SERIES = (
+    "dates", "opens", "highs", "lows", "closes", "volumes", "lots",
+    "sinyal_list", "kar_zarar_fiyat_list", "bakiye_fiyat_list",
+    "getiri_fiyat_list", "getiri_fiyat_net_list",
+)
+
+# Opsiyonel seriler (manifest'te yoksa None)
+OPTIONAL_SERIES = (
+    "bakiye_fiyat_net_list", "kar_zarar_fiyat_yuzde_list", "getiri_fiyat_yuzde_list",
+    "komisyon_fiyat_list", "getiri_fiyat_yuzde_net_list",
+)
+
+
+def _save_array(session_dir, file_name, values):
+    """Diziyi .npy olarak yazar (string tarih listeleri unicode dizi olarak saklanır)."""
+    arr = np.asarray(values)
+    if arr.dtype == object:
+        arr = arr.astype(str)
+    np.save(os.path.join(session_dir, file_name), arr, allow_pickle=False)
+    return file_name
+
+
+def write_session(session_dir, title="BTCUSDT", periyot="1H", strategy_indicators=None, **series):
+    """
+    Backtest dizilerini oturum klasörüne yazar ve manifest'i en son, atomik olarak yayınlar.
+
+    series anahtarları plot_data_img_bundle_new parametre adlarıdır (REQUIRED_SERIES,
+    OPTIONAL_SERIES). dates için epoch saniye (int64) dizisi önerilir.
+    Manifest yolunu döndürür.
+    """
+    missing = [name for name in REQUIRED_SERIES if series.get(name) is None]
+    if missing:
+        raise ValueError(f"Eksik seriler: {missing}")
+
+    os.makedirs(session_dir, exist_ok=True)
+
+    files = {}
+    for name in REQUIRED_SERIES + OPTIONAL_SERIES:
+        if series.get(name) is not None:
+            files[name] = _save_array(session_dir, f"{name}.npy", series[name])
+
+    indicators = {}
+    for i, (name, values) in enumerate((strategy_indicators or {}).items()):
+        if values is not None:
+            indicators[name] = _save_array(session_dir, f"ind_{i}.npy", values)
+
+    manifest = {
+        "format": SESSION_FORMAT,
+        "title": title,
+        "periyot": periyot,
+        "n_bars": int(len(np.asarray(series["closes"]))),
+        "series": files,
+        "indicators": indicators,
+    }
+
+    # Manifest en son yazılır: görüntüleyici için "veri hazır" sinyali
+    manifest_path = os.path.join(session_dir, MANIFEST_NAME)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, manifest_path)
+    return manifest_path
+
+
+def wait_for_session(session_dir, timeout=30.0, poll_interval=0.1):
+    """Manifest yayınlanana kadar bekler; süre dolarsa False döner."""
+    manifest_path = os.path.join(session_dir, MANIFEST_NAME)
+    deadline = time.monotonic() + timeout
+    while not os.path.isfile(manifest_path):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll_interval)
+    return True
+
+
+def load_session(session_dir):
+    """
+    Oturumu okur; dizileri memory-map ile (salt okunur, kopyasız) açar.
+
+    build_plotter_img_bundle_new'e doğrudan verilebilecek bir kwargs dict'i döndürür.
+    """
+    with open(os.path.join(session_dir, MANIFEST_NAME), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    if manifest.get("format") != SESSION_FORMAT:
+        raise ValueError(f"Desteklenmeyen oturum formatı: {manifest.get('format')}")
+
+    def _map(file_name):
+        return np.load(os.path.join(session_dir, file_name), mmap_mode="r", allow_pickle=False)
+
+    kwargs = {name: None for name in OPTIONAL_SERIES}
+    for name, file_name in manifest["series"].items():
+        kwargs[name] = _map(file_name)
+
+    kwargs["strategy_indicators"] = {
+        name: _map(file_name) for name, file_name in manifest.get("indicators", {}).items()
+    }
+    kwargs["title"] = manifest.get("title", "BTCUSDT")
+    kwargs["periyot"] = manifest.get("periyot", "1H")
+    return kwargs
+
+
+def launch_viewer(session_dir, python_exe=None, extra_paths=None):
+    """
+    Görüntüleyiciyi ayrı bir süreçte başlatır ve beklemeden Popen nesnesini döndürür.
+
+    extra_paths: görüntüleyicinin sys.path'ine eklenecek klasörler (örn. venv site-packages).
+    """
+    env = dict(os.environ)
+    paths = [os.path.dirname(os.path.abspath(__file__))] + list(extra_paths or [])
+    if env.get("PYTHONPATH"):
+        paths.append(env["PYTHONPATH"])
+    env["PYTHONPATH"] = os.pathsep.join(paths)
+
+    return subprocess.Popen(
+        [python_exe or sys.executable, os.path.abspath(__file__), os.path.abspath(session_dir)],
+        env=env,
+        close_fds=True,
+    )
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 1:
+        print("Kullanım: python imgui_viewer.py <session_dir>")
+        return 2
+
+    session_dir = argv[0]
+    if not wait_for_session(session_dir):
+        print(f"❌ Oturum bulunamadı: {session_dir}")
+        return 1
+
+    from plotDataImgBundleNew import IMPORTS_OK, build_plotter_img_bundle_new, run_plotter
+    if not IMPORTS_OK:
+        print("❌ DataPlotterImgBundle import edilemedi!")
+        return 1
+
+    kwargs = load_session(session_dir)
+    print(f"=== imgui_viewer: {kwargs['title']} {kwargs['periyot']} ({session_dir}) ===")
+    plotter = build_plotter_img_bundle_new(**kwargs)
+    return 0 if run_plotter(plotter, kwargs["title"], kwargs["periyot"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
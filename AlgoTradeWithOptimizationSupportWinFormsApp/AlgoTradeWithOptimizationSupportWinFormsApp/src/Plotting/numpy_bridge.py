@@ -0,0 +1,80 @@
+"""
+numpy_bridge.py
+---------------
+C# tarafından gelen dizileri kopyalamadan numpy array'e çevirir.
+
+Desteklenen girişler:
+    - numpy.ndarray                      -> olduğu gibi (dtype farklıysa dönüştürülür)
+    - buffer-protocol nesneleri          -> np.frombuffer (memoryview, bytes, bytearray, array.array)
+    - (address, length, dtype) tuple'ı   -> sabitlenmiş (pinned) bellek üzerinde np.frombuffer
+    - list / tuple / PyList              -> np.array (eski yol, fallback)
+
+Pointer yolu (C# tarafı):
+    var handle = GCHandle.Alloc(values, GCHandleType.Pinned);
+    (handle.AddrOfPinnedObject().ToInt64(), values.Length, "<f8")  -> Python'a gönderilir
+    Bellek, Python fonksiyonu dönene kadar sabit kalmalıdır (finally içinde handle.Free()).
+"""
+
+import ctypes
+import numpy as np
+
+
+def is_pointer_descriptor(obj) -> bool:
+    """(address, length, dtype) şeklinde ham bellek tanımı mı?"""
+    return (
+        isinstance(obj, tuple)
+        and len(obj) == 3
+        and isinstance(obj[0], int)
+        and isinstance(obj[1], int)
+        and isinstance(obj[2], str)
+    )
+
+
+def _from_pointer(address: int, length: int, dtype) -> np.ndarray:
+    """Ham bellek adresini kopyalamadan numpy array olarak sarar."""
+    dt = np.dtype(dtype)
+    if length <= 0:
+        return np.empty(0, dtype=dt)
+    if address == 0:
+        raise ValueError("Null pointer")
+    buffer = (ctypes.c_char * (length * dt.itemsize)).from_address(address)
+    return np.frombuffer(buffer, dtype=dt, count=length)
+
+
+def _from_buffer(obj):
+    """Buffer-protocol nesnesini kopyalamadan sarar (desteklenmiyorsa None)."""
+    if isinstance(obj, (list, tuple, str)):
+        return None
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return None
+    try:
+        return np.frombuffer(view, dtype=np.dtype(view.format)) if view.ndim == 1 else np.asarray(view)
+    except (TypeError, ValueError):
+        return None
+
+
+def as_numpy(obj, dtype=np.float64):
+    """
+    obj'yi 1 boyutlu numpy array'e çevirir; mümkünse kopya yapmaz.
+
+    dtype None ise kaynağın dtype'ı korunur. Kaynak dtype'ı farklıysa
+    (örn. C# long -> float64) tek bir numpy dönüşümü yapılır.
+    """
+    if obj is None:
+        return None
+
+    if isinstance(obj, np.ndarray):
+        arr = obj
+    elif is_pointer_descriptor(obj):
+        arr = _from_pointer(*obj)
+    else:
+        arr = _from_buffer(obj)
+        if arr is None:
+            # Fallback: Python listesi (eski PyList yolu)
+            return np.array(obj, dtype=dtype)
+
+    if dtype is not None and arr.dtype != np.dtype(dtype):
+        arr = arr.astype(dtype)
+    return arr
@@ -15,10 +15,12 @@ Kullanım (C# tarafından):
 import sys
 import numpy as np
 
+from numpy_bridge import as_numpy, is_pointer_descriptor
+
 # AlgoTradeWithPythonWithGemini'deki DataPlotterImgBundle'ı import et
 try:
     # sys.path zaten C# tarafında eklendi
-    from DataPlotterImgBundleNew import DataPlotterImgBundleNew, DataType
+    from DataPlotterImgBundleNew import DataPlotterImgBundleNew, DataType, LODMode
     from imgui_bundle import immapp
     IMPORTS_OK = True
 except ImportError as e:
@@ -27,6 +29,215 @@ except ImportError as e:
     IMPORTS_OK = False
 
 
+def build_plotter_img_bundle_new(
+    dates, opens, highs, lows, closes, volumes, lots,
+    sinyal_list, kar_zarar_fiyat_list, bakiye_fiyat_list,
+    getiri_fiyat_list, getiri_fiyat_net_list,
+    bakiye_fiyat_net_list=None,
+    kar_zarar_fiyat_yuzde_list=None,
+    getiri_fiyat_yuzde_list=None,
+    komisyon_fiyat_list=None,
+    getiri_fiyat_yuzde_net_list=None,
+    strategy_indicators=None,
+    title="BTCUSDT",
+    periyot="1H",
+    storage="float64",
+    ohlc_from=None
+) -> "DataPlotterImgBundleNew":
+    """
+    plot_data_img_bundle_new ile aynı parametrelerden paneller kurulmuş bir
+    DataPlotterImgBundleNew oluşturur, pencereyi açmaz (bkz. run_plotter).
+    Bağımsız görüntüleyici (imgui_viewer.py) da bu fonksiyonu kullanır.
+    storage: "float64" veya "compact" (float32 fiyat/seri, int8 sinyal, int64 volume/lot;
+    yaklaşık yarı bellek, bkz. DataPlotterImgBundleNew.setStorageDtypes).
+    ohlc_from: aynı bar verisiyle kurulmuş başka bir plotter; verilirse OHLC, zaman,
+    tarih, volume ve lot onunla paylaşılır (kopya yok, bkz. shareOHLCFrom) ve
+    dates/opens/.../lots yalnızca bar sayısı için kullanılır.
+    Hata durumunda exception fırlatır.
+    """
+    # Saklama dtype'ları: diziler as_numpy ile doğrudan hedef dtype'a çevrilir (tek dönüşüm)
+    plotter = DataPlotterImgBundleNew()
+    plotter.setStorageDtypes(storage)
+    dtypes = plotter.storage_dtypes
+
+    # Tarihler: epoch/datetime64 dizisi kopyasız okunur, string listesi olduğu gibi kalır
+    if is_pointer_descriptor(dates):
+        dates = as_numpy(dates, dtype=np.int64)
+    print(f"Bar sayısı: {len(dates)}")
+
+    # Numpy array'e çevir (ndarray/buffer/pointer ise kopyasız, liste ise np.array)
+    if ohlc_from is None:
+        opens = as_numpy(opens, dtype=dtypes["price"])
+        highs = as_numpy(highs, dtype=dtypes["price"])
+        lows = as_numpy(lows, dtype=dtypes["price"])
+        closes = as_numpy(closes, dtype=dtypes["price"])
+        volumes = as_numpy(volumes, dtype=dtypes["volume"])
+        lots = as_numpy(lots, dtype=dtypes["volume"])
+    sinyal_list = as_numpy(sinyal_list, dtype=dtypes["signal"])
+    kar_zarar_fiyat_list = as_numpy(kar_zarar_fiyat_list, dtype=dtypes["series"])
+    bakiye_fiyat_list = as_numpy(bakiye_fiyat_list, dtype=dtypes["series"])
+    getiri_fiyat_list = as_numpy(getiri_fiyat_list, dtype=dtypes["series"])
+    getiri_fiyat_net_list = as_numpy(getiri_fiyat_net_list, dtype=dtypes["series"])
+
+    # Time data (bar indices)
+    n_bars = len(dates)
+    time_data = np.arange(n_bars, dtype=np.float64)
+
+    print(f"✓ DataPlotterImgBundleNew created successfully (storage: {storage})")
+
+    # Temel verileri ayarla
+    if ohlc_from is not None:
+        # Aynı bar verisi: tampon, LOD piramidi ve Y-aralık indeksi diğer plotter ile ortak
+        plotter.shareOHLCFrom(ohlc_from)
+    else:
+        plotter.setTimeData(time_data)
+        # OHLC tek kopya: sütunlar plotter'ın (4, N) tamponuna bir kez yazılır, paneller salt okunur görünüm kullanır
+        plotter.setOHLCColumns(opens, highs, lows, closes)
+        plotter.setVolumeData(volumes)
+        plotter.setLotData(lots)
+        plotter.setDateTimeLabels(dates)
+    plotter.setTradeSignals(sinyal_list)
+    plotter.setWindowTitle(f"{title} {periyot} - Multi Panel Chart")
+
+    # Window özellikleri
+    plotter.setEnableVerticalScrollBar(False)
+    plotter.setEnableSharedCrossHair(True)
+    plotter.setEnableSharedXAxis(True)
+    plotter.setShowInfoOnAllPanels(True)
+    plotter.setShowTradeSignals(True)
+    plotter.setEnableRangeSlider(True)
+
+    # Height ratios (AlgoTrader.py'den)
+    # Panel 0: Price Chart (1.5 = %35), Panel 1: Signals (0.7 = %16),
+    # Panel 2: PnL (0.7 = %16), Panel 3: Balance (0.7 = %16), Panel 4: Volume (1.0 = %23)
+    HeightRatioList = [1.5, 1.0, 1.5, 1.0, 1.0]
+
+    # ==============================================================================
+    # Panel 0: Price Chart (OHLC + Indicators)
+    # ==============================================================================
+    panel0 = plotter.AddPanel(0)
+    panel0.setTitle("Price Chart")
+    panel0.setYAxisLabel("Price")
+    panel0.setHeightRatio(HeightRatioList[0])
+    panel0.setOHLCData(plotter.getOHLCData())  # OHLC verilerini panel'e ekle
+    panel0.setInfoPanelPosition(100, 2)
+    panel0.setInfoPanelOffsets(label_dx=5, value_dx=80)
+
+    # Indicators eklenebilir (MA5, MA21, etc.)
+    # panel0.setData(0, DataType.Line, ma5, "MA(5)", (1.0, 0.5, 0.0, 1.0))
+
+    # ==============================================================================
+    # Panel 1: Trade Signals
+    # ==============================================================================
+    panel1 = plotter.AddPanel(1)
+    panel1.setTitle("Trade Signals")
+    panel1.setYAxisLabel("Signals")
+    panel1.setHeightRatio(HeightRatioList[1])
+    panel1.setInfoPanelPosition(120, 2)
+    panel1.setInfoPanelOffsets(label_dx=5, value_dx=80)
+
+    panel1.setData(0, DataType.Stairs, sinyal_list, "Signals", (0.2, 0.8, 1.0, 1.0))  # Cyan
+
+    # Padding (autoscale hack)
+    padding_min = np.full(n_bars, -2.0, dtype=dtypes["series"])
+    padding_max = np.full(n_bars, +2.0, dtype=dtypes["series"])
+    panel1.setData(998, DataType.Line, padding_min, "##pad_min", (1, 1, 1, 0))
+    panel1.setData(999, DataType.Line, padding_max, "##pad_max", (1, 1, 1, 0))
+
+    # ==============================================================================
+    # Panel 2: PnL (Kar/Zarar)
+    # ==============================================================================
+    panel2 = plotter.AddPanel(2)
+    panel2.setTitle("PnL")
+    panel2.setYAxisLabel("Kar/Zarar Fiyat")
+    panel2.setHeightRatio(HeightRatioList[2])
+    panel2.setInfoPanelPosition(100, 2)
+    panel2.setInfoPanelOffsets(label_dx=5, value_dx=80)
+
+    # M4 LOD: kar/zarar ve bakiye eğrilerinde tepe/dip noktaları birebir korunur
+    panel2.setData(0, DataType.Line, kar_zarar_fiyat_list, "PnL", (1.0, 1.0, 0.0, 1.0), lod_mode=LODMode.M4)  # Sarı
+
+    # ==============================================================================
+    # Panel 3: Balance (Bakiye/Getiri)
+    # ==============================================================================
+    panel3 = plotter.AddPanel(3)
+    panel3.setTitle("Balance")
+    panel3.setYAxisLabel("Getiri")
+    panel3.setHeightRatio(HeightRatioList[3])
+    panel3.setInfoPanelPosition(100, 2)
+    panel3.setInfoPanelOffsets(label_dx=5, value_dx=80)
+
+    panel3.setData(0, DataType.Line, getiri_fiyat_list, "Balance", (0.0, 0.5, 1.0, 1.0), lod_mode=LODMode.M4)  # Mavi
+    panel3.setData(1, DataType.Line, getiri_fiyat_net_list, "Net Balance", (1.0, 1.0, 0.0, 1.0), lod_mode=LODMode.M4)  # Sarı
+
+    # ==============================================================================
+    # Panel 4: Strategy Indicators (Dinamik)
+    # ==============================================================================
+    if strategy_indicators is not None and len(strategy_indicators) > 0:
+        panel4 = plotter.AddPanel(4)
+        panel4.setTitle("Strategy Indicators")
+        panel4.setYAxisLabel("Value")
+        panel4.setHeightRatio(HeightRatioList[4])
+        panel4.setInfoPanelPosition(100, 2)
+        panel4.setInfoPanelOffsets(label_dx=5, value_dx=80)
+
+        # Her indicator için farklı renk
+        colors = [
+            (1.0, 1.0, 0.0, 1.0),  # Sarı
+            (0.2, 0.8, 1.0, 1.0),  # Cyan
+            (1.0, 0.5, 0.0, 1.0),  # Turuncu
+            (0.5, 1.0, 0.5, 1.0),  # Açık yeşil
+            (1.0, 0.2, 0.8, 1.0),  # Pembe
+            (0.5, 0.5, 1.0, 1.0),  # Açık mavi
+        ]
+
+        data_idx = 0
+        for indicator_name, indicator_values in strategy_indicators.items():
+            if indicator_values is not None:
+                indicator_arr = as_numpy(indicator_values, dtype=dtypes["series"])
+                color = colors[data_idx % len(colors)]
+                panel4.setData(data_idx, DataType.Line, indicator_arr, indicator_name, color)
+                print(f"✓ Indicator '{indicator_name}' plot edildi ({len(indicator_arr)} değer)")
+                data_idx += 1
+
+    # ==============================================================================
+    # Y-axis sync (optional)
+    # ==============================================================================
+    groupId = 0
+    plotter.RegisterYSyncGroup(groupId, panel0)
+    # plotter.RegisterYSyncGroup(groupId, panel2)
+
+    # ==============================================================================
+    # Özet
+    print(f"\n✓ {len(plotter.panels)} panel oluşturuldu")
+    for idx in sorted(plotter.panels.keys()):
+        panel = plotter.panels[idx]
+        print(f"  Panel {idx}: {panel.title} ({len(panel.data_items)} data series)")
+
+    return plotter
+
+
+def run_plotter(plotter, title="BTCUSDT", periyot="1H", window_size=(1600, 1200)):
+    """Kurulmuş plotter için ImGui penceresini açar; pencere kapanınca döner."""
+    print("\n🚀 ImGui window açılıyor...")
+    print(f"📊 Window title: {title} {periyot} - Multi Panel Chart")
+    print(f"📊 Window size: {window_size[0]}x{window_size[1]}")
+    print(f"📊 ImPlot enabled: True")
+    print(f"📊 Idle FPS: {plotter.fps_idle}")
+
+    try:
+        # ImGui window'u aç
+        immapp.run(plotter.Plot, with_implot=True, window_size=window_size,
+                   fps_idle=plotter.fps_idle)
+        print("✓ immapp.run() completed successfully")
+    except Exception as e:
+        print(f"❌ immapp.run() error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    return True
+
+
 def plot_data_img_bundle_new(
     dates, opens, highs, lows, closes, volumes, lots,
     sinyal_list, kar_zarar_fiyat_list, bakiye_fiyat_list,
@@ -38,7 +249,8 @@ def plot_data_img_bundle_new(
     getiri_fiyat_yuzde_net_list=None,
     strategy_indicators=None,
     title="BTCUSDT",
-    periyot="1H"
+    periyot="1H",
+    storage="float64"
 ):
     """
     C# tarafından gelen verileri ImGui/ImPlot ile çizdirir.
@@ -46,10 +258,14 @@ def plot_data_img_bundle_new(
 
     Parameters:
     -----------
-    dates : list of str
-        Tarih listesi ["YYYY.MM.DD HH:MM:SS", ...]
-    opens, highs, lows, closes : list of float
-        OHLC verileri
+    dates : list of str, int64 epoch saniye dizisi veya datetime64 dizisi
+        Tarih listesi ["YYYY.MM.DD HH:MM:SS", ...] ya da epoch saniyeleri
+        (ndarray veya (address, length, "<i8") pointer tanımı). Epoch verildiğinde
+        etiketler yalnızca görünen tick'ler ve crosshair için formatlanır (UTC).
+    opens, highs, lows, closes : list of float, ndarray, buffer veya (address, length, dtype)
+        OHLC verileri. Sayısal dizilerin hepsi numpy_bridge.as_numpy ile kopyasız
+        okunur; C# sabitlenmiş (pinned) dizilerin adresini gönderebilir, liste yolu
+        fallback olarak çalışır.
     volumes : list of long
         Volume verileri
     lots : list of long
@@ -68,6 +284,8 @@ def plot_data_img_bundle_new(
         Grafik başlığı
     periyot : str
         Periyot bilgisi
+    storage : str
+        "float64" (varsayılan) veya "compact" (float32/int8/int64 saklama, yaklaşık yarı bellek)
 
     Returns:
     --------
@@ -81,168 +299,24 @@ def plot_data_img_bundle_new(
 
     print("=== plot_data_img_bundle_new BAŞLADI ===")
     print(f"Grafik: {title} {periyot}")
-    print(f"Bar sayısı: {len(dates)}")
 
     try:
-        # Numpy array'e çevir
-        opens = np.array(opens, dtype=np.float64)
-        highs = np.array(highs, dtype=np.float64)
-        lows = np.array(lows, dtype=np.float64)
-        closes = np.array(closes, dtype=np.float64)
-        volumes = np.array(volumes, dtype=np.float64)
-        sinyal_list = np.array(sinyal_list, dtype=np.float64)
-        kar_zarar_fiyat_list = np.array(kar_zarar_fiyat_list, dtype=np.float64)
-        bakiye_fiyat_list = np.array(bakiye_fiyat_list, dtype=np.float64)
-        getiri_fiyat_list = np.array(getiri_fiyat_list, dtype=np.float64)
-        getiri_fiyat_net_list = np.array(getiri_fiyat_net_list, dtype=np.float64)
-
-        # OHLC array oluştur (N, 4)
-        ohlc = np.column_stack([opens, highs, lows, closes])
-
-        # Time data (bar indices)
-        n_bars = len(dates)
-        time_data = np.arange(n_bars, dtype=np.float64)
-
-        # DataPlotterImgBundle oluştur
-        plotter = DataPlotterImgBundleNew()
-        print(f"✓ DataPlotterImgBundleNew created successfully")
-
-        # Temel verileri ayarla
-        plotter.setTimeData(time_data)
-        plotter.setOHLCData(ohlc)  # OHLC array'i gönder
-        plotter.setVolumeData(volumes)
-        plotter.setLotData(np.array(lots, dtype=np.float64))
-        plotter.setDateTimeLabels(dates)
-        plotter.setTradeSignals(sinyal_list)
-        plotter.setWindowTitle(f"{title} {periyot} - Multi Panel Chart")
-
-        # Window özellikleri
-        plotter.setEnableVerticalScrollBar(False)
-        plotter.setEnableSharedCrossHair(True)
-        plotter.setEnableSharedXAxis(True)
-        plotter.setShowInfoOnAllPanels(True)
-        plotter.setShowTradeSignals(True)
-        plotter.setEnableRangeSlider(True)
-
-        # Height ratios (AlgoTrader.py'den)
-        # Panel 0: Price Chart (1.5 = %35), Panel 1: Signals (0.7 = %16),
-        # Panel 2: PnL (0.7 = %16), Panel 3: Balance (0.7 = %16), Panel 4: Volume (1.0 = %23)
-        HeightRatioList = [1.5, 1.0, 1.5, 1.0, 1.0]
-
-        # ==============================================================================
-        # Panel 0: Price Chart (OHLC + Indicators)
-        # ==============================================================================
-        panel0 = plotter.AddPanel(0)
-        panel0.setTitle("Price Chart")
-        panel0.setYAxisLabel("Price")
-        panel0.setHeightRatio(HeightRatioList[0])
-        panel0.setOHLCData(plotter.getOHLCData())  # OHLC verilerini panel'e ekle
-        panel0.setInfoPanelPosition(100, 2)
-        panel0.setInfoPanelOffsets(label_dx=5, value_dx=80)
-
-        # Indicators eklenebilir (MA5, MA21, etc.)
-        # panel0.setData(0, DataType.Line, ma5, "MA(5)", (1.0, 0.5, 0.0, 1.0))
-
-        # ==============================================================================
-        # Panel 1: Trade Signals
-        # ==============================================================================
-        panel1 = plotter.AddPanel(1)
-        panel1.setTitle("Trade Signals")
-        panel1.setYAxisLabel("Signals")
-        panel1.setHeightRatio(HeightRatioList[1])
-        panel1.setInfoPanelPosition(120, 2)
-        panel1.setInfoPanelOffsets(label_dx=5, value_dx=80)
-
-        panel1.setData(0, DataType.Stairs, sinyal_list, "Signals", (0.2, 0.8, 1.0, 1.0))  # Cyan
-
-        # Padding (autoscale hack)
-        padding_min = np.full(n_bars, -2.0, dtype=np.float64)
-        padding_max = np.full(n_bars, +2.0, dtype=np.float64)
-        panel1.setData(998, DataType.Line, padding_min, "##pad_min", (1, 1, 1, 0))
-        panel1.setData(999, DataType.Line, padding_max, "##pad_max", (1, 1, 1, 0))
-
-        # ==============================================================================
-        # Panel 2: PnL (Kar/Zarar)
-        # ==============================================================================
-        panel2 = plotter.AddPanel(2)
-        panel2.setTitle("PnL")
-        panel2.setYAxisLabel("Kar/Zarar Fiyat")
-        panel2.setHeightRatio(HeightRatioList[2])
-        panel2.setInfoPanelPosition(100, 2)
-        panel2.setInfoPanelOffsets(label_dx=5, value_dx=80)
-
-        panel2.setData(0, DataType.Line, kar_zarar_fiyat_list, "PnL", (1.0, 1.0, 0.0, 1.0))  # Sarı
-
-        # ==============================================================================
-        # Panel 3: Balance (Bakiye/Getiri)
-        # ==============================================================================
-        panel3 = plotter.AddPanel(3)
-        panel3.setTitle("Balance")
-        panel3.setYAxisLabel("Getiri")
-        panel3.setHeightRatio(HeightRatioList[3])
-        panel3.setInfoPanelPosition(100, 2)
-        panel3.setInfoPanelOffsets(label_dx=5, value_dx=80)
-
-        panel3.setData(0, DataType.Line, getiri_fiyat_list, "Balance", (0.0, 0.5, 1.0, 1.0))  # Mavi
-        panel3.setData(1, DataType.Line, getiri_fiyat_net_list, "Net Balance", (1.0, 1.0, 0.0, 1.0))  # Sarı
-
-        # ==============================================================================
-        # Panel 4: Strategy Indicators (Dinamik)
-        # ==============================================================================
-        if strategy_indicators is not None and len(strategy_indicators) > 0:
-            panel4 = plotter.AddPanel(4)
-            panel4.setTitle("Strategy Indicators")
-            panel4.setYAxisLabel("Value")
-            panel4.setHeightRatio(HeightRatioList[4])
-            panel4.setInfoPanelPosition(100, 2)
-            panel4.setInfoPanelOffsets(label_dx=5, value_dx=80)
-
-            # Her indicator için farklı renk
-            colors = [
-                (1.0, 1.0, 0.0, 1.0),  # Sarı
-                (0.2, 0.8, 1.0, 1.0),  # Cyan
-                (1.0, 0.5, 0.0, 1.0),  # Turuncu
-                (0.5, 1.0, 0.5, 1.0),  # Açık yeşil
-                (1.0, 0.2, 0.8, 1.0),  # Pembe
-                (0.5, 0.5, 1.0, 1.0),  # Açık mavi
-            ]
-
-            data_idx = 0
-            for indicator_name, indicator_values in strategy_indicators.items():
-                if indicator_values is not None:
-                    indicator_arr = np.array(indicator_values, dtype=np.float64)
-                    color = colors[data_idx % len(colors)]
-                    panel4.setData(data_idx, DataType.Line, indicator_arr, indicator_name, color)
-                    print(f"✓ Indicator '{indicator_name}' plot edildi ({len(indicator_arr)} değer)")
-                    data_idx += 1
-
-        # ==============================================================================
-        # Y-axis sync (optional)
-        # ==============================================================================
-        groupId = 0
-        plotter.RegisterYSyncGroup(groupId, panel0)
-        # plotter.RegisterYSyncGroup(groupId, panel2)
-
-        # ==============================================================================
-        # Grafiği göster
-        print(f"\n✓ {len(plotter.panels)} panel oluşturuldu")
-        for idx in sorted(plotter.panels.keys()):
-            panel = plotter.panels[idx]
-            print(f"  Panel {idx}: {panel.title} ({len(panel.data_items)} data series)")
-
-        print("\n🚀 ImGui window açılıyor...")
-        print(f"📊 Window title: {title} {periyot} - Multi Panel Chart")
-        print(f"📊 Window size: 1600x1200")
-        print(f"📊 ImPlot enabled: True")
-
-        try:
-            # ImGui window'u aç
-            immapp.run(plotter.Plot, with_implot=True, window_size=(1600, 1200))
-            print("✓ immapp.run() completed successfully")
-        except Exception as e:
-            print(f"❌ immapp.run() error: {e}")
-            import traceback
-            traceback.print_exc()
+        plotter = build_plotter_img_bundle_new(
+            dates, opens, highs, lows, closes, volumes, lots,
+            sinyal_list, kar_zarar_fiyat_list, bakiye_fiyat_list,
+            getiri_fiyat_list, getiri_fiyat_net_list,
+            bakiye_fiyat_net_list=bakiye_fiyat_net_list,
+            kar_zarar_fiyat_yuzde_list=kar_zarar_fiyat_yuzde_list,
+            getiri_fiyat_yuzde_list=getiri_fiyat_yuzde_list,
+            komisyon_fiyat_list=komisyon_fiyat_list,
+            getiri_fiyat_yuzde_net_list=getiri_fiyat_yuzde_net_list,
+            strategy_indicators=strategy_indicators,
+            title=title,
+            periyot=periyot,
+            storage=storage,
+        )
+
+        if not run_plotter(plotter, title, periyot):
             return False
 
         print("✓ plot_data_img_bundle_new TAMAMLANDI")
@@ -255,11 +329,67 @@ def plot_data_img_bundle_new(
         return False
 
 
+def build_equity_overlay_plotter(
+    bakiye_matrix, dates=None, mode="bands", top_k=5, scores=None,
+    title="Optimizasyon", periyot="1H"
+) -> "DataPlotterImgBundleNew":
+    """
+    Optimizasyon koşularının bakiye eğrilerini (runs x bars matris, örn. her
+    kombinasyonun BakiyeFiyatList'i) tek panelde gösteren bir plotter kurar.
+    bakiye_matrix memory-mapped olabilir (np.load(mmap_mode='r')); kopyalanmaz,
+    LOD bucket başına yüzdelik özeti bir kez çıkarılır (bkz. Panel.setEquityCurves).
+    mode: "bands" (p5/p50/p95) veya "heatmap" (yoğunluk); en iyi top_k koşu
+    (scores, varsayılan son bakiye) ayrıca çizilir.
+    """
+    if not isinstance(bakiye_matrix, np.ndarray):
+        bakiye_matrix = np.asarray(bakiye_matrix, dtype=np.float64)
+    n_runs, n_bars = bakiye_matrix.shape
+    print(f"Koşu sayısı: {n_runs}, bar sayısı: {n_bars}")
+
+    plotter = DataPlotterImgBundleNew()
+    plotter.setTimeData(np.arange(n_bars, dtype=np.float64))
+    if dates is not None:
+        if is_pointer_descriptor(dates):
+            dates = as_numpy(dates, dtype=np.int64)
+        plotter.setDateTimeLabels(dates)
+    plotter.setWindowTitle(f"{title} {periyot} - Equity Overlay ({n_runs} koşu)")
+    plotter.setEnableSharedCrossHair(True)
+    plotter.setShowInfoOnAllPanels(True)
+
+    panel0 = plotter.AddPanel(0)
+    panel0.setTitle(f"Bakiye ({n_runs} koşu)")
+    panel0.setYAxisLabel("Bakiye")
+    panel0.setInfoPanelPosition(100, 2)
+    panel0.setInfoPanelOffsets(label_dx=5, value_dx=110)
+    panel0.setEquityCurves(0, bakiye_matrix, "Bakiye", (0.0, 0.5, 1.0, 1.0), mode=mode,
+                           top_k=top_k, scores=scores, lod_mode=LODMode.M4)
+    print(f"✓ Equity overlay hazır (mode: {mode}, top {top_k})")
+    return plotter
+
+
+def plot_equity_overlay_img_bundle_new(bakiye_matrix, dates=None, mode="bands", top_k=5, scores=None,
+                                       title="Optimizasyon", periyot="1H"):
+    """build_equity_overlay_plotter ile kurar ve pencereyi açar; başarılıysa True döner."""
+    if not IMPORTS_OK:
+        print("❌ DataPlotterImgBundle import edilemedi!")
+        return False
+    try:
+        plotter = build_equity_overlay_plotter(bakiye_matrix, dates, mode=mode, top_k=top_k,
+                                               scores=scores, title=title, periyot=periyot)
+        return run_plotter(plotter, title, periyot)
+    except Exception as e:
+        print(f"❌ Equity overlay error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 if __name__ == "__main__":
     # Standalone test
     print("plotDataImgBundleNew.py loaded successfully!")
     print("Available functions:")
     print("  - plot_data_img_bundle_new(...)")
+    print("  - plot_equity_overlay_img_bundle_new(bakiye_matrix, ...)")
     print("\nREQUIRED:")
     print("  - pip install imgui-bundle")
     print("  - AlgoTradeWithPythonWithGemini venv in sys.path")
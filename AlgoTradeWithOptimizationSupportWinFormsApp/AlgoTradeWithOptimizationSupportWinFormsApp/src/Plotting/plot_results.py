@@ -7,6 +7,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 from datetime import datetime
 
+from numpy_bridge import as_numpy
+
 
 def plot_trading_results(data):
     """
@@ -24,6 +26,8 @@ def plot_trading_results(data):
             'pnl': list of float (cumulative),
             'ema_fast': list of float (optional),
             'ema_slow': list of float (optional),
+            (prices/balance/pnl/ema_* liste, ndarray, buffer veya
+             (address, length, dtype) pointer tanımı olabilir, bkz. numpy_bridge)
             'fast_period': int (optional),
             'slow_period': int (optional),
             'save_path': str (optional)
@@ -37,6 +41,11 @@ def plot_trading_results(data):
         # Tarihleri parse et
         dates = [datetime.fromisoformat(d) for d in data['dates']]
 
+        # Sayısal serileri numpy'a çevir (pointer/buffer ise kopyasız)
+        prices = as_numpy(data['prices'])
+        ema_fast = as_numpy(data.get('ema_fast'))
+        ema_slow = as_numpy(data.get('ema_slow'))
+
         # 3 panel oluştur
         fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(16, 12))
         fig.suptitle('AlgoTrade Backtest Sonuçları', fontsize=16, fontweight='bold')
@@ -44,16 +53,16 @@ def plot_trading_results(data):
         # ============================================================
         # PANEL 1: Fiyat + EMA'lar + Al/Sat Sinyalleri
         # ============================================================
-        ax1.plot(dates, data['prices'], label='Fiyat', color='black', linewidth=1.5, alpha=0.8)
+        ax1.plot(dates, prices, label='Fiyat', color='black', linewidth=1.5, alpha=0.8)
 
         # EMA'ları çiz (varsa)
-        if data.get('ema_fast') and len(data['ema_fast']) > 0:
-            ax1.plot(dates, data['ema_fast'],
+        if ema_fast is not None and len(ema_fast) > 0:
+            ax1.plot(dates, ema_fast,
                     label=f"EMA({data.get('fast_period', 'N/A')})",
                     color='blue', linewidth=1.2, alpha=0.7)
 
-        if data.get('ema_slow') and len(data['ema_slow']) > 0:
-            ax1.plot(dates, data['ema_slow'],
+        if ema_slow is not None and len(ema_slow) > 0:
+            ax1.plot(dates, ema_slow,
                     label=f"EMA({data.get('slow_period', 'N/A')})",
                     color='red', linewidth=1.2, alpha=0.7)
 
@@ -85,15 +94,15 @@ def plot_trading_results(data):
         # ============================================================
         # PANEL 2: Bakiye Eğrisi
         # ============================================================
-        balance = data['balance']
-        initial_balance = balance[0] if balance else 100000
+        balance = as_numpy(data['balance'])
+        initial_balance = balance[0] if len(balance) > 0 else 100000
 
         ax2.plot(dates, balance, label='Bakiye', color='darkgreen', linewidth=2)
         ax2.axhline(y=initial_balance, color='gray', linestyle='--',
                     linewidth=1, label=f'İlk Bakiye ({initial_balance:,.0f})')
 
         # Bakiye değişimi (%)
-        if balance:
+        if len(balance) > 0:
             final_balance = balance[-1]
             balance_change_pct = ((final_balance - initial_balance) / initial_balance) * 100
             color = 'green' if balance_change_pct >= 0 else 'red'
@@ -110,8 +119,8 @@ def plot_trading_results(data):
         # ============================================================
         # PANEL 3: Kümülatif Kar/Zarar
         # ============================================================
-        pnl = data['pnl']
-        pnl_array = np.array(pnl)
+        pnl = as_numpy(data['pnl'])
+        pnl_array = pnl
 
         ax3.plot(dates, pnl, label='Kümülatif Kar/Zarar', color='steelblue', linewidth=2)
         ax3.axhline(y=0, color='black', linestyle='-', linewidth=1.5, alpha=0.5)
@@ -125,9 +134,9 @@ def plot_trading_results(data):
                          color='red', alpha=0.2, label='Zarar Bölgesi', interpolate=True)
 
         # İstatistikler
-        if pnl:
-            max_profit = max(pnl)
-            max_loss = min(pnl)
+        if len(pnl) > 0:
+            max_profit = float(np.max(pnl))
+            max_loss = float(np.min(pnl))
             final_pnl = pnl[-1]
 
             stats_text = f'Son Kar/Zarar: {final_pnl:+,.2f}\n'
@@ -172,7 +181,7 @@ def plot_equity_curve_with_drawdown(balance_list, dates):
 
     Parameters:
     -----------
-    balance_list : list of float
+    balance_list : list of float, ndarray, buffer veya (address, length, dtype)
     dates : list of str (ISO format)
 
     Returns:
@@ -183,7 +192,7 @@ def plot_equity_curve_with_drawdown(balance_list, dates):
         dates_parsed = [datetime.fromisoformat(d) for d in dates]
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), sharex=True)
 
-        balance = np.array(balance_list)
+        balance = as_numpy(balance_list)
         peak = np.maximum.accumulate(balance)
         drawdown = ((balance - peak) / peak) * 100  # %
 